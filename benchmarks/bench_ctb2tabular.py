@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+'''
+Benchmark the conversion of fetched result tables to DataFrames
+
+The table data is generated locally in the form returned by the REST
+interface, so no CAS server is required.
+
+Usage: python benchmarks/bench_ctb2tabular.py [nrows]
+
+'''
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import copy
+import sys
+import time
+import numpy as np
+import swat
+from swat.cas.rest.table import REST_CASTable
+from swat.cas.transformers import ctb2tabular
+from swat.dataframe import SASDataFrame
+
+
+def make_table(nrows):
+    ''' Create a REST table object with `nrows` rows '''
+    schema = [dict(name='Num%d' % i, type='double', width=8) for i in range(6)]
+    schema += [dict(name='Int%d' % i, type='int', width=8) for i in range(2)]
+    schema += [dict(name='Str%d' % i, type='varchar', width=1024) for i in range(2)]
+    rng = np.random.RandomState(1)
+    nums = rng.rand(nrows, 6).tolist()
+    ints = rng.randint(0, 10000, size=(nrows, 2)).tolist()
+    rows = [n + i + ['value %d' % j, 'category %d' % (j % 7)]
+            for j, (n, i) in enumerate(zip(nums, ints))]
+    return dict(name='Fetch', attributes={}, schema=schema, rows=rows)
+
+
+def legacy_ctb2tabular(_sw_table):
+    ''' Row-oriented conversion through a NumPy record array '''
+    types = {'double': 'f8', 'int64': 'i8', 'varchar': '|U%d'}
+    dtypes = []
+    for i in range(_sw_table.getNColumns()):
+        dtype = types[_sw_table.getColumnType(i)]
+        if dtype.startswith('|U'):
+            dtype = dtype % _sw_table.getColumnWidth(i)
+        dtypes.append((_sw_table.getColumnName(i), dtype))
+    data = np.array(_sw_table.toTuples('strict', None, None, None), dtype=dtypes)
+    return SASDataFrame(data)
+
+
+def timeit(func, obj, repeat=3):
+    ''' Return the best time of `repeat` calls '''
+    best = None
+    for i in range(repeat):
+        tbl = REST_CASTable(copy.deepcopy(obj))
+        start = time.time()
+        func(tbl)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(nrows=200000):
+    swat.options.cas.dataset.index_name = None
+    obj = make_table(nrows)
+    legacy = timeit(legacy_ctb2tabular, obj)
+    columnar = timeit(ctb2tabular, obj)
+    print('rows: %d' % nrows)
+    print('record array: %.3fs' % legacy)
+    print('columnar:     %.3fs' % columnar)
+    print('speedup:      %.1fx' % (legacy / columnar))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+'''
+Benchmark the JSON decoders of the REST interface
+
+The response bodies of table.fetch and builtins.reflect are generated
+locally in the form returned by the REST interface, so no CAS server
+is required.  Codecs whose packages are not installed are skipped.
+
+Usage: python benchmarks/bench_json_codecs.py [nrows] [nactions]
+
+'''
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import json
+import sys
+import time
+import numpy as np
+from swat.cas.rest.codec import CODECS, load_codec
+
+
+def make_fetch(nrows):
+    ''' Create the response body of a table.fetch call with `nrows` rows '''
+    schema = [dict(name='Num%d' % i, label='', type='double', width=8,
+                   format='', attributes={}) for i in range(6)]
+    schema += [dict(name='Int%d' % i, label='', type='int64', width=8,
+                    format='', attributes={}) for i in range(2)]
+    schema += [dict(name='Str%d' % i, label='', type='varchar', width=1024,
+                    format='', attributes={}) for i in range(2)]
+    rng = np.random.RandomState(1)
+    nums = rng.rand(nrows, 6).tolist()
+    ints = rng.randint(0, 10000, size=(nrows, 2)).tolist()
+    rows = [n + i + ['value %d' % j, 'category %d' % (j % 7)]
+            for j, (n, i) in enumerate(zip(nums, ints))]
+    table = dict(name='Fetch', label='Selected Rows from Table DATA',
+                 title='Selected Rows from Table DATA', attributes={},
+                 schema=schema, rows=rows)
+    return json.dumps(dict(disposition=dict(severity='Normal', reason='ok',
+                                            statusCode=0),
+                           logEntries=[], results=dict(Fetch=table))).encode('utf-8')
+
+
+def make_reflect(nactions):
+    ''' Create the response body of a builtins.reflect call '''
+    params = [dict(name='param%d' % i, type='string', isRequired=False,
+                   desc='Description of parameter %d' % i,
+                   allowedValues=['a', 'b', 'c'], default='a')
+              for i in range(12)]
+    actions = [dict(name='action%d' % i, desc='Description of action %d' % i,
+                    params=params) for i in range(nactions)]
+    results = [dict(name='actionset%d' % i, label='Action set %d' % i,
+                    actions=actions) for i in range(10)]
+    return json.dumps(dict(disposition=dict(severity='Normal', reason='ok',
+                                            statusCode=0),
+                           logEntries=[], results=results)).encode('utf-8')
+
+
+def timeit(func, data, repeat=3):
+    ''' Return the best time of `repeat` calls '''
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        func(data)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(nrows=200000, nactions=100):
+    payloads = [('table.fetch', make_fetch(nrows)),
+                ('builtins.reflect', make_reflect(nactions))]
+    for action, data in payloads:
+        print('%s: %.1fMB' % (action, len(data) / 1024.0**2))
+        baseline = None
+        for name in reversed(CODECS):
+            try:
+                codec = load_codec(name)
+            except ImportError:
+                print('    %-10s not installed' % name)
+                continue
+            loads = timeit(codec.loads, data)
+            baseline = baseline or loads
+            print('    %-10s loads %.3fs (%.1fx)' % (name, loads, baseline / loads))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
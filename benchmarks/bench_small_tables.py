@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+'''
+Benchmark the conversion of many small result tables to DataFrames
+
+This simulates actions that return one small table per By group.  The
+tables are generated locally in the form returned by the REST interface,
+so no CAS server is required.
+
+Usage: python benchmarks/bench_small_tables.py [ntables]
+
+'''
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import copy
+import sys
+import time
+import swat
+from swat.cas.rest.table import REST_CASTable
+from swat.cas.transformers import ctb2tabular
+
+
+def make_table():
+    ''' Create a summary-like table with 10 columns and 5 rows '''
+    schema = [dict(name='Column', type='varchar', width=32)]
+    schema += [dict(name='Stat%d' % i, type='double', width=8, format='BEST12.')
+               for i in range(6)]
+    schema += [dict(name='Min', type='double', width=8, format='DATE9.'),
+               dict(name='Max', type='double', width=8, format='DATETIME20.'),
+               dict(name='N', type='int64', width=8)]
+    rows = [['Var%d' % i] + [float(i)] * 6 + [3653.0, 315662400.0, 100]
+            for i in range(5)]
+    return dict(name='Summary', attributes={}, schema=schema, rows=rows)
+
+
+def timeit(tables):
+    ''' Return the number of tables converted per second '''
+    start = time.time()
+    for tbl in tables:
+        ctb2tabular(tbl)
+    return len(tables) / (time.time() - start)
+
+
+def main(ntables=2000):
+    obj = make_table()
+
+    swat.options.cas.dataset.plan_cache_size = 0
+    uncached = timeit([REST_CASTable(copy.deepcopy(obj)) for i in range(ntables)])
+
+    swat.reset_option('cas.dataset.plan_cache_size')
+    cached = timeit([REST_CASTable(copy.deepcopy(obj)) for i in range(ntables)])
+
+    print('tables:   %d' % ntables)
+    print('uncached: %.0f tables/s' % uncached)
+    print('cached:   %.0f tables/s' % cached)
+    print('speedup:  %.2fx' % (cached / uncached))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -82,7 +82,7 @@ from .cas.table import CASTable    # noqa: E402
 from .cas.utils import table    # noqa: E402
 
 # DataFrame with SAS metadata
-from .dataframe import SASDataFrame, reshape_bygroups    # noqa: E402
+from .dataframe import SASDataFrame, LazySASDataFrame, reshape_bygroups  # noqa: E402
 
 # Functions
 from .functions import concat, merge    # noqa: E402
@@ -827,8 +827,8 @@ class CASAction(ParamManager):
             kwargs = newargs
 
         conn = type(self).get_connection()
-        conn.invoke(type(self).__name__.lower(), **mergedefined(self.to_params(), kwargs))
-        return conn
+        return conn.invoke(type(self).__name__.lower(),
+                           **mergedefined(self.to_params(), kwargs))
 
     def __call__(self, **kwargs):
         '''
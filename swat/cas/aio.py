@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+'''
+Class for calling CAS actions with asyncio
+
+'''
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import asyncio
+import functools
+from . import connection
+from .connection import getnext
+from .rest.aio import REST_CASAsyncConnection
+from ..clib import errorcheck
+from ..exceptions import SWATError, SWATCASActionRetry
+from ..utils.compat import a2n
+
+
+class CAS(connection.CAS):
+    '''
+    Create an asynchronous connection to a CAS server
+
+    This class takes the same parameters as :class:`swat.CAS`, but only
+    the REST protocol is supported.  Calling an action returns a coroutine
+    that completes with the :class:`CASResults` of the action.  While the
+    action runs, the event loop is free to run actions on other
+    connections.  The aiohttp package is required.
+
+    Creating a connection, and the reflection of an action set the first
+    time it is used, are blocking calls.  Use :meth:`create` to create
+    connections in a thread pool from a running event loop.
+
+    Calls to :meth:`retrieve` on one connection run one at a time, since
+    a CAS session runs one action at a time.  Use :meth:`fork` to run
+    actions concurrently in multiple sessions.
+
+    Action calls on :class:`CASTable` objects are coroutines as well.
+    :class:`CASTable` methods that process the results of actions (such as
+    :meth:`CASTable.head` or :meth:`CASTable.to_frame`) are not supported.
+    Neither are the connection methods that do (:meth:`terminate`,
+    :meth:`session_context`, the upload methods, and the ``with``
+    statement); use :meth:`aterminate`, :meth:`aclose` and ``async with``.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from swat.cas import aio
+    >>> async def main():
+    ...     conn = await aio.CAS.create('https://mycashost.com/cas-shared-default-http/',
+    ...                                 username='username', password='password')
+    ...     conns = await conn.fork(8)
+    ...     out = await asyncio.gather(*[c.simple.summary(table=tbl) for c in conns])
+    ...     for c in conns:
+    ...         await c.aclose(close_session=True)
+    ...     return out
+    >>> results = asyncio.run(main())
+
+    Returns
+    -------
+    :class:`swat.cas.aio.CAS` object
+
+    '''
+    _rest_connection_class = REST_CASAsyncConnection
+    _lock = None
+
+    def __init__(self, *args, **kwargs):
+        super(CAS, self).__init__(*args, **kwargs)
+        if not isinstance(self._sw_connection, REST_CASAsyncConnection):
+            self.close()
+            raise SWATError('Asynchronous connections require the REST protocol.')
+
+    @classmethod
+    async def create(cls, *args, **kwargs):
+        '''
+        Create a connection without blocking the event loop
+
+        The connection is created in the default executor of the loop.
+        The parameters are the same as for :class:`CAS`.
+
+        Returns
+        -------
+        :class:`swat.cas.aio.CAS` object
+
+        '''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(cls, *args, **kwargs))
+
+    def __enter__(self):
+        ''' Enter a context '''
+        raise SWATError('Use "async with" with asynchronous connections.')
+
+    def __exit__(self, type, value, traceback):
+        ''' Exit the context '''
+        raise SWATError('Use "async with" with asynchronous connections.')
+
+    async def __aenter__(self):
+        ''' Enter a context '''
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        ''' Exit the context '''
+        await self.aclose(close_session=True)
+
+    def _get_lock(self):
+        ''' Return the lock that serializes action calls '''
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def aclose(self, close_session=False):
+        ''' Close the CAS connection '''
+        if close_session:
+            await self.retrieve('session.endsession', _messagelevel='error',
+                                _apptag='UI')
+        await self._sw_connection.aclose()
+
+    async def aterminate(self):
+        ''' End the session and close the CAS connection '''
+        await self.aclose(close_session=True)
+
+    def _blocking_error(self, name, alternative):
+        ''' Raise an error for a method that blocks on action results '''
+        raise SWATError('%s is not supported on asynchronous connections. '
+                        'Use %s instead.' % (name, alternative))
+
+    def close(self, close_session=False):
+        '''
+        Close the CAS connection
+
+        Ending the session requires calling an action, so
+        ``close_session=True`` is only supported by :meth:`aclose`.
+
+        '''
+        if close_session:
+            self._blocking_error('close(close_session=True)',
+                                 'await aclose(close_session=True)')
+        super(CAS, self).close()
+
+    def terminate(self):
+        ''' End the session and close the CAS connection '''
+        self._blocking_error('terminate()', 'await aterminate()')
+
+    def session_context(self, *args, **kwargs):
+        ''' Not supported: session options are set and restored with actions '''
+        self._blocking_error('session_context()',
+                             'the sessionprop.setsessopt action')
+
+    def upload(self, *args, **kwargs):
+        ''' Not supported: uploads are loaded with actions '''
+        self._blocking_error('upload()', 'a swat.CAS connection')
+
+    def upload_frame(self, *args, **kwargs):
+        ''' Not supported: uploads are loaded with actions '''
+        self._blocking_error('upload_frame()', 'a swat.CAS connection')
+
+    def _upload_frame_parallel(self, *args, **kwargs):
+        ''' Not supported: uploads are loaded with actions '''
+        self._blocking_error('upload_frame()', 'a swat.CAS connection')
+
+    async def copy(self):
+        '''
+        Create a copy of the connection
+
+        The copy of the connection will use the same parameters as ``self``,
+        but it will create a new session.
+
+        Returns
+        -------
+        :class:`swat.cas.aio.CAS` object
+
+        '''
+        return await type(self).create(None, None, prototype=self)
+
+    async def fork(self, num=2):
+        '''
+        Create multiple copies of a connection
+
+        The copies are created concurrently.  The first element in the
+        returned list is the same object that the method was called on.
+
+        Parameters
+        ----------
+        num : int, optional
+           Number of returned connections.
+
+        Returns
+        -------
+        list of :class:`swat.cas.aio.CAS` objects
+
+        '''
+        copies = await asyncio.gather(*[self.copy() for i in range(1, num)])
+        return [self] + list(copies)
+
+    async def _invoke_with_signature(self, _name_, **kwargs):
+        ''' Call an action on the server and return its signature '''
+        signature, kwargs = self._apply_signature(_name_, kwargs)
+        errorcheck(await self._sw_connection.ainvoke(a2n(_name_), kwargs),
+                   self._sw_connection)
+        return signature
+
+    async def invoke(self, _name_, **kwargs):
+        '''
+        Call an action on the server
+
+        When the coroutine completes, the responses of the action can
+        be retrieved by iterating over the connection.
+
+        Parameters
+        ----------
+        _name_ : string
+            Name of the action
+        **kwargs : any, optional
+            Arbitrary keyword arguments
+
+        Returns
+        -------
+        `self`
+
+        '''
+        await self._invoke_with_signature(a2n(_name_), **kwargs)
+        return self
+
+    async def retrieve(self, _name_, **kwargs):
+        '''
+        Call the action and aggregate the results
+
+        Parameters
+        ----------
+        _name_ : string
+           Name of the action
+        **kwargs : any, optional
+           Arbitrary keyword arguments
+
+        Returns
+        -------
+        :class:`CASResults` object
+
+        '''
+        kwargs, datamsghandler, responsefunc, resultfunc = \
+            self._get_retrieve_args(kwargs)
+
+        async with self._get_lock():
+            try:
+                signature = await self._invoke_with_signature(a2n(_name_), **kwargs)
+                results = self._get_results(getnext(self, datamsghandler=datamsghandler),
+                                            responsefunc=responsefunc,
+                                            resultfunc=resultfunc)
+            except SWATCASActionRetry:
+                signature = await self._invoke_with_signature(a2n(_name_), **kwargs)
+                results = self._get_results(getnext(self, datamsghandler=datamsghandler),
+                                            responsefunc=responsefunc,
+                                            resultfunc=resultfunc)
+
+        # Return raw data if a function was supplied
+        if responsefunc is not None or resultfunc is not None:
+            return results
+
+        return self._run_results_hooks(signature, results)
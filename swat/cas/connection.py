@@ -26,6 +26,7 @@ from __future__ import print_function, division, absolute_import, unicode_litera
 import collections
 import contextlib
 import copy
+import functools
 import inspect
 import itertools
 import json
@@ -34,6 +35,8 @@ import random
 import re
 import requests
 import six
+import time
+import uuid
 import warnings
 import weakref
 import pandas as pd
@@ -68,6 +71,211 @@ pd_version = tuple([int(x) for x in re.match(r'^(\d+)\.(\d+)\.(\d+)',
                                              pd.__version__).groups()])
 
 
+def _to_csv(data, path_or_buf=None, date_format=None, header=True):
+    '''
+    Write a DataFrame in the CSV form expected by the server parser
+
+    Parameters
+    ----------
+    data : :class:`pandas.DataFrame`
+        The data to write.
+    path_or_buf : string or file-like, optional
+        The file to write to.  If None, the CSV is returned as a string.
+    date_format : string, optional
+        Format string for datetime objects.
+    header : bool, optional
+        Should the column names be written?
+
+    Returns
+    -------
+    None or string
+
+    '''
+    kwargs = dict(encoding='utf-8', index=False, header=header,
+                  sep=a2n(',', 'utf-8'), decimal=a2n('.', 'utf-8'),
+                  date_format=a2n(date_format, 'utf-8'))
+
+    # line_terminator changed to lineterminator in pandas 1.5.0
+    if pd_version >= (1, 5, 0):
+        kwargs['lineterminator'] = a2n('\r\n', 'utf-8')
+    else:
+        kwargs['line_terminator'] = a2n('\r\n', 'utf-8')
+
+    return data.to_csv(path_or_buf, **kwargs)
+
+
+def _iter_csv(data, date_format=None, chunksize=None, progress=None):
+    '''
+    Serialize a DataFrame to CSV one block of rows at a time
+
+    Parameters
+    ----------
+    data : :class:`pandas.DataFrame`
+        The data to serialize.
+    date_format : string, optional
+        Format string for datetime objects.
+    chunksize : int, optional
+        The number of rows in each block.  The default is set by
+        the cas.upload.chunk_rows option.
+    progress : :class:`_UploadProgress`, optional
+        Object that the encoding time of each block is reported to.
+
+    Yields
+    ------
+    bytes
+
+    '''
+    if chunksize is None:
+        chunksize = get_option('cas.upload.chunk_rows')
+
+    started = time.time()
+    out = _to_csv(data.iloc[:0], date_format=date_format).encode('utf-8')
+    if progress is not None:
+        progress.encode('csv', 0, len(out), time.time() - started)
+    yield out
+
+    for start in range(0, len(data), chunksize):
+        started = time.time()
+        block = data.iloc[start:start + chunksize]
+        out = _to_csv(block, date_format=date_format, header=False).encode('utf-8')
+        if progress is not None:
+            progress.encode('csv', len(block), len(out), time.time() - started)
+        yield out
+
+
+def _to_parquet(data):
+    '''
+    Serialize a DataFrame to Parquet in memory
+
+    Parameters
+    ----------
+    data : :class:`pandas.DataFrame`
+        The data to serialize.
+
+    Returns
+    -------
+    bytes
+
+    '''
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    buf = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), buf,
+                   coerce_timestamps='us', allow_truncated_timestamps=True)
+    return buf.getvalue().to_pybytes()
+
+
+def _is_filetype_error(text):
+    '''
+    Does an upload error say that the file type or its parser was rejected?
+
+    Parameters
+    ----------
+    text : string
+        The status and messages of the upload.  The uploaded file name
+        (ending in ".parquet") is not considered a match.
+
+    Returns
+    -------
+    bool
+
+    '''
+    return re.search(r'(?<!\.)parquet|file ?type|file format', text or '',
+                     re.I) is not None
+
+
+class _UploadProgress(object):
+    '''
+    Report the stages of an upload to a progress callback
+
+    Parameters
+    ----------
+    callback : function
+        Function called with a dictionary of measurements for each stage.
+
+    '''
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.started = time.time()
+        self.encode_seconds = 0.0
+        self.bytes = 0
+        self.wire_bytes = 0
+
+    def encode(self, fmt, rows, nbytes, seconds):
+        '''
+        Report the serialization of a block of rows
+
+        Parameters
+        ----------
+        fmt : string
+            The file format.
+        rows : int
+            The number of rows serialized.
+        nbytes : int
+            The number of bytes produced.
+        seconds : float
+            The time taken to serialize the rows.
+
+        '''
+        self.encode_seconds += seconds
+        self.callback(dict(stage='encode', format=fmt, rows=rows, bytes=nbytes,
+                           seconds=seconds))
+
+    def response(self, response, seconds, nbytes=None, encode_seconds=0.0):
+        '''
+        Report the transfer and server stages of an upload request
+
+        Parameters
+        ----------
+        response : :class:`CASResponse`
+            The response of the upload request.
+        seconds : float
+            The time taken by the upload request.
+        nbytes : int, optional
+            The size of the uploaded file.  This is used when the
+            response does not include the request size.
+        encode_seconds : float, optional
+            The encoding time that is included in `seconds` because
+            the data was serialized while it was being sent.
+
+        '''
+        perf = response.performance
+        server = perf.elapsed_time or 0.0
+        request_bytes = perf.request_bytes
+        if request_bytes is None:
+            request_bytes = nbytes or 0
+        wire_bytes = perf.request_wire_bytes
+        if wire_bytes is None:
+            wire_bytes = request_bytes
+        self.bytes += request_bytes
+        self.wire_bytes += wire_bytes
+
+        self.callback(dict(stage='transfer', bytes=request_bytes, wire_bytes=wire_bytes,
+                           seconds=max(seconds - encode_seconds - server, 0.0)))
+        self.callback(dict(stage='server', seconds=perf.elapsed_time,
+                           cpu_user_seconds=perf.cpu_user_time,
+                           cpu_system_seconds=perf.cpu_system_time))
+
+    def total(self, rows=None):
+        '''
+        Report the totals of the upload
+
+        Parameters
+        ----------
+        rows : int, optional
+            The number of rows uploaded, if known.
+
+        '''
+        seconds = time.time() - self.started
+        self.callback(dict(stage='total', rows=rows, bytes=self.bytes,
+                           wire_bytes=self.wire_bytes, seconds=seconds,
+                           rows_per_second=rows / seconds
+                           if rows is not None and seconds else None,
+                           bytes_per_second=self.bytes / seconds if seconds else None))
+
+
 def _option_handler(key, value):
     ''' Handle option changes '''
     sessions = list(CAS.sessions.values())
@@ -250,6 +458,7 @@ class CAS(object):
     trait_names = None  # Block IPython's query for this
     sessions = weakref.WeakValueDictionary()
     _sessioncount = 1
+    _rest_connection_class = rest.REST_CASConnection
 
     @classmethod
     def _expand_url(cls, url):
@@ -452,7 +661,7 @@ class CAS(object):
                 # Set up connection parameters
                 params = (hostname, port, username, password, soptions, self._sw_error)
                 if protocol in ['http', 'https']:
-                    self._sw_connection = rest.REST_CASConnection(*params)
+                    self._sw_connection = type(self)._rest_connection_class(*params)
                 else:
                     self._sw_connection = clib.SW_CASConnection(*params)
 
@@ -1525,6 +1734,29 @@ class CAS(object):
         dict
             Signature of the action
 
+        '''
+        signature, kwargs = self._apply_signature(_name_, kwargs)
+
+        self._invoke_without_signature(_name_, **kwargs)
+
+        return signature
+
+    def _apply_signature(self, _name_, kwargs):
+        '''
+        Merge the action signature into the action parameters
+
+        Parameters
+        ----------
+        _name_ : string
+            Name of the action.
+        kwargs : dict
+            Action parameter dictionary.
+
+        Returns
+        -------
+        (dict, dict)
+            Signature of the action and the new set of action parameters
+
         '''
         # Get the signature of the action
         signature = self._get_action_info(_name_)[-1]
@@ -1537,9 +1769,7 @@ class CAS(object):
             kwargs = copy.deepcopy(kwargs)
             self._merge_param_args(signature.get('params', {}), kwargs, action=_name_)
 
-        self._invoke_without_signature(_name_, **kwargs)
-
-        return signature
+        return signature, kwargs
 
     def _extract_dtypes(self, df):
         '''
@@ -1653,7 +1883,8 @@ class CAS(object):
                 else:
                     vars.append(item)
 
-    def upload(self, data, importoptions=None, casout=None, date_format=None, **kwargs):
+    def upload(self, data, importoptions=None, casout=None, date_format=None,
+               progress=None, **kwargs):
         '''
         Upload data from a local file into a CAS table
 
@@ -1674,23 +1905,50 @@ class CAS(object):
         would use the `table.loadtable` action.
 
         Also, when uploading a :class:`pandas.DataFrame`, the data is exported to
-        a CSV file, then the CSV file is uploaded.  This can cause a loss of
+        CSV, then the CSV is uploaded.  This can cause a loss of
         metadata about the columns since the server parser will guess at the
         data types of the columns.  You can use `importoptions=` to specify more
         information about the data.
 
+        If the cas.upload.format option is set to 'parquet', DataFrames are
+        serialized to Parquet in memory instead, which preserves the numeric
+        and datetime types of the columns.  If pyarrow can not serialize the
+        DataFrame, or the server rejects the Parquet file type, the DataFrame
+        is uploaded as CSV.  Other upload errors are returned as usual.
+
+        When using the REST interface, the CSV is generated in blocks of
+        rows (see the cas.upload.chunk_rows option) and streamed to the
+        server without a temporary file, and local files are streamed from
+        disk rather than being read into memory.  The binary interface
+        requires a file, so a temporary CSV file is used in that case.
+
         Parameters
         ----------
         data : string or :class:`pandas.DataFrame`
             If the value is a string, it can be either a filename
-            or a URL.  DataFrames will be converted to CSV before
-            uploading.
+            or a URL.  DataFrames will be converted to CSV (or Parquet)
+            before uploading.
         importoptions : dict, optional
             Import options for the ``table.loadtable`` action.
         casout : dict, optional
             Output table definition for the ``table.loadtable`` action.
         date_format : string, optional
             Format string for datetime objects.
+        progress : function, optional
+            Function called with a dictionary of measurements for each
+            stage of the upload.  The 'stage' key is one of the following.
+            encode : A block of DataFrame rows was serialized.  The keys are
+                'format', 'rows', 'bytes', and 'seconds'.
+            transfer : The data was sent.  The keys are 'bytes', 'wire_bytes'
+                (the size after compression), and 'seconds' (the time of the
+                request less the encode and server time).
+            server : The server loaded the data.  The keys are 'seconds',
+                'cpu_user_seconds', and 'cpu_system_seconds'.
+            total : The upload is complete.  The keys are 'rows', 'bytes',
+                'wire_bytes', 'seconds', 'rows_per_second', and
+                'bytes_per_second'.
+            See :func:`swat.logging.log_progress` for a function that
+            logs the measurements.
         **kwargs : keyword arguments, optional
             Additional parameters to the ``table.loadtable`` action.
 
@@ -1707,14 +1965,19 @@ class CAS(object):
         3           4.6          3.1           1.5          0.2  setosa
         4           5.0          3.6           1.4          0.2  setosa
 
+        Show the progress of a DataFrame upload using tqdm.
+
+        >>> bar = tqdm.tqdm(total=len(df))
+        >>> out = conn.upload(df, progress=lambda info: bar.update(info['rows'])
+        ...                   if info['stage'] == 'encode' else None)
+
         Returns
         -------
         :class:`CASResults`
 
         '''
-        delete = False
-        name = None
-        df_dtypes = None
+        if progress is not None:
+            progress = _UploadProgress(progress)
 
         for key, value in list(kwargs.items()):
             if importoptions is None and key.lower() == 'importoptions':
@@ -1728,29 +1991,132 @@ class CAS(object):
             importoptions = {}
 
         import pandas as pd
-        if isinstance(data, pd.DataFrame):
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp:
-                delete = True
-                filename = tmp.name
-                name = os.path.splitext(os.path.basename(filename))[0]
-
-                # line_terminator changed to lineterminator in pandas 1.5.0
-                if pd_version >= (1, 5, 0):
-                    data.to_csv(filename, encoding='utf-8',
-                                index=False, sep=a2n(',', 'utf-8'),
-                                decimal=a2n('.', 'utf-8'),
-                                date_format=a2n(date_format, 'utf-8'),
-                                lineterminator=a2n('\r\n', 'utf-8'))
+        if isinstance(data, pd.DataFrame) \
+                and get_option('cas.upload.format') == 'parquet' \
+                and isinstance(importoptions, (dict, ParamManager)) \
+                and 'filetype' not in [x.lower() for x in importoptions.keys()]:
+            if isinstance(casout, CASTable):
+                casout = casout.to_outtable_params()
+
+            # Columns that pyarrow can not convert are uploaded as CSV
+            parquet = None
+            try:
+                started = time.time()
+                parquet = _to_parquet(data)
+            except (ValueError, TypeError, NotImplementedError) as exc:
+                status = str(exc)
+
+            # Only a rejection of the file type falls back to CSV.  Other
+            # errors (e.g., an existing casout) would fail again as CSV.
+            if parquet is not None:
+                if progress is not None:
+                    progress.encode('parquet', len(data), len(parquet),
+                                    time.time() - started)
+                try:
+                    out = self._upload(data, importoptions=copy.deepcopy(importoptions),
+                                       casout=copy.deepcopy(casout), parquet=parquet,
+                                       progress=progress, **copy.deepcopy(kwargs))
+                except SWATError as exc:
+                    if not _is_filetype_error(str(exc)):
+                        raise
+                    status = str(exc)
                 else:
-                    data.to_csv(filename, encoding='utf-8',
-                                index=False, sep=a2n(',', 'utf-8'),
-                                decimal=a2n('.', 'utf-8'),
-                                date_format=a2n(date_format, 'utf-8'),
-                                line_terminator=a2n('\r\n', 'utf-8'))
+                    status = out.status
+                    if out.severity <= 1:
+                        if progress is not None:
+                            progress.total(len(data))
+                        return out
+                    messages = list(getattr(out, 'messages', None) or [])
+                    if not _is_filetype_error(' '.join([status or ''] + messages)):
+                        return out
 
-                df_dtypes = self._extract_dtypes(data)
-                importoptions['locale'] = 'EN-us'
+            warnings.warn('Parquet upload failed, so the data will be uploaded '
+                          'as CSV: %s' % status, RuntimeWarning)
+
+        out = self._upload(data, importoptions=importoptions, casout=casout,
+                           date_format=date_format, progress=progress, **kwargs)
+
+        if progress is not None:
+            progress.total(len(data) if isinstance(data, pd.DataFrame) else None)
+
+        return out
+
+    def _upload(self, data, importoptions=None, casout=None, date_format=None,
+                parquet=None, progress=None, **kwargs):
+        '''
+        Upload data from a local file into a CAS table
+
+        Parameters
+        ----------
+        data : string or :class:`pandas.DataFrame`
+            The filename, URL, or DataFrame to upload.
+        importoptions : dict, optional
+            Import options for the ``table.loadtable`` action.
+        casout : dict, optional
+            Output table definition for the ``table.loadtable`` action.
+        date_format : string, optional
+            Format string for datetime objects.
+        parquet : bytes, optional
+            The DataFrame serialized as Parquet.  If specified, this is
+            uploaded rather than the DataFrame in CSV form.
+        progress : :class:`_UploadProgress`, optional
+            Object that the measurements of each stage are reported to.
+        **kwargs : keyword arguments, optional
+            Additional parameters to the ``table.loadtable`` action.
+
+        Returns
+        -------
+        :class:`CASResults`
+
+        '''
+        delete = False
+        name = None
+        df_dtypes = None
+        stream = None
+
+        if importoptions is None:
+            importoptions = {}
+
+        import pandas as pd
+        if isinstance(data, pd.DataFrame) and parquet is not None:
+            importoptions['filetype'] = 'parquet'
+
+            if isinstance(self._sw_connection, rest.REST_CASConnection):
+                name = 'tmp%s' % uuid.uuid4().hex[:8]
+                filename = name + '.parquet'
+                stream = functools.partial(iter, [parquet])
+
+            else:
+                import tempfile
+                with tempfile.NamedTemporaryFile(delete=False,
+                                                 suffix='.parquet') as tmp:
+                    delete = True
+                    filename = tmp.name
+                    name = os.path.splitext(os.path.basename(filename))[0]
+                    tmp.write(parquet)
+
+        elif isinstance(data, pd.DataFrame):
+            df_dtypes = self._extract_dtypes(data)
+            importoptions['locale'] = 'EN-us'
+
+            # Stream the CSV to the server without a temporary file
+            if isinstance(self._sw_connection, rest.REST_CASConnection):
+                name = 'tmp%s' % uuid.uuid4().hex[:8]
+                filename = name + '.csv'
+                stream = functools.partial(_iter_csv, data, date_format=date_format,
+                                           progress=progress)
+
+            else:
+                import tempfile
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp:
+                    delete = True
+                    filename = tmp.name
+                    name = os.path.splitext(os.path.basename(filename))[0]
+                    started = time.time()
+                    _to_csv(data, filename, date_format=date_format)
+                    if progress is not None:
+                        progress.encode('csv', len(data), os.path.getsize(filename),
+                                        time.time() - started)
 
         elif data.startswith('http://') or \
                 data.startswith('https://') or \
@@ -1808,7 +2174,16 @@ class CAS(object):
             casout['name'] = name
         kwargs['casout'] = casout
 
-        if isinstance(self._sw_connection, rest.REST_CASConnection):
+        nbytes = None
+        if progress is not None:
+            encode_seconds = progress.encode_seconds
+            if stream is None:
+                nbytes = os.path.getsize(filename)
+
+        started = time.time()
+        if stream is not None:
+            resp = self._sw_connection.upload(stream, kwargs)
+        elif isinstance(self._sw_connection, rest.REST_CASConnection):
             resp = self._sw_connection.upload(a2n(filename), kwargs)
         else:
             resp = errorcheck(self._sw_connection.upload(a2n(filename),
@@ -1816,6 +2191,7 @@ class CAS(object):
                                                                 self._sw_error,
                                                                 **kwargs)),
                               self._sw_connection)
+        seconds = time.time() - started
 
         # Remove temporary file as needed
         if delete:
@@ -1824,9 +2200,15 @@ class CAS(object):
             except Exception:
                 pass
 
-        return self._get_results([(CASResponse(resp, connection=self), self)])
+        response = CASResponse(resp, connection=self)
+        if progress is not None:
+            progress.response(response, seconds, nbytes=nbytes,
+                              encode_seconds=progress.encode_seconds - encode_seconds)
 
-    def upload_file(self, data, importoptions=None, casout=None, **kwargs):
+        return self._get_results([(response, self)])
+
+    def upload_file(self, data, importoptions=None, casout=None, progress=None,
+                    **kwargs):
         '''
         Upload a client-side data file to CAS and parse it into a CAS table
 
@@ -1840,6 +2222,9 @@ class CAS(object):
             Import options for the ``table.loadtable`` action.
         casout : dict, optional
             Output table definition for the ``table.loadtable`` action.
+        progress : function, optional
+            Function called with a dictionary of measurements for each
+            stage of the upload.  See :meth:`upload`.
         **kwargs : keyword arguments, optional
             Additional parameters to the ``table.loadtable`` action.
 
@@ -1857,25 +2242,41 @@ class CAS(object):
                 del kwargs[key]
 
         out = self.upload(data, importoptions=importoptions,
-                          casout=casout, **kwargs)
+                          casout=casout, progress=progress, **kwargs)
 
         if out.severity > 1:
             raise SWATError(out.status)
 
         return out['casTable']
 
-    def upload_frame(self, data, importoptions=None, casout=None, **kwargs):
+    def upload_frame(self, data, importoptions=None, casout=None, parallel=None,
+                     chunk_rows=None, progress=None, **kwargs):
         '''
         Upload a client-side data file to CAS and parse it into a CAS table
 
         Parameters
         ----------
         data : :class:`pandas.DataFrame`
-            DataFrames will be converted to CSV before uploading.
+            DataFrames will be converted to CSV (or Parquet, see the
+            cas.upload.format option) before uploading.
         importoptions : dict, optional
             Import options for the ``table.loadtable`` action.
         casout : dict, optional
             Output table definition for the ``table.loadtable`` action.
+        parallel : int, optional
+            The number of sessions used to upload the data concurrently.
+            The rows are split into chunks which are uploaded into
+            temporary global tables by sessions created with :meth:`fork`.
+            The temporary tables are then concatenated into `casout` on
+            the server and dropped.  Only the name, caslib, replace,
+            promote, and copies keys of `casout` are used in this case.
+        chunk_rows : int, optional
+            The number of rows in each chunk of a parallel upload.
+            By default, the rows are split evenly across the sessions.
+        progress : function, optional
+            Function called with a dictionary of measurements for each
+            stage of the upload.  See :meth:`upload`.  In a parallel upload,
+            the stages of each chunk are reported from the upload threads.
         **kwargs : keyword arguments, optional
             Additional parameters to the ``table.loadtable`` action.
 
@@ -1892,14 +2293,104 @@ class CAS(object):
                 casout = value
                 del kwargs[key]
 
+        if parallel is not None and parallel > 1 and len(data) > 1:
+            return self._upload_frame_parallel(data, parallel, chunk_rows=chunk_rows,
+                                               importoptions=importoptions,
+                                               casout=casout, progress=progress,
+                                               **kwargs)
+
         out = self.upload(data, importoptions=importoptions,
-                          casout=casout, **kwargs)
+                          casout=casout, progress=progress, **kwargs)
 
         if out.severity > 1:
             raise SWATError(out.status)
 
         return out['casTable']
 
+    def _upload_frame_parallel(self, data, parallel, chunk_rows=None,
+                               importoptions=None, casout=None, progress=None,
+                               **kwargs):
+        '''
+        Upload a DataFrame in chunks using multiple sessions concurrently
+
+        Parameters
+        ----------
+        data : :class:`pandas.DataFrame`
+            The data to upload.
+        parallel : int
+            The maximum number of sessions to use.
+        chunk_rows : int, optional
+            The number of rows in each chunk.
+        importoptions : dict, optional
+            Import options for the ``table.loadtable`` action.
+        casout : dict, optional
+            Output table definition.
+        progress : function, optional
+            Function called with the measurements of each chunk upload.
+        **kwargs : keyword arguments, optional
+            Additional parameters to the ``table.loadtable`` action.
+
+        Returns
+        -------
+        :class:`CASTable`
+
+        '''
+        from concurrent.futures import ThreadPoolExecutor
+        from .table import concat, _gen_table_name
+
+        if not chunk_rows:
+            chunk_rows = -(-len(data) // parallel)
+        chunks = [data.iloc[i:i + chunk_rows] for i in range(0, len(data), chunk_rows)]
+        parallel = min(parallel, len(chunks))
+
+        if casout is None:
+            casout = {}
+        elif isinstance(casout, CASTable):
+            casout = casout.to_outtable_params()
+        casout = dict(casout)
+        if 'name' not in casout:
+            casout['name'] = _gen_table_name()
+
+        # The chunks must be global tables to be visible to this session
+        caslib = casout.get('caslib')
+        if not caslib:
+            caslib = self.retrieve('sessionprop.getsessopt', name='caslib',
+                                   _apptag='UI', _messagelevel='error')['caslib']
+        names = [_gen_table_name() for chunk in chunks]
+
+        def upload(args):
+            ''' Upload the chunks assigned to one session '''
+            conn, items = args
+            for name, chunk in items:
+                out = conn.upload(chunk, importoptions=copy.deepcopy(importoptions),
+                                  casout=dict(name=name, caslib=caslib, promote=True),
+                                  progress=progress, **copy.deepcopy(kwargs))
+                if out.severity > 1:
+                    raise SWATError(out.status)
+
+        conns = self.fork(parallel)
+        try:
+            items = list(zip(names, chunks))
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                list(pool.map(upload, [(conn, items[i::parallel])
+                                       for i, conn in enumerate(conns)]))
+
+            return concat([self.CASTable(name, caslib=caslib) for name in names],
+                          casout=casout)
+
+        finally:
+            for conn in conns[1:]:
+                try:
+                    conn.terminate()
+                except Exception:
+                    conn.close()
+            for name in names:
+                try:
+                    self.retrieve('table.droptable', name=name, caslib=caslib,
+                                  quiet=True, _apptag='UI', _messagelevel='error')
+                except Exception:
+                    pass
+
     def _raw_invoke(self, _name_, **kwargs):
         ''' Invoke a CAS action without any parameter checking '''
         self._invoke_without_signature(a2n(_name_), **kwargs)
@@ -2072,6 +2563,41 @@ class CAS(object):
         .
         .
 
+        '''
+        kwargs, datamsghandler, responsefunc, resultfunc = \
+            self._get_retrieve_args(kwargs)
+
+        try:
+            # Call the action and compile the results
+            signature = self._invoke_with_signature(a2n(_name_), **kwargs)
+            results = self._get_results(getnext(self, datamsghandler=datamsghandler),
+                                        responsefunc=responsefunc, resultfunc=resultfunc)
+        except SWATCASActionRetry:
+            signature = self._invoke_with_signature(a2n(_name_), **kwargs)
+            results = self._get_results(getnext(self, datamsghandler=datamsghandler),
+                                        responsefunc=responsefunc, resultfunc=resultfunc)
+
+        # Return raw data if a function was supplied
+        if responsefunc is not None or resultfunc is not None:
+            return results
+
+        return self._run_results_hooks(signature, results)
+
+    def _get_retrieve_args(self, kwargs):
+        '''
+        Extract the client-side arguments of :meth:`retrieve`
+
+        Parameters
+        ----------
+        kwargs : dict
+            The arguments of :meth:`retrieve`
+
+        Returns
+        -------
+        (dict, CASDataMsgHandler, callable, callable)
+            The action parameters, and the data message handler, response
+            callback function and result callback function (or None)
+
         '''
         kwargs = dict(kwargs)
 
@@ -2102,20 +2628,10 @@ class CAS(object):
             resultfunc = kwargs['resultfunc']
             kwargs.pop('resultfunc')
 
-        try:
-            # Call the action and compile the results
-            signature = self._invoke_with_signature(a2n(_name_), **kwargs)
-            results = self._get_results(getnext(self, datamsghandler=datamsghandler),
-                                        responsefunc=responsefunc, resultfunc=resultfunc)
-        except SWATCASActionRetry:
-            signature = self._invoke_with_signature(a2n(_name_), **kwargs)
-            results = self._get_results(getnext(self, datamsghandler=datamsghandler),
-                                        responsefunc=responsefunc, resultfunc=resultfunc)
-
-        # Return raw data if a function was supplied
-        if responsefunc is not None or resultfunc is not None:
-            return results
+        return kwargs, datamsghandler, responsefunc, resultfunc
 
+    def _run_results_hooks(self, signature, results):
+        ''' Set the signature of the results and run post-processing hooks '''
         results.signature = signature
 
         # run post-processing hooks
@@ -2657,7 +3173,8 @@ class CAS(object):
             Keyword arguments to pass to the data reader function.
             The keyword parameters 'table', 'caslib', 'promote', and
             'replace' will be stripped to use for the output CAS
-            table parameters.
+            table parameters.  The 'progress' parameter is the progress
+            callback described in :meth:`upload`.
 
         Returns
         -------
@@ -2666,16 +3183,20 @@ class CAS(object):
         '''
         import pandas as pd
         use_addtable = kwargs.pop('use_addtable', False)
+        progress = kwargs.pop('progress', None)
         table, kwargs = self._get_table_args(**kwargs)
         dframe = getattr(pd, _method_)(*args, **kwargs)
         # REST doesn't support table.addtable
         if not use_addtable or self._protocol.startswith('http'):
             if 'table' in table:
                 table['name'] = table.pop('table')
-            return self.upload_frame(dframe, casout=table and table or None)
+            return self.upload_frame(dframe, casout=table and table or None,
+                                     progress=progress)
 #                                    importoptions=self._importoptions_from_dframe(dframe)
         from swat import datamsghandlers as dmh
-        table.update(dmh.PandasDataFrame(dframe).args.addtable)
+        handler = dmh.PandasDataFrame(dframe)
+        handler.progress = progress
+        table.update(handler.args.addtable)
         return self.retrieve('table.addtable', **table).casTable
 
     def read_pickle(self, path, casout=None, **kwargs):
@@ -2776,6 +3297,7 @@ class CAS(object):
 
         '''
         use_addtable = kwargs.pop('use_addtable', False)
+        progress = kwargs.pop('progress', None)
         table, kwargs = self._get_table_args(casout=casout, **kwargs)
         # REST doesn't support table.addtable
         if not use_addtable or self._protocol.startswith('http'):
@@ -2783,10 +3305,13 @@ class CAS(object):
             dframe = pd.read_table(filepath_or_buffer, **kwargs)
             if 'table' in table:
                 table['name'] = table.pop('table')
-            return self.upload_frame(dframe, casout=table and table or None)
+            return self.upload_frame(dframe, casout=table and table or None,
+                                     progress=progress)
 #                                    importoptions=self._importoptions_from_dframe(dframe)
         from swat import datamsghandlers as dmh
-        table.update(dmh.Text(filepath_or_buffer, **kwargs).args.addtable)
+        handler = dmh.Text(filepath_or_buffer, **kwargs)
+        handler.progress = progress
+        table.update(handler.args.addtable)
         return self.retrieve('table.addtable', **table).casTable
 
     def read_csv(self, filepath_or_buffer, casout=None, **kwargs):
@@ -2838,6 +3363,7 @@ class CAS(object):
 
         '''
         use_addtable = kwargs.pop('use_addtable', False)
+        progress = kwargs.pop('progress', None)
         table, kwargs = self._get_table_args(casout=casout, **kwargs)
         # REST doesn't support table.addtable
         if not use_addtable or self._protocol.startswith('http'):
@@ -2845,10 +3371,13 @@ class CAS(object):
             dframe = pd.read_csv(filepath_or_buffer, **kwargs)
             if 'table' in table:
                 table['name'] = table.pop('table')
-            return self.upload_frame(dframe, casout=table and table or None)
+            return self.upload_frame(dframe, casout=table and table or None,
+                                     progress=progress)
 #                                    importoptions=self._importoptions_from_dframe(dframe)
         from swat import datamsghandlers as dmh
-        table.update(dmh.CSV(filepath_or_buffer, **kwargs).args.addtable)
+        handler = dmh.CSV(filepath_or_buffer, **kwargs)
+        handler.progress = progress
+        table.update(handler.args.addtable)
         return self.retrieve('table.addtable', **table).casTable
 
     def read_frame(self, dframe, casout=None, **kwargs):
@@ -2898,15 +3427,19 @@ class CAS(object):
 
         '''
         use_addtable = kwargs.pop('use_addtable', False)
+        progress = kwargs.pop('progress', None)
         table, kwargs = self._get_table_args(casout=casout, **kwargs)
         # REST doesn't support table.addtable
         if not use_addtable or self._protocol.startswith('http'):
             if 'table' in table:
                 table['name'] = table.pop('table')
-            return self.upload_frame(dframe, casout=table and table or None)
+            return self.upload_frame(dframe, casout=table and table or None,
+                                     progress=progress)
 #                                    importoptions=self._importoptions_from_dframe(dframe)
         from swat import datamsghandlers as dmh
-        table.update(dmh.PandasDataFrame(dframe, **kwargs).args.addtable)
+        handler = dmh.PandasDataFrame(dframe, **kwargs)
+        handler.progress = progress
+        table.update(handler.args.addtable)
         return self.retrieve('table.addtable', **table).casTable
 
     def read_fwf(self, filepath_or_buffer, casout=None, **kwargs):
@@ -2958,6 +3491,7 @@ class CAS(object):
 
         '''
         use_addtable = kwargs.pop('use_addtable', False)
+        progress = kwargs.pop('progress', None)
         table, kwargs = self._get_table_args(casout=casout, **kwargs)
         # REST doesn't support table.addtable
         if not use_addtable or self._protocol.startswith('http'):
@@ -2965,10 +3499,13 @@ class CAS(object):
             dframe = pd.read_fwf(filepath_or_buffer, **kwargs)
             if 'table' in table:
                 table['name'] = table.pop('table')
-            return self.upload_frame(dframe, casout=table and table or None)
+            return self.upload_frame(dframe, casout=table and table or None,
+                                     progress=progress)
 #                                    importoptions=self._importoptions_from_dframe(dframe)
         from swat import datamsghandlers as dmh
-        table.update(dmh.FWF(filepath_or_buffer, **kwargs).args.addtable)
+        handler = dmh.FWF(filepath_or_buffer, **kwargs)
+        handler.progress = progress
+        table.update(handler.args.addtable)
         return self.retrieve('table.addtable', **table).casTable
 
     def read_clipboard(self, casout=None, **kwargs):
@@ -3188,16 +3725,20 @@ class CAS(object):
         import pandas as pd
         from swat import datamsghandlers as dmh
         use_addtable = kwargs.pop('use_addtable', False)
+        progress = kwargs.pop('progress', None)
         out = []
         table, kwargs = self._get_table_args(casout=casout, **kwargs)
         for i, dframe in enumerate(pd.read_html(io, **kwargs)):
             if i and table.get('table'):
                 table['table'] += str(i)
             if not use_addtable or self._protocol.startswith('http'):
-                out.append(self.upload_frame(dframe, casout=table and table or None))
+                out.append(self.upload_frame(dframe, casout=table and table or None,
+                                             progress=progress))
 #                                            importoptions=self._importoptions_from_dframe(dframe)
             else:
-                table.update(dmh.PandasDataFrame(dframe).args.addtable)
+                handler = dmh.PandasDataFrame(dframe)
+                handler.progress = progress
+                table.update(handler.args.addtable)
                 out.append(self.retrieve('table.addtable', **table).casTable)
         return out
 
@@ -3743,10 +4284,9 @@ def getnext(*objs, **kwargs):
             conn.invoke()
             connections[i] = conn.get_connection()
 
-    # TODO: Set timeouts; check for mixed connection types
+    # TODO: Check for mixed connection types
     if isinstance(connections[0]._sw_connection, rest.REST_CASConnection):
-        for item in connections:
-            yield getone(item)
+        yield from _getnext_rest(connections, timeout=timeout)
         return
 
     _sw_watcher = errorcheck(clib.SW_CASConnectionEventWatcher(len(connections), timeout,
@@ -3779,6 +4319,54 @@ def getnext(*objs, **kwargs):
         raise
 
 
+def _getnext_rest(connections, timeout=0):
+    '''
+    Return responses from REST connections in the order that they arrive
+
+    Parameters
+    ----------
+    connections : list of :class:`CAS` objects
+        The connections to watch for responses.
+    timeout : int, optional
+        Timeout for waiting for a response.  If no response arrives in
+        time, ``([], None)`` is yielded and the wait continues.
+
+    Returns
+    -------
+    generator of (:class:`CASResponse`, :class:`CAS`) tuples
+
+    '''
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    # Connections without a pending request are returned immediately
+    pending = {}
+    for item in connections:
+        future = item._sw_connection.getPendingResponse()
+        if future is None:
+            yield getone(item)
+        else:
+            pending[future] = item
+
+    try:
+
+        while pending:
+            done, not_done = wait(list(pending), timeout=timeout or None,
+                                  return_when=FIRST_COMPLETED)
+
+            # timeout / retry
+            if not done:
+                yield [], None
+                continue
+
+            for future in [x for x in pending if x in done]:
+                yield getone(pending.pop(future))
+
+    except (KeyboardInterrupt, SystemExit):
+        for conn in connections:
+            errorcheck(conn._sw_connection.stopAction(), conn._sw_connection)
+        raise
+
+
 def dir_actions(obj):
     ''' Return list of CAS actionsets / actions associated with the object '''
     if hasattr(obj, '__dir_actions__'):
@@ -25,12 +25,15 @@ from __future__ import print_function, division, absolute_import, unicode_litera
 from glob import glob
 
 import base64
+import collections
 import copy
 import datetime
+import functools
 import io
 import os
 import re
 import sys
+import time
 import warnings
 import numpy as np
 import pandas as pd
@@ -44,7 +47,8 @@ from .utils.datetime import (str2cas_timestamp, str2cas_datetime, str2cas_date,
                              sas2cas_timestamp, sas2cas_datetime, sas2cas_date,
                              sas2cas_time, python2sas_timestamp, python2sas_datetime,
                              python2sas_date, python2sas_time, python2cas_timestamp,
-                             python2cas_datetime, python2cas_date, python2cas_time)
+                             python2cas_datetime, python2cas_date, python2cas_time,
+                             NP_CAS_EPOCH)
 from .. import clib
 from ..config import get_option
 from ..clib import errorcheck
@@ -73,6 +77,58 @@ _SIZES = {
     'sas': 8,
 }
 
+DEFAULT_NRECS = 1000
+MAX_NRECS = 10**6
+
+
+def _datetime2cas_array(values):
+    '''
+    Convert datetime64 values to CAS datetimes
+
+    Timezone-naive values are assumed to be in UTC.
+
+    Parameters
+    ----------
+    values : array-like
+        The datetime64 values to convert.
+
+    Returns
+    -------
+    (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        The CAS datetime values and the mask of missing values
+
+    '''
+    idx = pd.DatetimeIndex(values)
+    if idx.tz is not None:
+        idx = idx.tz_convert('UTC').tz_localize(None)
+    missing = np.asarray(idx.isna())
+    out = (idx.values.astype('datetime64[us]') - NP_CAS_EPOCH).astype('int64')
+    return out, missing
+
+
+def _python2datetime64(values):
+    '''
+    Convert a list of Python datetimes to datetime64 values
+
+    The values are returned unchanged if they contain anything other
+    than timezone-naive datetimes and missing values.
+
+    Parameters
+    ----------
+    values : list
+        The values to convert.
+
+    Returns
+    -------
+    :class:`numpy.ndarray` or list
+
+    '''
+    for value in values:
+        if value is not None and not (isinstance(value, datetime.datetime)
+                                      and value.tzinfo is None):
+            return values
+    return np.array(values, dtype='datetime64[us]')
+
 
 class CASDataMsgHandler(object):
     '''
@@ -88,7 +144,20 @@ class CASDataMsgHandler(object):
     The constructor must create the ``vars=`` parameter for the
     ``table.addtable`` CAS action and store it in the ``vars`` instance
     attribute.  The ``getrow`` method, must return a single row of data
-    values to be added to the data buffer.
+    values to be added to the data buffer.  Optionally, the ``getrows``
+    method can also be implemented to return blocks of rows as lists of
+    column values, which allows the buffer to be filled one column at a time.
+
+    The progress of an upload can be monitored by setting the ``progress``
+    attribute to a function.  It is called with a dictionary of measurements
+    after each batch is sent (``stage='batch'``) and once when all of the
+    data has been sent (``stage='total'``).  The batch dictionaries contain
+    the keys 'batch', 'rows', 'bytes', 'total_rows', 'fill_seconds' (the time
+    spent reading the data source and filling the buffer), 'send_seconds'
+    (the time spent sending the buffer and waiting for the server), and
+    'rows_per_second'.  The total dictionary contains 'batches', 'rows',
+    'bytes', 'seconds', 'server_seconds', 'rows_per_second', and
+    'bytes_per_second'.  The byte counts are estimated from the record size.
 
     Parameters
     ----------
@@ -97,13 +166,19 @@ class CASDataMsgHandler(object):
         the ``vars=`` argument to the ``table.addtable`` action.  Each dict should
         at least have the keys: name, rtype, and length.
     nrecs : int, optional
-        The number of records in the buffer.
+        The number of records in the buffer.  By default, the number of
+        records is computed from the estimated size of each record and the
+        ``cas.upload.buffer_bytes`` option, and the number of records sent
+        in each batch is adjusted using the ``cas.upload.batch_seconds`` option.
     reclen : int, optional
         The length of each record in the buffer.
     locale : string, optional
         The locale to use for messages.
     transformers : dict-of-functions
         Transformers to use for variables.  Keys are the column names.
+    progress : function, optional
+        Function called with a dictionary of measurements after each
+        batch of data is sent.
         Values are the function that does the transformation.
 
     Examples
@@ -155,7 +230,8 @@ class CASDataMsgHandler(object):
         ''' Generic object to hold data message handler arguments '''
         pass
 
-    def __init__(self, vars, nrecs=1000, reclen=None, locale=None, transformers=None):
+    def __init__(self, vars, nrecs=None, reclen=None, locale=None, transformers=None,
+                 progress=None):
         for item in vars:
             if item.get('type', '').upper() == 'SAS' and \
                     item.get('rtype', '').upper() == 'CHAR':
@@ -163,7 +239,7 @@ class CASDataMsgHandler(object):
                                 % item.get('name'))
         soptions = getsoptions(locale=locale)
         self._finished = False
-        self.nrecs = nrecs
+        self.progress = progress
         self.vars = copy.deepcopy(vars)
 
         if transformers is None:
@@ -200,11 +276,72 @@ class CASDataMsgHandler(object):
                 v['offset'] = next_offset
             next_offset = v['offset'] + (v['length'] * v.get('nvalues', 1))
 
-        _sw_error = clib.SW_CASError(a2n(soptions))
-        self._sw_databuffer = errorcheck(clib.SW_CASDataBuffer(int64(self.reclen),
-                                                               int64(self.nrecs),
-                                                               a2n(soptions), _sw_error),
-                                         _sw_error)
+        # Compute the number of records from the buffer size
+        self._auto_nrecs = nrecs is None
+        if nrecs is None:
+            nrecs = self._default_nrecs()
+        self.nrecs = nrecs
+
+        self._soptions = soptions
+        self._sw_databuffer = self._create_databuffer()
+
+    def _default_nrecs(self):
+        ''' Return the number of records that fit in ``cas.upload.buffer_bytes`` '''
+        budget = get_option('cas.upload.buffer_bytes')
+        if not budget:
+            return DEFAULT_NRECS
+        return int(max(1, min(budget // max(self._record_bytes(), 1), MAX_NRECS)))
+
+    def _record_bytes(self):
+        '''
+        Return the estimated number of bytes in each record
+
+        The default is the record length.  Data message handlers with
+        variable-length data can add the estimated size of the values.
+
+        Returns
+        -------
+        int
+
+        '''
+        return self.reclen
+
+    def _adapt_nrecs(self, nbuffrows, nrows, seconds):
+        '''
+        Return the number of records to send in the next batch
+
+        The size of the batch is scaled toward ``cas.upload.batch_seconds``
+        based on the time taken by the last batch.  Each step is limited
+        to half or double the current size and the result never exceeds
+        the number of records in the buffer.
+
+        Parameters
+        ----------
+        nbuffrows : int
+            The number of records requested for the last batch.
+        nrows : int
+            The number of records sent in the last batch.
+        seconds : float
+            The time taken to send the last batch and get the server's reply.
+
+        Returns
+        -------
+        int
+
+        '''
+        target = get_option('cas.upload.batch_seconds')
+        if not self._auto_nrecs or not target or nrows < nbuffrows or seconds <= 0:
+            return nbuffrows
+        size = nrows * target / seconds
+        size = min(max(size, nbuffrows / 2.0), nbuffrows * 2.0, self.nrecs)
+        return max(int(size), 1)
+
+    def _create_databuffer(self):
+        ''' Create a data buffer for `nrecs` records of length `reclen` '''
+        _sw_error = clib.SW_CASError(a2n(self._soptions))
+        return errorcheck(clib.SW_CASDataBuffer(int64(self.reclen), int64(self.nrecs),
+                                                a2n(self._soptions), _sw_error),
+                          _sw_error)
 
     @property
     def args(self):
@@ -240,61 +377,239 @@ class CASDataMsgHandler(object):
         if self._finished:
             raise SWATError('The data message handler has already been used.')
 
+        # Resolve the column writers again in case the variables changed
+        self._writers = None
+        self._start_progress()
+
+        if get_option('cas.upload.pipeline'):
+            return self._pipeline(connection)
+
         nbuffrows = self.nrecs
         inputrow = -1
-        row = 0
 
         # Loop until we're out of data (i.e., values = None)
         while True:
-            written = False
-
-            # populate buffer
-            for row in range(nbuffrows):
-                inputrow = inputrow + 1
-                try:
-                    values = self.getrow(inputrow)
-                except:  # noqa: E722
-                    import traceback
-                    traceback.print_exc()
-                    break
-                if values is None:
-                    row = row - 1
-                    break
-                try:
-                    self.write(row, values)
-                except:  # noqa: E722
-                    import traceback
-                    traceback.print_exc()
-                    break
-                written = True
+            started = time.time()
+            nrows, inputrow = self._fill(inputrow, nbuffrows)
+            fill_seconds = time.time() - started
 
             # send it
-            if written:
-                self.send(connection, row + 1)
-                res, conn = self.getone(connection)
-                if isinstance(res, CASRequest):
-                    continue
-                elif isinstance(res, CASResponse):
-                    if res.disposition.severity <= 1:
-                        messages = list(res.messages)
-                        while isinstance(res, CASResponse):
-                            res, conn = self.getone(connection)
-                            messages += res.messages
-                            if res.disposition.severity > 1:
-                                res.messages = messages
-                                break
-                        if isinstance(res, CASRequest):
-                            continue
-            else:
+            if not nrows:
                 break
 
+            started = time.time()
+            self.send(connection, nrows)
+            res, conn = self._next_request(connection)
+            seconds = time.time() - started
+            nbuffrows = self._adapt_nrecs(nbuffrows, nrows, seconds)
+            self._report_batch(nrows, fill_seconds, seconds)
+
             # If we failed for some reason, return the last response
             if isinstance(res, CASResponse) and res.disposition.severity > 1:
                 return (res, conn)
 
         # End it
         self.finish(connection)
-        return self.getone(connection)
+        return self._report_total(self.getone(connection))
+
+    def _pipeline(self, connection):
+        '''
+        Send data to the server while the next buffer is being filled
+
+        Two data buffers are used.  While one buffer is being sent
+        and the server is processing it, the next rows are read
+        from the data source and written into the other buffer in
+        a background thread.
+
+        Parameters
+        ----------
+        connection : :class:`CAS` object
+            Connection where the request came from.
+
+        Returns
+        -------
+        :class:`CASResponse` object
+
+        '''
+        from concurrent.futures import ThreadPoolExecutor
+
+        buffers = [self._sw_databuffer, self._create_databuffer()]
+        sizes = [self.nrecs, self.nrecs]
+
+        def fill(buf, inputrow, nbuffrows):
+            ''' Fill the given buffer and return the time it took '''
+            started = time.time()
+            nrows, inputrow = self._fill(inputrow, nbuffrows, buf=buf)
+            return nrows, inputrow, time.time() - started
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            nrows, inputrow, fill_seconds = fill(buffers[0], -1, sizes[0])
+
+            while nrows:
+                future = pool.submit(fill, buffers[1], inputrow, sizes[1])
+                try:
+                    started = time.time()
+                    self._send(connection, nrows, buffers[0])
+                    res, conn = self._next_request(connection)
+                    seconds = time.time() - started
+                finally:
+                    sent, sent_fill_seconds = nrows, fill_seconds
+                    nrows, inputrow, fill_seconds = future.result()
+
+                # The next buffer is already being filled, so a new size
+                # applies to the batch after it
+                sizes[0] = self._adapt_nrecs(sizes[0], sent, seconds)
+                sizes.reverse()
+                self._report_batch(sent, sent_fill_seconds, seconds)
+
+                # If we failed for some reason, return the last response
+                if isinstance(res, CASResponse) and res.disposition.severity > 1:
+                    return (res, conn)
+
+                buffers.reverse()
+
+        # End it
+        self.finish(connection)
+        return self._report_total(self.getone(connection))
+
+    def _start_progress(self):
+        ''' Reset the measurements reported to the progress callback '''
+        self._totals = dict(started=time.time(), batches=0, rows=0,
+                            record_bytes=self._record_bytes() if self.progress else 0)
+
+    def _report_batch(self, nrows, fill_seconds, send_seconds):
+        '''
+        Call the progress callback with the measurements of a batch
+
+        Parameters
+        ----------
+        nrows : int
+            The number of rows sent.
+        fill_seconds : float
+            The time taken to fill the buffer.
+        send_seconds : float
+            The time taken to send the buffer and get the server's reply.
+
+        '''
+        totals = self._totals
+        totals['batches'] += 1
+        totals['rows'] += nrows
+        if self.progress is None:
+            return
+        seconds = fill_seconds + send_seconds
+        self.progress(dict(stage='batch', batch=totals['batches'], rows=nrows,
+                           bytes=nrows * totals['record_bytes'],
+                           total_rows=totals['rows'], fill_seconds=fill_seconds,
+                           send_seconds=send_seconds,
+                           rows_per_second=nrows / seconds if seconds else None))
+
+    def _report_total(self, out):
+        '''
+        Call the progress callback with the measurements of the upload
+
+        Parameters
+        ----------
+        out : (:class:`CASResponse`, :class:`CAS`)
+            The final response from the server.
+
+        Returns
+        -------
+        (:class:`CASResponse`, :class:`CAS`)
+            The `out` argument
+
+        '''
+        if self.progress is None:
+            return out
+        totals = self._totals
+        seconds = time.time() - totals['started']
+        nbytes = totals['rows'] * totals['record_bytes']
+        server_seconds = None
+        if isinstance(out[0], CASResponse):
+            server_seconds = out[0].performance.elapsed_time
+        self.progress(dict(stage='total', batches=totals['batches'],
+                           rows=totals['rows'], bytes=nbytes, seconds=seconds,
+                           server_seconds=server_seconds,
+                           rows_per_second=totals['rows'] / seconds if seconds else None,
+                           bytes_per_second=nbytes / seconds if seconds else None))
+        return out
+
+    def _fill(self, inputrow, nbuffrows, buf=None):
+        '''
+        Fill a buffer with the next rows from the data source
+
+        Parameters
+        ----------
+        inputrow : int
+            The input row number of the last row that was read.
+        nbuffrows : int
+            The number of rows in the buffer.
+        buf : SWIG CASDataBuffer, optional
+            The buffer to fill.  By default, the rows are written
+            using :meth:`write` or :meth:`writecolumns`.
+
+        Returns
+        -------
+        (int, int)
+            The number of rows to send and the input row number of
+            the last row that was read
+
+        '''
+        if self._use_getrows():
+            writecolumns = self.writecolumns
+            if buf is not None:
+                writecolumns = functools.partial(self._write_columns, buf)
+            nrows = self._fill_columns(inputrow + 1, nbuffrows, writecolumns)
+            return nrows, inputrow + nrows
+
+        write = self.write
+        if buf is not None:
+            write = functools.partial(self._write_row, buf)
+
+        nrows = 0
+        for row in range(nbuffrows):
+            inputrow = inputrow + 1
+            try:
+                values = self.getrow(inputrow)
+            except:  # noqa: E722
+                import traceback
+                traceback.print_exc()
+                break
+            if values is None:
+                break
+            try:
+                write(row, values)
+            except:  # noqa: E722
+                import traceback
+                traceback.print_exc()
+                break
+            nrows = row + 1
+
+        return nrows, inputrow
+
+    def _next_request(self, connection):
+        '''
+        Wait for the server to request more data
+
+        Parameters
+        ----------
+        connection : :class:`CAS` object
+            The connection that is receiving the data.
+
+        Returns
+        -------
+        (:class:`CASRequest` or :class:`CASResponse`, :class:`CAS`)
+
+        '''
+        res, conn = self.getone(connection)
+        if isinstance(res, CASResponse) and res.disposition.severity <= 1:
+            messages = list(res.messages)
+            while isinstance(res, CASResponse):
+                res, conn = self.getone(connection)
+                messages += res.messages
+                if res.disposition.severity > 1:
+                    res.messages = messages
+                    break
+        return res, conn
 
     def write(self, row, values):
         '''
@@ -313,8 +628,145 @@ class CASDataMsgHandler(object):
             If any error occurs in writing the data
 
         '''
+        self._write_row(self._sw_databuffer, row, values)
+
+    def _write_row(self, buf, row, values):
+        ''' Write a row of values to the given buffer '''
         row = int64(row)
+        for writer, value in zip(self._get_writers(buf), values):
+            writer(row, value)
+
+    def writecolumns(self, row, columns):
+        '''
+        Write blocks of column values to the buffer starting at the given row
+
+        The type of each column is resolved once for the entire block.
+        Numeric and datetime columns are converted using NumPy before
+        being written to the buffer.
+
+        Parameters
+        ----------
+        row : int
+            The row (or record) number of the first value in each column.
+        columns : list of array-likes
+            The values to write.  There must be one array-like for each
+            variable, and all of them must have the same length.
+
+        Raises
+        ------
+        :exc:`SWATError`
+            If any error occurs in writing the data
+
+        '''
+        self._write_columns(self._sw_databuffer, row, columns)
+
+    def _write_columns(self, buf, row, columns):
+        ''' Write blocks of column values to the given buffer '''
+        for v, writer, values in zip(self.vars, self._get_writers(buf), columns):
+            self._write_column(buf, v, writer, int64(row), values)
+
+    def _write_column(self, buf, v, writer, row, values):
+        '''
+        Write one block of column values to the buffer
+
+        Parameters
+        ----------
+        buf : SWIG CASDataBuffer
+            The buffer to write to.
+        v : dict
+            The variable definition.
+        writer : function
+            The function that writes a single value of the column.
+        row : int
+            The row number of the first value.
+        values : array-like
+            The values to write.
+
+        '''
+        vtype = v.get('type', '').upper()
+        vrtype = v.get('rtype', '').upper()
+        transformer = self.transformers.get(v['name'])
+        length = int64(v['length'])
+        offset = int64(v['offset'])
+
+        ints = None
+        if vrtype == 'CHAR' or vtype in ['VARCHAR', 'CHAR', 'BINARY', 'VARBINARY']:
+            pass
+
+        elif vrtype == 'NUMERIC' and vtype in ['INT32', 'DATE']:
+            if length <= 4:
+                ints = buf.setInt32
+
+        elif vrtype == 'NUMERIC' and vtype in ['INT64', 'DATETIME', 'TIME']:
+            if length <= 8:
+                ints = buf.setInt64
+
+        elif length <= 8 and transformer is None:
+            try:
+                nums = np.asarray(values, dtype='float64').tolist()
+            except (TypeError, ValueError):
+                nums = None
+            if nums is not None:
+                setter = buf.setDouble
+                for i, value in enumerate(nums):
+                    errorcheck(setter(row + i, offset, value), buf)
+                return
+
+        if ints is not None:
+            out = None
+            if transformer is None and pd.api.types.is_integer_dtype(values) \
+                    and not pd.api.types.is_extension_array_dtype(values):
+                out = np.asarray(values, dtype='int64')
+                missing = np.zeros(len(out), dtype=bool)
+            elif vtype == 'DATETIME' and transformer in (None, str2cas_timestamp) \
+                    and pd.api.types.is_datetime64_any_dtype(values):
+                out, missing = _datetime2cas_array(values)
+            if out is not None:
+                out = out.tolist()
+                for i, value in enumerate(out):
+                    if missing[i]:
+                        writer(row + i, None)
+                    else:
+                        errorcheck(ints(row + i, offset, value), buf)
+                return
+
+        for i, value in enumerate(values):
+            writer(row + i, value)
+
+    def _get_writers(self, buf):
+        '''
+        Return the list of functions that write a value of each column
+
+        Parameters
+        ----------
+        buf : SWIG CASDataBuffer
+            The buffer that the functions write to.
+
+        '''
+        writers = getattr(self, '_writers', None)
+        if writers is None:
+            writers = self._writers = {}
+        if id(buf) not in writers:
+            writers[id(buf)] = [self._column_writer(v, buf) for v in self.vars]
+        return writers[id(buf)]
+
+    def _column_writer(self, v, buf):
+        '''
+        Create a function that writes a single value of a column to the buffer
+
+        Parameters
+        ----------
+        v : dict
+            The variable definition.
+        buf : SWIG CASDataBuffer
+            The buffer to write to.
 
+        Returns
+        -------
+        function
+            Function with the signature ``writer(row, value)``
+
+        '''
         def identity(val):
             ''' Return `val` '''
             return val
@@ -326,89 +778,164 @@ class CASDataMsgHandler(object):
             except IndexError:
                 return default
 
-        for col in range(len(self.vars)):
-            v = self.vars[col]
-            offset = int64(v['offset'])
-            length = int64(v['length'])
-            value = values[col]
-            transformer = self.transformers.get(v['name'], identity)
-            vtype = v.get('type', '').upper()
-            vrtype = v.get('rtype', '').upper()
-            if transformer is identity:
-                if vtype == 'DATE' and isinstance(value, (datetime.datetime,
-                                                          datetime.date)):
-                    value = python2cas_date(value)
-                elif vtype == 'TIME' and isinstance(value, (datetime.datetime,
-                                                            datetime.time)):
-                    value = python2cas_time(value)
-                elif vtype == 'DATETIME' and isinstance(value, (datetime.date,
-                                                                datetime.time,
-                                                                datetime.datetime)):
-                    value = python2cas_datetime(value, tz='UTC')
-            if vrtype == 'CHAR' or vtype in ['VARCHAR', 'CHAR', 'BINARY', 'VARBINARY']:
-                if vtype in ['BINARY', 'VARBINARY'] \
-                        and hasattr(self._sw_databuffer, 'setBinaryFromBase64'):
+        name = v['name']
+        offset = int64(v['offset'])
+        length = int64(v['length'])
+        transformer = self.transformers.get(name, identity)
+        vtype = v.get('type', '').upper()
+        vrtype = v.get('rtype', '').upper()
+
+        def convert_date(value):
+            ''' Convert Python dates '''
+            if isinstance(value, (datetime.datetime, datetime.date)):
+                return python2cas_date(value)
+            return value
+
+        def convert_time(value):
+            ''' Convert Python times '''
+            if isinstance(value, (datetime.datetime, datetime.time)):
+                return python2cas_time(value)
+            return value
+
+        def convert_datetime(value):
+            ''' Convert Python datetimes '''
+            if isinstance(value, (datetime.date, datetime.time, datetime.datetime)):
+                return python2cas_datetime(value, tz='UTC')
+            return value
+
+        convert = identity
+        if transformer is identity:
+            convert = dict(DATE=convert_date, TIME=convert_time,
+                           DATETIME=convert_datetime).get(vtype, identity)
+
+        if vrtype == 'CHAR' or vtype in ['VARCHAR', 'CHAR', 'BINARY', 'VARBINARY']:
+            if vtype in ['BINARY', 'VARBINARY'] \
+                    and hasattr(buf, 'setBinaryFromBase64'):
+                setter = buf.setBinaryFromBase64
+
+                def writer(row, value):
+                    ''' Write a binary value '''
                     if isinstance(value, (binary_types, text_types)):
-                        errorcheck(self._sw_databuffer.setBinaryFromBase64(row, offset,
-                            a2n(base64.b64encode(a2b(transformer(value))))),  # noqa: E128
-                            self._sw_databuffer)
+                        value = a2n(base64.b64encode(a2b(transformer(value))))
                     else:
-                        errorcheck(self._sw_databuffer.setBinaryFromBase64(row,
-                                                                           offset,
-                                                                           a2n('')),
-                                   self._sw_databuffer)
-                else:
+                        value = a2n('')
+                    errorcheck(setter(row, offset, value), buf)
+            else:
+                setter = buf.setString
+
+                def writer(row, value):
+                    ''' Write a character value '''
                     if isinstance(value, (text_types, binary_types)):
-                        errorcheck(self._sw_databuffer.setString(row, offset,
-                                                                 a2n(transformer(value))),
-                                   self._sw_databuffer)
+                        value = a2n(transformer(value))
                     else:
-                        errorcheck(self._sw_databuffer.setString(row, offset, a2n('')),
-                                   self._sw_databuffer)
-            elif vrtype == 'NUMERIC' and vtype in ['INT32', 'DATE']:
+                        value = a2n('')
+                    errorcheck(setter(row, offset, value), buf)
+
+        elif vrtype == 'NUMERIC' and vtype in ['INT32', 'DATE', 'INT64',
+                                               'DATETIME', 'TIME']:
+            if vtype in ['INT32', 'DATE']:
+                setter, size, cast, bits = buf.setInt32, 4, int32, 32
+            else:
+                setter, size, cast, bits = buf.setInt64, 8, int64, 64
+
+            def writer(row, value):
+                ''' Write an integer value '''
+                value = convert(value)
                 if pd.isnull(value):
                     value = get_option('cas.missing.%s' % vtype.lower())
-                    warnings.warn(('Missing value found in 32-bit '
-                                   + 'integer-based column \'%s\'.\n' % v['name'])
+                    warnings.warn(('Missing value found in %d-bit ' % bits
+                                   + 'integer-based column \'%s\'.\n' % name)
                                   + ('Substituting cas.missing.%s option value (%s).' %
                                      (vtype.lower(), value)),
                                   RuntimeWarning)
-                if length > 4:
-                    for i in range(int64(length / 4)):
-                        errorcheck(self._sw_databuffer.setInt32(row, offset + (i * 4),
-                                   int32(transformer(get(value, i, 0)))),
-                                   self._sw_databuffer)
+                    # The substituted value is already a CAS value
+                    if length <= size:
+                        errorcheck(setter(row, offset, cast(value)), buf)
+                        return
+                if length > size:
+                    for i in range(int64(length / size)):
+                        errorcheck(setter(row, offset + (i * size),
+                                          cast(transformer(get(value, i, 0)))), buf)
                 else:
-                    errorcheck(self._sw_databuffer.setInt32(row, offset,
-                                                            int32(transformer(value))),
-                               self._sw_databuffer)
-            elif vrtype == 'NUMERIC' and vtype in ['INT64', 'DATETIME', 'TIME']:
-                if pd.isnull(value):
-                    value = get_option('cas.missing.%s' % vtype.lower())
-                    warnings.warn(('Missing value found in 64-bit '
-                                   + 'integer-based column \'%s\'.\n' % v['name'])
-                                  + ('Substituting cas.missing.%s option value (%s).' %
-                                     (vtype.lower(), value)),
-                                  RuntimeWarning)
-                if length > 8:
-                    for i in range(int64(length / 8)):
-                        errorcheck(self._sw_databuffer.setInt64(row, offset + (i * 8),
-                                   int64(transformer(get(value, i, 0)))),
-                                   self._sw_databuffer)
-                else:
-                    errorcheck(self._sw_databuffer.setInt64(row, offset,
-                                                            int64(transformer(value))),
-                               self._sw_databuffer)
-            else:
+                    errorcheck(setter(row, offset, cast(transformer(value))), buf)
+
+        else:
+            setter = buf.setDouble
+
+            def writer(row, value):
+                ''' Write a double value '''
+                value = convert(value)
+                if value is None and transformer is identity:
+                    value = np.nan
                 if length > 8:
                     for i in range(int64(length / 8)):
-                        errorcheck(self._sw_databuffer.setDouble(row, offset + (i * 8),
-                                   float64(transformer(get(value, i, np.nan)))),
-                                   self._sw_databuffer)
+                        errorcheck(setter(row, offset + (i * 8),
+                                          float64(transformer(get(value, i, np.nan)))),
+                                   buf)
                 else:
-                    errorcheck(self._sw_databuffer.setDouble(row, offset,
-                               float64(transformer(value))),
-                               self._sw_databuffer)
+                    errorcheck(setter(row, offset, float64(transformer(value))), buf)
+
+        return writer
+
+    def _use_getrows(self):
+        '''
+        Return True if the handler provides blocks of columns using ``getrows``
+
+        A subclass that overrides ``getrow`` without also overriding
+        ``getrows`` uses the row-oriented path.
+
+        '''
+        for cls in type(self).__mro__:
+            if 'getrows' in vars(cls):
+                return cls is not CASDataMsgHandler
+            if 'getrow' in vars(cls):
+                return False
+        return False
+
+    def _fill_columns(self, inputrow, nbuffrows, writecolumns=None):
+        '''
+        Fill the buffer using blocks of columns from ``getrows``
+
+        Parameters
+        ----------
+        inputrow : int
+            The input row number of the first row to write.
+        nbuffrows : int
+            The number of rows in the buffer.
+        writecolumns : function, optional
+            The function used to write the blocks of columns.
+            The default is :meth:`writecolumns`.
+
+        Returns
+        -------
+        int
+            The number of rows written to the buffer
+
+        '''
+        if writecolumns is None:
+            writecolumns = self.writecolumns
+
+        row = 0
+        while row < nbuffrows:
+            try:
+                columns = self.getrows(inputrow + row, nbuffrows - row)
+            except:  # noqa: E722
+                import traceback
+                traceback.print_exc()
+                break
+            if not columns:
+                break
+            nrows = len(columns[0])
+            if not nrows:
+                break
+            try:
+                writecolumns(row, columns)
+            except:  # noqa: E722
+                import traceback
+                traceback.print_exc()
+                break
+            row = row + nrows
+        return row
 
     def getone(self, connection, **kwargs):
         '''
@@ -441,8 +968,11 @@ class CASDataMsgHandler(object):
             The number of records to send.
 
         '''
-        errorcheck(self._sw_databuffer.send(
-            connection._sw_connection, nrecs), self._sw_databuffer)
+        self._send(connection, nrecs, self._sw_databuffer)
+
+    def _send(self, connection, nrecs, buf):
+        ''' Send the records in the given buffer to the connection '''
+        errorcheck(buf.send(connection._sw_connection, nrecs), buf)
 
     def finish(self, connection):
         '''
@@ -476,6 +1006,30 @@ class CASDataMsgHandler(object):
         '''
         raise NotImplementedError
 
+    def getrows(self, row, nrows):
+        '''
+        Return a block of rows as a list of column values
+
+        Subclasses can override this method in addition to ``getrow``
+        to fill the buffer one column at a time, which is much faster
+        than filling it one row at a time.
+
+        Parameters
+        ----------
+        row : int
+            The row number of the first row to retrieve.
+        nrows : int
+            The maximum number of rows to retrieve.
+
+        Returns
+        -------
+        list-of-array-likes
+            One array-like of values for each variable, or None if
+            there is no more data
+
+        '''
+        raise NotImplementedError
+
 
 class PandasDataFrame(CASDataMsgHandler):
     '''
@@ -489,6 +1043,7 @@ class PandasDataFrame(CASDataMsgHandler):
        The number of rows to allocate in the buffer.  This can be
        smaller than the number of totals rows since they are uploaded
        in batches `nrecs` long.
+       By default, it is computed from the estimated size of each row.
 
     See Also
     --------
@@ -501,7 +1056,7 @@ class PandasDataFrame(CASDataMsgHandler):
 
     '''
 
-    def __init__(self, data, nrecs=1000, dtype=None, labels=None,
+    def __init__(self, data, nrecs=None, dtype=None, labels=None,
                  formats=None, transformers=None):
         if transformers is None:
             transformers = {}
@@ -654,6 +1209,18 @@ class PandasDataFrame(CASDataMsgHandler):
         super(PandasDataFrame, self).__init__(
             variables, nrecs=nrecs, reclen=reclen, transformers=transformers)
 
+    def _record_bytes(self):
+        ''' Add the average length of the character values in the first rows '''
+        nbytes = self.reclen
+        sample = self.data.head(DEFAULT_NRECS)
+        for v in self.vars:
+            if v['rtype'].upper() != 'CHAR' or v['name'] not in sample:
+                continue
+            values = sample[v['name']].dropna()
+            if len(values):
+                nbytes += int(values.astype(str).str.len().mean())
+        return nbytes
+
     def getrow(self, row):
         '''
         Get a row of values from the data source
@@ -696,6 +1263,52 @@ class PandasDataFrame(CASDataMsgHandler):
 
         return
 
+    def getrows(self, row, nrows):
+        '''
+        Get a block of rows from the data source as a list of columns
+
+        The block does not extend past the end of the current batch of
+        a chunked data source.
+
+        Parameters
+        ----------
+        row : int
+            The row index of the first row to return.
+        nrows : int
+            The maximum number of rows to return.
+
+        Returns
+        -------
+        list-of-:class:`pandas.Series`
+            One series of values for each column
+
+        '''
+        if self.data is None:
+            return
+
+        if row == 0:
+            self._batchstart = 0
+
+        # See if we need another batch
+        batchrow = row - self._batchstart
+        if batchrow >= len(self.data):
+            self.data = None
+            try:
+                self.data = next(self.reader)
+                if self.data.index.name is None:
+                    self.data = self.data.reset_index(drop=True)
+                else:
+                    self.data = self.data.reset_index()
+            except StopIteration:
+                return
+            self._batchstart = row
+            if not len(self.data):
+                return
+            return self.getrows(row, nrows)
+
+        block = self.data.iloc[batchrow:batchrow + nrows]
+        return [block.iloc[:, i] for i in range(block.shape[1])]
+
 
 class SAS7BDAT(PandasDataFrame):
     '''
@@ -721,7 +1334,7 @@ class SAS7BDAT(PandasDataFrame):
 
     '''
 
-    def __init__(self, path, nrecs=1000, transformers=None, **kwargs):
+    def __init__(self, path, nrecs=None, transformers=None, **kwargs):
         import sas7bdat
         super(SAS7BDAT, self).__init__(
             sas7bdat.SAS7BDAT(path, **kwargs).to_data_frame(), nrecs=nrecs,
@@ -752,8 +1365,8 @@ class CSV(PandasDataFrame):
 
     '''
 
-    def __init__(self, path, nrecs=1000, transformers=None, **kwargs):
-        kwargs.setdefault('chunksize', nrecs)
+    def __init__(self, path, nrecs=None, transformers=None, **kwargs):
+        kwargs.setdefault('chunksize', nrecs or DEFAULT_NRECS)
         try:
             super(CSV, self).__init__(pd.io.parsers.read_csv(path, **kwargs),
                                       nrecs=nrecs, transformers=transformers)
@@ -787,8 +1400,8 @@ class Text(PandasDataFrame):
 
     '''
 
-    def __init__(self, path, nrecs=1000, transformers=None, **kwargs):
-        kwargs.setdefault('chunksize', nrecs)
+    def __init__(self, path, nrecs=None, transformers=None, **kwargs):
+        kwargs.setdefault('chunksize', nrecs or DEFAULT_NRECS)
         try:
             super(Text, self).__init__(pd.io.parsers.read_table(path, **kwargs),
                                        nrecs=nrecs, transformers=transformers)
@@ -822,8 +1435,8 @@ class FWF(PandasDataFrame):
 
     '''
 
-    def __init__(self, path, nrecs=1000, transformers=None, **kwargs):
-        kwargs.setdefault('chunksize', nrecs)
+    def __init__(self, path, nrecs=None, transformers=None, **kwargs):
+        kwargs.setdefault('chunksize', nrecs or DEFAULT_NRECS)
         try:
             super(FWF, self).__init__(pd.io.parsers.read_fwf(path, **kwargs),
                                       nrecs=nrecs, transformers=transformers)
@@ -857,7 +1470,7 @@ class JSON(PandasDataFrame):
 
     '''
 
-    def __init__(self, path, nrecs=1000, transformers=None, **kwargs):
+    def __init__(self, path, nrecs=None, transformers=None, **kwargs):
         super(JSON, self).__init__(pd.read_json(path, **kwargs),
                                    nrecs=nrecs, transformers=transformers)
 
@@ -888,7 +1501,7 @@ class HTML(PandasDataFrame):
 
     '''
 
-    def __init__(self, path, index=0, nrecs=1000, transformers=None, **kwargs):
+    def __init__(self, path, index=0, nrecs=None, transformers=None, **kwargs):
         super(HTML, self).__init__(pd.read_html(path, **kwargs)[index],
                                    nrecs=nrecs, transformers=transformers)
 
@@ -915,7 +1528,7 @@ class SQLTable(PandasDataFrame):
 
     '''
 
-    def __init__(self, table, engine, nrecs=1000, transformers=None, **kwargs):
+    def __init__(self, table, engine, nrecs=None, transformers=None, **kwargs):
         super(SQLTable, self).__init__(
             pd.io.sql.read_sql_table(table, engine, **kwargs),
             nrecs=nrecs, transformers=transformers)
@@ -971,7 +1584,7 @@ class SQLQuery(PandasDataFrame):
 
     '''
 
-    def __init__(self, query, engine, nrecs=1000, transformers=None, **kwargs):
+    def __init__(self, query, engine, nrecs=None, transformers=None, **kwargs):
         super(SQLQuery, self).__init__(
             pd.io.sql.read_sql_query(query, engine, **kwargs),
             nrecs=nrecs, transformers=transformers)
@@ -1027,7 +1640,7 @@ class Excel(PandasDataFrame):
 
     '''
 
-    def __init__(self, path, sheet=0, nrecs=1000, transformers=None, **kwargs):
+    def __init__(self, path, sheet=0, nrecs=None, transformers=None, **kwargs):
         super(Excel, self).__init__(pd.read_excel(path, sheet, **kwargs),
                                     nrecs=nrecs, transformers=transformers)
 
@@ -1054,7 +1667,7 @@ class Clipboard(PandasDataFrame):
 
     '''
 
-    def __init__(self, nrecs=1000, transformers=None, **kwargs):
+    def __init__(self, nrecs=None, transformers=None, **kwargs):
         super(Clipboard, self).__init__(pd.read_clipboard(**kwargs),
                                         nrecs=nrecs, transformers=transformers)
 
@@ -1083,6 +1696,12 @@ class DBAPI(CASDataMsgHandler):
     nrecs : int, optional
         The number of records to fetch and upload at a time.
 
+    Notes
+    -----
+    Rows are fetched in blocks using ``cursor.fetchmany``.  If the cursor
+    has a ``fetch_record_batch`` method (such as ADBC cursors), the rows
+    are read as Apache Arrow record batches instead.
+
     See Also
     --------
     :class:`CASDataMsgHandler`
@@ -1093,9 +1712,10 @@ class DBAPI(CASDataMsgHandler):
 
     '''
 
-    def __init__(self, module, cursor, nrecs=1000, transformers=None):
+    def __init__(self, module, cursor, nrecs=None, transformers=None):
         self.cursor = cursor
-        self.cursor.arraysize = nrecs
+        self._pending = None
+        self._batches = None
 
         # array of functions to transform data types that don't match SAS types
         if transformers is None:
@@ -1138,7 +1758,7 @@ class DBAPI(CASDataMsgHandler):
         for item in self._get_description(module):
             name, rtype, dtype, length = typemap(item)
             if dtype == 'DATETIME' and name not in transformers:
-                transformers[name] = lambda x: str2cas_timestamp(x)
+                transformers[name] = str2cas_timestamp
 
             variables.append({'name': name, 'rtype': rtype, 'type': dtype,
                               'offset': reclen, 'length': length})
@@ -1158,6 +1778,7 @@ class DBAPI(CASDataMsgHandler):
 
         super(DBAPI, self).__init__(variables, nrecs=nrecs, reclen=reclen,
                                     transformers=transformers)
+        self.cursor.arraysize = self.nrecs
 
     def _get_description(self, module):
         ''' Make SQLite's description behave properly '''
@@ -1190,6 +1811,151 @@ class DBAPI(CASDataMsgHandler):
             return row
         return self.cursor.fetchone()
 
+    def getrows(self, row, nrows):
+        '''
+        Return a block of rows from the data source as a list of columns
+
+        Parameters
+        ----------
+        row : int
+            Index of the first row to return.
+        nrows : int
+            The maximum number of rows to return.
+
+        Returns
+        -------
+        list of array-likes
+            One array of values for each column
+
+        '''
+        if self._pending is None:
+            self._pending = self._fetch(nrows)
+            if self._pending is None:
+                return
+
+        columns = [x[:nrows] for x in self._pending]
+        self._pending = [x[nrows:] for x in self._pending]
+        if len(self._pending[0]) == 0:
+            self._pending = None
+
+        for i, v in enumerate(self.vars):
+            if v['type'] == 'DATETIME' \
+                    and self.transformers.get(v['name']) is str2cas_timestamp:
+                columns[i] = _python2datetime64(columns[i])
+
+        return columns
+
+    def _fetch(self, nrows):
+        '''
+        Fetch the next block of rows from the cursor
+
+        Parameters
+        ----------
+        nrows : int
+            The number of rows to fetch.  Arrow record batches are
+            returned in the size chosen by the driver.
+
+        Returns
+        -------
+        list of array-likes
+            One array of values for each column, or None at the end
+            of the result set
+
+        '''
+        if self._batches is None and not hasattr(self, '_firstrow') \
+                and hasattr(self.cursor, 'fetch_record_batch'):
+            self._batches = self.cursor.fetch_record_batch()
+
+        if self._batches is not None:
+            while True:
+                try:
+                    batch = self._batches.read_next_batch()
+                except StopIteration:
+                    return
+                if batch.num_rows:
+                    return [col.to_numpy(zero_copy_only=False)
+                            for col in batch.columns]
+
+        rows = []
+        if hasattr(self, '_firstrow'):
+            rows.append(self._firstrow)
+            del self._firstrow
+            if rows[0] is None:
+                return
+            nrows = nrows - 1
+        if nrows > 0:
+            rows.extend(self.cursor.fetchmany(nrows))
+        if not rows:
+            return
+        return [list(x) for x in zip(*rows)]
+
+
+def _image_row(record, row, subdirs):
+    '''
+    Read or encode an image and return its row of values
+
+    This is a module-level function so that it can be run in a
+    process pool.
+
+    Parameters
+    ----------
+    record : str, :class:`numpy.ndarray`, or :class:`PIL.Image.Image`
+        The image file path or image data.
+    row : int
+        The row index of the image.
+    subdirs : bool
+        Whether to use the name of the image's directory as the label.
+
+    Returns
+    -------
+    list-of-any
+        One row of data values
+
+    '''
+    # Convert Path instances to str for Py2.7 compatibility.
+    if type(record).__module__ == 'pathlib':
+        record = str(record)
+
+    # Default value.  Will be overridden if disk location is known.
+    path = 'Image_%d.png' % (row + 1)
+
+    # Input is path to an image on disk.  Can just read bytes directly.
+    if isinstance(record, str):
+        with open(record, 'rb') as f:
+            image = f.read()
+        path = record
+    else:
+        # Otherwise, PIL package is required to format data as an image.
+        if PIL is None:
+            raise RuntimeError(
+                'Formatting data as images requires the Pillow package '
+                '(https://pypi.org/project/Pillow/).')
+
+        # Convert Numpy array to Image
+        if isinstance(record, np.ndarray):
+            record = PIL.Image.fromarray(record)
+
+        # Get bytes from Image instance
+        if isinstance(record, PIL.Image.Image):
+            buffer = io.BytesIO()
+
+            # If image was loaded from disk it may have attribute with filename
+            if hasattr(record, 'filename'):
+                record.save(buffer, format=record.format)
+                path = record.filename
+            else:
+                record.save(buffer, format='png')
+            buffer.seek(0)
+            image = buffer.read()
+
+    # Use folder name if images loaded from subdirectories
+    label = os.path.basename(os.path.dirname(path)) if subdirs else ''
+
+    image_type = os.path.splitext(path)[-1].lower().lstrip('.')
+    size = len(image)
+
+    return [image, label, size, path, image_type, row + 1]
+
 
 class Image(CASDataMsgHandler):
     '''
@@ -1213,10 +1979,24 @@ class Image(CASDataMsgHandler):
        The number of rows to allocate in the buffer.  This can be
        smaller than the number of totals rows since they are uploaded
        in batches `nrecs` long.
+       By default, it is computed from the estimated size of each row.
     subdirs : bool, optional
         Whether to search subdirectories for additional images.  Only applies when
         `data` is a path to a directory.  If images are read from subdirectories, the
         name of the subdirectory will be used as the image class label.
+    workers : int, optional
+        The number of workers used to read and encode images ahead of the
+        buffer being filled.  By default, images are read one at a time
+        as each row is requested.
+    pool : str, optional
+        The type of worker pool: 'thread' or 'process'.  A process pool
+        avoids contention for the Python interpreter when images are
+        encoded from arrays or Pillow images, but the images must be
+        sent to the worker processes.
+    prefetch : int, optional
+        The maximum number of images being read or held ahead of the
+        buffer.  This bounds the memory used by the workers.  The default
+        is twice the number of workers.
 
     See Also
     --------
@@ -1245,9 +2025,17 @@ class Image(CASDataMsgHandler):
     >>> conn.addtable(table='mytable', **dmh.args.addtable).casTable
     ... CASTable('MYTABLE', caslib='CASUSER(user)')
 
+    Read and encode the images using four worker processes:
+
+    >>> dmh = Image(arrays, workers=4, pool='process')
+
     '''   # noqa: E501
 
-    def __init__(self, data, nrecs=1000, subdirs=True):
+    def __init__(self, data, nrecs=None, subdirs=True, workers=None, pool='thread',
+                 prefetch=None):
+        if pool not in ['thread', 'process']:
+            raise SWATError('Unrecognized pool type: %s' % pool)
+
         # To maintain Py2.7 compatibility, use strings instead of Paths.
         if type(data).__module__ == 'pathlib':
             data = str(data)
@@ -1277,6 +2065,11 @@ class Image(CASDataMsgHandler):
             self._data = list(data)
 
         self._subdirs = subdirs
+        self._workers = workers
+        self._pool_type = pool
+        self._prefetch = max(prefetch or 2 * (workers or 0), 1)
+        self._pool = None
+        self._queue = collections.deque()
 
         variables = [
             dict(name='_image_', rtype='CHAR', type='VARBINARY'),
@@ -1289,6 +2082,25 @@ class Image(CASDataMsgHandler):
 
         super(Image, self).__init__(variables, nrecs=nrecs)
 
+    def _record_bytes(self):
+        ''' Add the average size of the first images '''
+        sizes = []
+        for record in self._data[:10]:
+            if type(record).__module__ == 'pathlib':
+                record = str(record)
+            if isinstance(record, str):
+                try:
+                    sizes.append(os.path.getsize(record))
+                except OSError:
+                    pass
+            elif isinstance(record, np.ndarray):
+                sizes.append(record.nbytes)
+            elif PIL is not None and isinstance(record, PIL.Image.Image):
+                sizes.append(record.width * record.height * len(record.getbands()))
+        if not sizes:
+            return self.reclen
+        return self.reclen + sum(sizes) // len(sizes)
+
     def getrow(self, row):
         """Get a row of values from the data source
 
@@ -1304,50 +2116,70 @@ class Image(CASDataMsgHandler):
 
         """
         if row >= len(self._data):
+            self._shutdown()
             return
 
-        record = self._data[row]
+        if not self._workers:
+            return _image_row(self._data[row], row, self._subdirs)
 
-        # Convert Path instances to str for Py2.7 compatibility.
-        if type(record).__module__ == 'pathlib':
-            record = str(record)
+        return self._submit(row).result()
 
-        # Default value.  Will be overridden if disk location is known.
-        path = 'Image_%d.png' % (row + 1)
+    def _submit(self, row):
+        """Return the future for `row` and submit the rows after it
 
-        # Input is path to an image on disk.  Can just read bytes directly.
-        if isinstance(record, str):
-            with open(record, 'rb') as f:
-                image = f.read()
-            path = record
-        else:
-            # Otherwise, PIL package is required to format data as an image.
-            if PIL is None:
-                raise RuntimeError(
-                    'Formatting data as images requires the Pillow package '
-                    '(https://pypi.org/project/Pillow/).')
-
-            # Convert Numpy array to Image
-            if isinstance(record, np.ndarray):
-                record = PIL.Image.fromarray(record)
-
-            # Get bytes from Image instance
-            if isinstance(record, PIL.Image.Image):
-                buffer = io.BytesIO()
-
-                # If image was loaded from disk it may have attribute with filename
-                if hasattr(record, 'filename'):
-                    record.save(buffer, format=record.format)
-                    path = record.filename
-                else:
-                    record.save(buffer, format='png')
-                buffer.seek(0)
-                image = buffer.read()
+        Images are submitted in order and at most `prefetch` of them are
+        in flight at a time.  If the requested row is not the next one
+        in the queue, the queued images are discarded.
 
-        # Use folder name if images loaded from subdirectories
-        label = os.path.basename(os.path.dirname(path)) if self._subdirs else ''
+        Parameters
+        ----------
+        row : int
+            The row index to return.
 
-        image_type = os.path.splitext(path)[-1].lower().lstrip('.')
-        size = len(image)
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
 
-        return [image, label, size, path, image_type, row + 1]
+        """
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+            if self._pool_type == 'process':
+                self._pool = ProcessPoolExecutor(max_workers=self._workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self._workers)
+
+        if not self._queue or self._queue[0][0] != row:
+            for item in self._queue:
+                item[1].cancel()
+            self._queue.clear()
+            self._nextrow = row
+
+        while len(self._queue) < self._prefetch and self._nextrow < len(self._data):
+            self._queue.append((self._nextrow,
+                                self._pool.submit(_image_row,
+                                                  self._data[self._nextrow],
+                                                  self._nextrow, self._subdirs)))
+            self._nextrow += 1
+
+        return self._queue.popleft()[1]
+
+    def _shutdown(self):
+        """Discard queued images and shut down the worker pool"""
+        for item in self._queue:
+            item[1].cancel()
+        self._queue.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def finish(self, connection):
+        """
+        Finish the data upload and shut down the worker pool
+
+        Parameters
+        ----------
+        connection : :class:`CAS` object
+
+        """
+        self._shutdown()
+        super(Image, self).finish(connection)
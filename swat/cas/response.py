@@ -137,6 +137,14 @@ class CASPerformance(object):
     memory_quota : int
     data_movement_time : float
     date_movement_bytes : int
+    request_bytes : int
+    request_wire_bytes : int
+    response_bytes : int
+    response_wire_bytes : int
+
+    The request and response sizes are only available for the REST
+    interface.  The wire sizes are the number of body bytes sent and
+    received after compression.
 
     Parameters
     ----------
@@ -166,7 +174,9 @@ class CASPerformance(object):
         for key in ['elapsed_time', 'cpu_user_time', 'cpu_system_time',
                     'system_total_memory', 'system_nodes', 'system_cores', 'memory',
                     'memory_os', 'memory_quota',
-                    'data_movement_time', 'data_movement_bytes']:
+                    'data_movement_time', 'data_movement_bytes',
+                    'request_bytes', 'request_wire_bytes',
+                    'response_bytes', 'response_wire_bytes']:
             out[key] = getattr(self, key)
         return out
 
@@ -235,6 +245,33 @@ class CASPerformance(object):
         ''' Memory Quota '''
         return errorcheck(self._sw_response.getMemoryQuota(), self._sw_response)
 
+    def _client_metric(self, name):
+        ''' Return a metric that is only measured by some interfaces '''
+        func = getattr(self._sw_response, name, None)
+        if func is None:
+            return
+        return func()
+
+    @cachedproperty
+    def request_bytes(self):
+        ''' Request body bytes '''
+        return self._client_metric('getRequestBytes')
+
+    @cachedproperty
+    def request_wire_bytes(self):
+        ''' Request body bytes sent '''
+        return self._client_metric('getRequestWireBytes')
+
+    @cachedproperty
+    def response_bytes(self):
+        ''' Response body bytes '''
+        return self._client_metric('getResponseBytes')
+
+    @cachedproperty
+    def response_wire_bytes(self):
+        ''' Response body bytes received '''
+        return self._client_metric('getResponseWireBytes')
+
     def __str__(self):
         out = []
         for key, value in sorted(six.iteritems(self.to_dict())):
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+'''
+Class for calling CAS actions asynchronously over REST
+
+'''
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import asyncio
+import os
+import ssl
+import sys
+from six.moves import urllib
+from .codec import get_codec
+from .connection import (REST_CASConnection, _print_request, _print_response,
+                         _response_sizes)
+from ...config import get_option
+from ...exceptions import SWATError
+from ...logging import logger
+from ...utils.compat import a2u
+
+
+def _ssl_context(verify):
+    '''
+    Return the aiohttp SSL setting equivalent to a Requests setting
+
+    Parameters
+    ----------
+    verify : bool or string
+        The ``verify`` attribute of a Requests session
+
+    Returns
+    -------
+    :class:`ssl.SSLContext` or False
+
+    '''
+    if verify is False:
+        return False
+    if isinstance(verify, str):
+        return ssl.create_default_context(cafile=verify)
+    if 'REQUESTS_CA_BUNDLE' in os.environ:
+        return ssl.create_default_context(cafile=os.environ['REQUESTS_CA_BUNDLE'])
+    return ssl.create_default_context()
+
+
+class REST_CASAsyncConnection(REST_CASConnection):
+    '''
+    Create a REST CAS connection that can invoke actions asynchronously
+
+    The session is created, and all methods inherited from
+    :class:`REST_CASConnection` run, with blocking requests.  Actions
+    called with :meth:`ainvoke` are sent with aiohttp, so many
+    connections can wait for responses in one event loop.  The aiohttp
+    client session is created by the first call to :meth:`ainvoke` and
+    is bound to the event loop that is running at that time.
+
+    Parameters
+    ----------
+    hostname : string
+        The REST CAS host
+    port : int
+        The REST CAS port
+    username : string
+        The CAS username
+    password : string
+        The CAS password or an OAuth token
+        If an OAuth token is specified, do not specify username
+    soptions : string
+        The string containing connection options
+    error : REST_CASError
+        The object to use for error messages
+    adapters : dict, optional
+        The HTTP adapters of another connection, to share its connection
+        pools for blocking requests
+
+    Raises
+    ------
+    ImportError
+        If the aiohttp package is not installed
+
+    Returns
+    -------
+    REST_CASAsyncConnection object
+
+    '''
+
+    def __init__(self, hostname, port, username, password, soptions, error,
+                 adapters=None):
+        self._req_sess = None
+        self._http = None
+        import aiohttp
+        self._aiohttp = aiohttp
+        super(REST_CASAsyncConnection, self).__init__(hostname, port, username,
+                                                      password, soptions, error,
+                                                      adapters=adapters)
+
+    def _get_http(self):
+        ''' Return the aiohttp client session '''
+        if self._http is None or self._http.closed:
+            aiohttp = self._aiohttp
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=_ssl_context(self._req_sess.verify),
+                    limit_per_host=get_option('cas.http.pool_maxsize')),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=get_option('cas.http.connect_timeout') or None,
+                    sock_read=get_option('cas.http.read_timeout') or None))
+        return self._http
+
+    def _get_headers(self, headers):
+        ''' Return the session headers updated with `headers` '''
+        out = {}
+        for key, value in list(self._req_sess.headers.items()) + list(headers.items()):
+            if value is not None and key.lower() != 'content-length':
+                out[key] = a2u(value)
+        return out
+
+    async def ainvoke(self, action_name, kwargs):
+        '''
+        Invoke an action
+
+        The response is stored in the connection, so it is returned by
+        the next call to :meth:`receive`.
+
+        Parameters
+        ----------
+        action_name : string
+            The name of the action
+        kwargs : dict
+            The dictionary of action parameters
+
+        Returns
+        -------
+        `self`
+
+        '''
+        post_data, body, body_headers = self._prepare_invoke(action_name, kwargs)
+
+        headers = self._get_headers(body_headers)
+        headers.update({
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+        })
+
+        metrics = dict(requestBytes=len(post_data), requestWireBytes=len(body))
+
+        connection_retries = get_option('cas.connection_retries')
+        connection_retry_interval = get_option('cas.connection_retry_interval')
+
+        url = urllib.parse.urljoin(self._current_baseurl,
+                                   'cas/sessions/%s/actions/%s' %
+                                   (self._session, action_name))
+
+        logger.debug('POST {} {}'.format(url, post_data))
+        if get_option('cas.debug.requests'):
+            _print_request('POST', url, headers, post_data)
+
+        try:
+            post_retries = 0
+            while True:
+                async with self._get_http().post(url, data=body,
+                                                 headers=headers) as res:
+                    status = res.status
+                    content = await res.read()
+                    wire = res.content_length
+                if status == 502 and post_retries + 1 < connection_retries:
+                    logger.debug('HTTP 502 error code, retrying...')
+                    await asyncio.sleep(connection_retry_interval)
+                    post_retries += 1
+                    continue
+                break
+
+            metrics['responseBytes'] = len(content)
+            metrics['responseWireBytes'] = wire if wire is not None else len(content)
+
+        except (self._aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            loop = asyncio.get_running_loop()
+            res = await loop.run_in_executor(None, self._fetch_queued_results)
+            content = res.content
+            metrics['responseBytes'], metrics['responseWireBytes'] = \
+                _response_sizes(res)
+
+        except Exception as exc:
+            raise SWATError(str(exc))
+
+        if get_option('cas.debug.responses'):
+            _print_response(a2u(content, 'utf-8'))
+
+        try:
+            results = get_codec().loads(content)
+        except Exception:
+            sys.stderr.write(a2u(content, 'utf-8'))
+            sys.stderr.write('\n')
+            raise
+
+        self._set_results(results, metrics)
+
+        return self
+
+    async def aclose(self):
+        ''' Close the connection and the aiohttp client session '''
+        self.close()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+'''
+JSON encoders and decoders for the REST interface
+
+'''
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import json
+from ...config import get_option
+from ...utils.compat import a2u, text_types
+
+# Codecs in the order of preference for 'auto'
+CODECS = ['orjson', 'simdjson', 'ujson', 'json']
+
+_codecs = {}
+
+
+class JSONCodec(object):
+    '''
+    JSON encoder and decoder based on the standard library
+
+    Subclasses decode with a faster JSON package.  Text that the package
+    can not decode (such as control characters in strings, NaN, or
+    integers larger than 64 bits) falls back to the standard library.
+    Objects are always encoded by the standard library, since the fast
+    packages do not all encode NaN and infinity as the server expects.
+
+    '''
+
+    name = 'json'
+
+    def _loads(self, data):
+        ''' Decode `data` using the JSON package '''
+        raise NotImplementedError
+
+    def dumps(self, obj, ensure_ascii=False):
+        '''
+        Encode an object as JSON
+
+        Parameters
+        ----------
+        obj : any
+            The object to encode.
+        ensure_ascii : bool, optional
+            Should non-ASCII characters be escaped?  This is required
+            for JSON used in HTTP headers.
+
+        Returns
+        -------
+        string
+
+        '''
+        return json.dumps(obj, ensure_ascii=ensure_ascii)
+
+    def loads(self, data):
+        '''
+        Decode JSON text
+
+        Parameters
+        ----------
+        data : bytes or string
+            The JSON text.  Bytes are decoded as UTF-8.
+
+        Returns
+        -------
+        any
+
+        '''
+        if self.name != 'json':
+            try:
+                return self._loads(data)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        if not isinstance(data, text_types):
+            data = a2u(data, 'utf-8')
+        return json.loads(data, strict=False)
+
+
+class OrJSONCodec(JSONCodec):
+    ''' JSON codec using orjson '''
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._module = orjson
+
+    def _loads(self, data):
+        return self._module.loads(data)
+
+
+class SIMDJSONCodec(JSONCodec):
+    ''' JSON codec using pysimdjson '''
+
+    name = 'simdjson'
+
+    def __init__(self):
+        import simdjson
+        self._module = simdjson
+
+    def _loads(self, data):
+        return self._module.loads(data)
+
+
+class UJSONCodec(JSONCodec):
+    ''' JSON codec using ujson '''
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._module = ujson
+
+    def _loads(self, data):
+        return self._module.loads(data)
+
+
+_CODEC_CLASSES = {
+    'json': JSONCodec,
+    'orjson': OrJSONCodec,
+    'simdjson': SIMDJSONCodec,
+    'ujson': UJSONCodec,
+}
+
+
+def load_codec(name):
+    '''
+    Return the codec with the given name
+
+    Parameters
+    ----------
+    name : string
+        The name of the codec: 'auto', 'orjson', 'simdjson', 'ujson', or 'json'.
+        'auto' selects the first of these that is installed.
+
+    Raises
+    ------
+    ImportError
+        If the JSON package of the codec is not installed
+
+    Returns
+    -------
+    :class:`JSONCodec`
+
+    '''
+    if name in _codecs:
+        return _codecs[name]
+
+    if name == 'auto':
+        for item in CODECS:
+            try:
+                codec = load_codec(item)
+                break
+            except ImportError:
+                pass
+    else:
+        codec = _CODEC_CLASSES[name]()
+
+    _codecs[name] = codec
+    return codec
+
+
+def get_codec():
+    ''' Return the codec selected by the cas.http.json_codec option '''
+    return load_codec(get_option('cas.http.json_codec'))
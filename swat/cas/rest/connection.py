@@ -24,16 +24,18 @@ Class for creating REST CAS sessions
 from __future__ import print_function, division, absolute_import, unicode_literals
 
 import base64
-import json
 import os
 import re
 import requests
 import six
+import socket
 import ssl
 import sys
 import time
 import urllib3
+import zlib
 from six.moves import urllib
+from .codec import get_codec
 from .message import REST_CASMessage
 from .response import REST_CASResponse
 from ..types import blob
@@ -65,6 +67,312 @@ def _print_request(rtype, url, headers, data=None):
             sys.stderr.write('\n')
 
 
+def _content_encoding(size=None):
+    '''
+    Return the content encoding to use for a request body
+
+    Parameters
+    ----------
+    size : int, optional
+        The size of the body in bytes.  None means that the size is unknown.
+
+    Returns
+    -------
+    string or None
+
+    '''
+    encoding = get_option('cas.http.compression')
+    if encoding == 'none':
+        return
+    if size is not None and size < get_option('cas.http.compression_threshold'):
+        return
+    return encoding
+
+
+def _compressor(encoding):
+    ''' Return a compression object for the given content encoding '''
+    wbits = encoding == 'gzip' and 16 + zlib.MAX_WBITS or zlib.MAX_WBITS
+    return zlib.compressobj(get_option('cas.http.compression_level'),
+                            zlib.DEFLATED, wbits)
+
+
+def _compress(data, encoding):
+    ''' Compress `data` using the given content encoding '''
+    comp = _compressor(encoding)
+    return comp.compress(data) + comp.flush()
+
+
+def _iter_compress(chunks, encoding):
+    ''' Compress an iterator of bytes using the given content encoding '''
+    comp = _compressor(encoding)
+    for chunk in chunks:
+        out = comp.compress(chunk)
+        if out:
+            yield out
+    yield comp.flush()
+
+
+def _iter_file(datafile, blocksize=1024**2):
+    ''' Read a file in blocks '''
+    while True:
+        chunk = datafile.read(blocksize)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _iter_count(chunks, counts, key):
+    ''' Add the size of each chunk to `counts[key]` '''
+    for chunk in chunks:
+        counts[key] += len(chunk)
+        yield chunk
+
+
+def _response_sizes(res):
+    '''
+    Return the decoded and transferred sizes of a response body
+
+    Parameters
+    ----------
+    res : requests.models.Response
+        The response object.
+
+    Returns
+    -------
+    (int, int)
+
+    '''
+    size = len(res.content)
+    try:
+        wire = int(res.headers['Content-Length'])
+    except (KeyError, TypeError, ValueError):
+        try:
+            wire = int(res.raw.tell())
+        except Exception:
+            wire = size
+    return size, wire
+
+
+def _add_metrics(results, **metrics):
+    ''' Add client-side metrics to the metrics in a results object '''
+    if isinstance(results, dict):
+        out = results.get('metrics') or {}
+        out.update(metrics)
+        results['metrics'] = out
+
+
+class _ResponseReader(object):
+    '''
+    File-like object that reads the decoded body of a streamed response
+
+    Parameters
+    ----------
+    res : requests.models.Response
+        The response object.  It must be created with ``stream=True``.
+    chunksize : int, optional
+        The number of bytes to read at a time.
+
+    '''
+
+    def __init__(self, res, chunksize=64 * 1024):
+        self._chunks = res.iter_content(chunk_size=chunksize)
+        self.size = 0
+
+    def read(self, size=-1):
+        ''' Return the next chunk of the body '''
+        if size == 0:
+            return b''
+        for chunk in self._chunks:
+            if chunk:
+                self.size += len(chunk)
+                return chunk
+        return b''
+
+
+# The missing value of int64 columns.  The yajl-based ijson backends can not
+# parse it as an integer, so it is rewritten as a float before it is parsed.
+# Strings are matched as well so that their contents are left alone.
+_INT64_MISSING = -9223372036854775808
+_INT64_MISSING_RE = re.compile(br'("(?:[^"\\]|\\.)*(?:"|\Z))|'
+                               br'([\[,:]\s*)-9223372036854775808(?=[\s,\]}])',
+                               flags=re.S)
+_STRING_END_RE = re.compile(br'(?:[^"\\]|\\.)*"', flags=re.S)
+_ESCAPE_RE = re.compile(br'\\.', flags=re.S)
+
+# NumPy data types of the integer table columns stored by _load_stream
+_INT_COLUMN_TYPES = {'int32': 'i4', 'int64': 'i8', 'int': 'i8'}
+
+
+class _Int64MissingReader(object):
+    '''
+    File-like object that rewrites the int64 missing value as a float
+
+    Parameters
+    ----------
+    fp : file-like
+        The JSON text to read.
+
+    '''
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._tail = b''
+        self._in_string = False
+
+    def read(self, size=-1):
+        ''' Return the next chunk of the JSON text '''
+        if size == 0:
+            return b''
+        while True:
+            chunk = self._fp.read(size)
+            data = self._tail + chunk
+            if not chunk:
+                self._tail = b''
+            else:
+                # Keep a trailing number, its delimiter, and any escape
+                # characters for the next read so that they are never split
+                cut = len(data.rstrip(b'-0123456789,:[ \t\r\n\\'))
+                data, self._tail = data[:cut], data[cut:]
+                if not data:
+                    continue
+            if b'-9223372036854775808' in data:
+                return self._rewrite(data)
+            # Track whether the chunk ends inside of a string
+            quotes = data
+            if b'\\' in data:
+                quotes = _ESCAPE_RE.sub(b'', data)
+            if quotes.count(b'"') % 2:
+                self._in_string = not self._in_string
+            return data
+
+    def _rewrite(self, data):
+        ''' Rewrite the int64 missing values that are not in strings '''
+        head = b''
+        if self._in_string:
+            match = _STRING_END_RE.match(data)
+            if match is None:
+                return data
+            head, data = data[:match.end()], data[match.end():]
+            self._in_string = False
+
+        def replace(match):
+            ''' Return the replacement of a string or missing value '''
+            if match.group(1) is not None:
+                self._in_string = match.end() == len(data) and \
+                    not _STRING_END_RE.match(match.group(1)[1:])
+                return match.group(1)
+            self._in_string = False
+            return match.group(2) + b'-9223372036854775808.0'
+
+        return head + _INT64_MISSING_RE.sub(replace, data)
+
+
+def _load_stream(fp):
+    '''
+    Parse a JSON response incrementally
+
+    The rows of tables (objects with a schema or a ``_ctb`` key) are
+    stored by column in the ``columns`` key of the table rather than
+    as a list of rows in the ``rows`` key.  Each row is distributed to
+    the columns as soon as it is parsed, and integer columns are
+    converted to NumPy arrays when all rows have been parsed.
+
+    Parameters
+    ----------
+    fp : file-like
+        The response body.
+
+    Returns
+    -------
+    dict
+
+    '''
+    import ijson
+
+    # Each item is [kind, container, key] where kind is 'map', 'list',
+    # 'rows' (the rows of a table), or 'row'.  The key of 'rows' items
+    # is the table.
+    root = [None]
+    stack = [['list', root, None]]
+
+    def add(value):
+        ''' Add a parsed value to the current container '''
+        kind, obj, key = stack[-1]
+        if kind == 'row':
+            obj.append(value)
+            return
+        if value == _INT64_MISSING and isinstance(value, float):
+            value = _INT64_MISSING
+        if kind == 'map':
+            obj[key] = value
+        elif kind == 'list':
+            if obj is root:
+                root[0] = value
+            else:
+                obj.append(value)
+
+    for event, value in ijson.basic_parse(_Int64MissingReader(fp), use_float=True):
+        if event == 'map_key':
+            stack[-1][2] = value
+        elif event == 'start_map':
+            obj = {}
+            add(obj)
+            stack.append(['map', obj, None])
+        elif event == 'start_array':
+            kind, obj, key = stack[-1]
+            if kind == 'map' and key == 'rows' and ('schema' in obj or obj.get('_ctb')):
+                columns = [[] for col in obj.get('schema') or []]
+                obj['columns'] = columns
+                stack.append(['rows', columns, obj])
+            elif kind == 'rows':
+                stack.append(['row', [], None])
+            else:
+                items = []
+                add(items)
+                stack.append(['list', items, None])
+        elif event in ('end_map', 'end_array'):
+            kind, obj, key = stack.pop()
+            if kind == 'row':
+                columns = stack[-1][1]
+                if len(columns) < len(obj):
+                    columns.extend([] for i in range(len(obj) - len(columns)))
+                for column, item in zip(columns, obj):
+                    column.append(item)
+            elif kind == 'rows':
+                _int_columns2numpy(key.get('schema') or [], obj)
+        else:
+            add(value)
+
+    return root[0]
+
+
+def _int_columns2numpy(schema, columns):
+    '''
+    Convert the integer columns of a streamed table to NumPy arrays
+
+    The missing values of int64 columns, which are parsed as floats,
+    are converted back to integers.  Columns that can not be converted
+    (such as array columns) are left as lists.
+
+    Parameters
+    ----------
+    schema : list of dicts
+        The schema of the table.
+    columns : list of lists
+        The columns of the table.  This list is modified in place.
+
+    '''
+    import numpy as np
+    for i, (col, values) in enumerate(zip(schema, columns)):
+        dtype = _INT_COLUMN_TYPES.get(col.get('type'))
+        if dtype is None or (values and isinstance(values[0], list)):
+            continue
+        try:
+            columns[i] = np.asarray(values, dtype=dtype)
+        except (TypeError, ValueError):
+            pass
+
+
 def _print_response(text):
     ''' Print the response for debugging '''
     sys.stderr.write("RESPONSE text: \n")
@@ -165,7 +473,47 @@ def _normalize_list(items):
     return newitems
 
 
-class SSLContextAdapter(requests.adapters.HTTPAdapter):
+def _socket_options():
+    ''' Return the socket options selected by the cas.http options '''
+    options = []
+    if get_option('cas.http.tcp_nodelay'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+    if get_option('cas.http.keepalive'):
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    return options
+
+
+def _timeout():
+    ''' Return the Requests timeout selected by the cas.http options '''
+    connect = get_option('cas.http.connect_timeout') or None
+    read = get_option('cas.http.read_timeout') or None
+    if connect is None and read is None:
+        return None
+    return (connect, read)
+
+
+class PoolAdapter(requests.adapters.HTTPAdapter):
+    '''
+    HTTPAdapter that uses the connection pool settings of the cas.http options
+
+    The pool sizes and socket options are read when the adapter is created.
+
+    '''
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('pool_connections', get_option('cas.http.pool_connections'))
+        kwargs.setdefault('pool_maxsize', get_option('cas.http.pool_maxsize'))
+        super(PoolAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize,
+                         block=requests.adapters.DEFAULT_POOLBLOCK, **pool_kwargs):
+        pool_kwargs.setdefault('socket_options', _socket_options())
+        return super(PoolAdapter, self).init_poolmanager(connections,
+                                                         maxsize, block,
+                                                         **pool_kwargs)
+
+
+class SSLContextAdapter(PoolAdapter):
     ''' HTTPAdapter that uses the default SSL context on the machine '''
 
     def init_poolmanager(self, connections, maxsize,
@@ -177,8 +525,25 @@ class SSLContextAdapter(requests.adapters.HTTPAdapter):
                                                                **pool_kwargs)
 
 
-def _setup_ssl(req_sess):
-    ''' Configure a Requests session for SSL '''
+def _setup_ssl(req_sess, adapters=None):
+    '''
+    Configure a Requests session for SSL and mount its HTTP adapters
+
+    Parameters
+    ----------
+    req_sess : requests.Session
+        The session to configure
+    adapters : dict, optional
+        The adapters of another session, keyed by URL prefix.  Sessions
+        that share adapters share their connection pools.  New adapters
+        are created if this is not specified.
+
+    Returns
+    -------
+    dict
+        The mounted adapters
+
+    '''
     if os.environ.get('SSLREQCERT', 'y').lower() in ['n', 'no', '0',
                                                      'f', 'false', 'off']:
         req_sess.verify = False
@@ -191,8 +556,16 @@ def _setup_ssl(req_sess):
     elif 'SSLCALISTLOC' in os.environ:
         req_sess.verify = os.path.expanduser(
             os.environ['SSLCALISTLOC'])
-    elif 'REQUESTS_CA_BUNDLE' not in os.environ:
-        req_sess.mount('https://', SSLContextAdapter())
+
+    if adapters is None:
+        adapters = {'http://': PoolAdapter(), 'https://': PoolAdapter()}
+        if req_sess.verify is True and 'REQUESTS_CA_BUNDLE' not in os.environ:
+            adapters['https://'] = SSLContextAdapter()
+
+    for prefix, adapter in adapters.items():
+        req_sess.mount(prefix, adapter)
+
+    return adapters
 
 
 class REST_CASConnection(object):
@@ -214,6 +587,9 @@ class REST_CASConnection(object):
         The string containing connection options
     error : REST_CASError
         The object to use for error messages
+    adapters : dict, optional
+        The HTTP adapters of another connection, to share its connection
+        pools.  New adapters are created if this is not specified.
 
     Returns
     -------
@@ -221,7 +597,8 @@ class REST_CASConnection(object):
 
     '''
 
-    def __init__(self, hostname, port, username, password, soptions, error):
+    def __init__(self, hostname, port, username, password, soptions, error,
+                 adapters=None):
 
         logger.debug('Creating REST connection for user {} at {} with options {}'
                      .format(username, hostname, soptions))
@@ -293,6 +670,8 @@ class REST_CASConnection(object):
         self._soptions = soptions
         self._error = error
         self._results = None
+        self._pending = None
+        self._executor = None
 
         allow_basic_auth = get_option('cas.allow_basic_auth')
         # add in the following when allow_basic_auth default is changed to False
@@ -325,10 +704,12 @@ class REST_CASConnection(object):
 
         self._req_sess = requests.Session()
 
-        _setup_ssl(self._req_sess)
+        self._shared_adapters = adapters is not None
+        self._adapters = _setup_ssl(self._req_sess, adapters=adapters)
 
         self._req_sess.headers.update({
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
             'Content-Type': 'application/json',
             'Content-Length': '0',
         })
@@ -379,7 +760,7 @@ class REST_CASConnection(object):
 
                     get_retries = 0
                     while get_retries < connection_retries:
-                        res = self._req_sess.get(url, data=b'')
+                        res = self._req_sess.get(url, data=b'', timeout=_timeout())
                         if res.status_code == 502:
                             logger.debug('HTTP 502 error, retrying...')
                             time.sleep(connection_retry_interval)
@@ -402,7 +783,8 @@ class REST_CASConnection(object):
 
                     put_retries = 0
                     while put_retries < connection_retries:
-                        res = self._req_sess.put(url, data=b'', params=params)
+                        res = self._req_sess.put(url, data=b'', params=params,
+                                                timeout=_timeout())
                         if res.status_code == 502:
                             logger.debug('HTTP 502 error, retrying...')
                             time.sleep(connection_retry_interval)
@@ -424,10 +806,9 @@ class REST_CASConnection(object):
                     _print_response(res.text)
 
                 try:
-                    txt = a2u(res.text, 'utf-8')
-                    out = json.loads(txt, strict=False)
+                    out = get_codec().loads(res.content)
                 except Exception:
-                    sys.stderr.write(txt)
+                    sys.stderr.write(res.text)
                     sys.stderr.write('\n')
                     raise
 
@@ -546,7 +927,8 @@ class REST_CASConnection(object):
                                            'cas/sessions/%s' % self._session)
                 logger.debug('Checking for idle session: {}'
                              .format(self._session))
-                out = self._req_sess.get(url).json()
+                res = self._req_sess.get(url, timeout=_timeout())
+                out = get_codec().loads(res.content)
                 if out.get('isIdle', False):
                     logger.debug('Session {} is idle'.format(self._session))
                     break
@@ -565,6 +947,14 @@ class REST_CASConnection(object):
         '''
         Invoke an action
 
+        If the cas.http.concurrent_invoke option is enabled, the request
+        is sent by a background thread of the connection, so actions
+        invoked on several connections run concurrently.  Requests on one
+        connection are sent in order.  :meth:`receive` waits for the
+        response.  Errors sending the request or parsing the response
+        are then raised by :meth:`receive` (and by :func:`getnext`) rather
+        than by this method.
+
         Parameters
         ----------
         action_name : string
@@ -577,28 +967,53 @@ class REST_CASConnection(object):
         `self`
 
         '''
-        is_ui = kwargs.get('_apptag', '') == 'UI'
-        kwargs = json.dumps(_normalize_params(kwargs))
+        post_data, body, body_headers = self._prepare_invoke(action_name, kwargs)
 
-        if get_option('cas.trace_actions') and \
-                (not(is_ui) or (is_ui and get_option('cas.trace_ui_actions'))):
-            print('[%s]' % action_name)
-            _print_params(json.loads(kwargs), prefix='    ')
-            print('')
+        if not get_option('cas.http.concurrent_invoke'):
+            self._send_invoke(action_name, post_data, body, body_headers)
+            return self
 
-        post_data = a2u(kwargs).encode('utf-8')
-        self._req_sess.headers.update({
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self._pending = self._executor.submit(self._send_invoke, action_name,
+                                              post_data, body, body_headers)
+
+        return self
+
+    def _send_invoke(self, action_name, post_data, body, body_headers):
+        '''
+        Send an action request and store the response
+
+        Parameters
+        ----------
+        action_name : string
+            The name of the action
+        post_data : bytes
+            The encoded action parameters
+        body : bytes
+            The request body
+        body_headers : dict
+            Additional headers of the request
+
+        '''
+        headers = dict(body_headers)
+        headers.update({
             'Accept': 'application/json',
             'Content-Type': 'application/json',
-            'Content-Length': str(len(post_data)),
+            'Content-Length': str(len(body)),
         })
 
-        result_id = None
+        metrics = dict(requestBytes=len(post_data), requestWireBytes=len(body))
 
         connection_retries = get_option('cas.connection_retries')
         connection_retry_interval = get_option('cas.connection_retry_interval')
 
-        txt = ''
+        # Responses are parsed incrementally when streaming is enabled
+        stream = get_option('cas.http.stream') and not get_option('cas.debug.responses')
+        stream_args = dict(stream=True) if stream else {}
+
         while True:
             try:
                 url = urllib.parse.urljoin(self._current_baseurl,
@@ -607,11 +1022,13 @@ class REST_CASConnection(object):
 
                 logger.debug('POST {} {}'.format(url, post_data))
                 if get_option('cas.debug.requests'):
-                    _print_request('POST', url, self._req_sess.headers, post_data)
+                    _print_request('POST', url, dict(self._req_sess.headers, **headers),
+                                   post_data)
 
                 post_retries = 0
                 while post_retries < connection_retries:
-                    res = self._req_sess.post(url, data=post_data)
+                    res = self._req_sess.post(url, data=body, headers=headers,
+                                              timeout=_timeout(), **stream_args)
                     if res.status_code == 502:
                         logger.debug('HTTP 502 error code, retrying...')
                         time.sleep(connection_retry_interval)
@@ -625,113 +1042,212 @@ class REST_CASConnection(object):
                 break
 
             except (requests.ConnectionError, urllib3.exceptions.ProtocolError):
-                self._connect(session=self._session)
+                stream = False
+                res = self._fetch_queued_results()
+                break
 
-                # Get ID of results
-                action_name = 'session.listresults'
-                post_data = a2u('').encode('utf-8')
-                self._req_sess.headers.update({
-                    'Content-Type': 'application/json',
-                    'Content-Length': str(len(post_data)),
-                })
+            except Exception as exc:
+                raise SWATError(str(exc))
 
-                url = urllib.parse.urljoin(self._current_baseurl,
-                                           'cas/sessions/%s/actions/%s' %
-                                           (self._session, action_name))
+        if stream:
+            reader = _ResponseReader(res)
+            try:
+                results = _load_stream(reader)
+            except Exception as exc:
+                raise SWATError('Could not parse the action response: %s' % exc)
+            finally:
+                res.close()
+            metrics['responseBytes'] = reader.size
+            try:
+                metrics['responseWireBytes'] = int(res.raw.tell())
+            except Exception:
+                metrics['responseWireBytes'] = reader.size
 
-                logger.debug('POST {} {}'.format(url, post_data))
-                if get_option('cas.debug.requests'):
-                    _print_request('POST', url, self._req_sess.headers,
-                                   post_data)
+        else:
+            try:
+                results = get_codec().loads(res.content)
+            except Exception:
+                sys.stderr.write(res.text)
+                sys.stderr.write('\n')
+                raise
 
-                post_retries = 0
-                while post_retries < connection_retries:
-                    res = self._req_sess.post(url, data=post_data)
-                    if res.status_code == 502:
-                        logger.debug('HTTP 502 error code, retrying...')
-                        time.sleep(connection_retry_interval)
-                        post_retries += 1
-                        continue
-                    break
+            metrics['responseBytes'], metrics['responseWireBytes'] = \
+                _response_sizes(res)
 
-                if get_option('cas.debug.responses'):
-                    _print_response(res.text)
+        self._set_results(results, metrics)
 
-                try:
-                    txt = a2u(res.text, 'utf-8')
-                    out = json.loads(txt, strict=False)
-                except Exception:
-                    sys.stderr.write(txt)
-                    sys.stderr.write('\n')
-                    raise
+    def _prepare_invoke(self, action_name, kwargs):
+        '''
+        Encode the parameters of an action call
 
-                if out.get('results'):
-                    logger.debug('Queued results: {}'.format(out['results']))
-                else:
-                    logger.debug('No queued results')
+        Parameters
+        ----------
+        action_name : string
+            The name of the action
+        kwargs : dict
+            The dictionary of action parameters
 
-                results = out.get('results', {'Queued Results': {'rows': []}})
-                rows = results.get('Queued Results', {'rows': []})['rows']
-                if rows:
-                    result_id = rows[0][0]
+        Returns
+        -------
+        (bytes, bytes, dict)
+            The encoded parameters, the request body (compressed as
+            needed), and the additional headers of the request
 
-                    # Setup retrieval of results from ID
-                    action_name = 'session.fetchresult'
-                    post_data = a2u('{"id":%s}' % result_id).encode('utf-8')
-                    self._req_sess.headers.update({
-                        'Content-Type': 'application/json',
-                        'Content-Length': str(len(post_data)),
-                    })
+        '''
+        is_ui = kwargs.get('_apptag', '') == 'UI'
+        kwargs = _normalize_params(kwargs)
 
-                    if get_option('cas.debug.requests'):
-                        _print_request('POST', url, self._req_sess.headers,
-                                       post_data)
+        if get_option('cas.trace_actions') and \
+                (not(is_ui) or (is_ui and get_option('cas.trace_ui_actions'))):
+            print('[%s]' % action_name)
+            _print_params(kwargs, prefix='    ')
+            print('')
 
-                    post_retries = 0
-                    while post_retries < connection_retries:
-                        res = self._req_sess.post(url, data=post_data)
-                        if res.status_code == 502:
-                            logger.debug('HTTP 502 error code, retrying...')
-                            time.sleep(connection_retry_interval)
-                            post_retries += 1
-                            continue
-                        break
+        post_data = get_codec().dumps(kwargs).encode('utf-8')
 
-                    if get_option('cas.debug.responses'):
-                        _print_response(res.text)
+        body = post_data
+        body_headers = {}
+        encoding = _content_encoding(len(post_data))
+        if encoding:
+            body = _compress(post_data, encoding)
+            body_headers['Content-Encoding'] = encoding
 
-                    break
+        return post_data, body, body_headers
 
-                else:
-                    raise SWATError('Could not retrieve results of action call')
+    def _fetch_queued_results(self):
+        '''
+        Reconnect to the session and fetch the results of the last action
 
-            except Exception as exc:
-                raise SWATError(str(exc))
+        This is used when the connection is lost while waiting for the
+        response of an action.
+
+        Returns
+        -------
+        requests.models.Response
+
+        '''
+        connection_retries = get_option('cas.connection_retries')
+        connection_retry_interval = get_option('cas.connection_retry_interval')
+
+        self._connect(session=self._session)
+
+        # Get ID of results
+        action_name = 'session.listresults'
+        post_data = a2u('').encode('utf-8')
+        headers = {
+            'Content-Type': 'application/json',
+            'Content-Length': str(len(post_data)),
+        }
+
+        url = urllib.parse.urljoin(self._current_baseurl,
+                                   'cas/sessions/%s/actions/%s' %
+                                   (self._session, action_name))
+
+        logger.debug('POST {} {}'.format(url, post_data))
+        if get_option('cas.debug.requests'):
+            _print_request('POST', url, dict(self._req_sess.headers, **headers),
+                           post_data)
+
+        post_retries = 0
+        while post_retries < connection_retries:
+            res = self._req_sess.post(url, data=post_data, headers=headers,
+                                      timeout=_timeout())
+            if res.status_code == 502:
+                logger.debug('HTTP 502 error code, retrying...')
+                time.sleep(connection_retry_interval)
+                post_retries += 1
+                continue
+            break
+
+        if get_option('cas.debug.responses'):
+            _print_response(res.text)
 
         try:
-            txt = a2u(res.text, 'utf-8')
-            self._results = json.loads(txt, strict=False)
+            out = get_codec().loads(res.content)
         except Exception:
             sys.stderr.write(res.text)
             sys.stderr.write('\n')
             raise
 
+        if out.get('results'):
+            logger.debug('Queued results: {}'.format(out['results']))
+        else:
+            logger.debug('No queued results')
+
+        results = out.get('results', {'Queued Results': {'rows': []}})
+        rows = results.get('Queued Results', {'rows': []})['rows']
+        if rows:
+            result_id = rows[0][0]
+
+            # Setup retrieval of results from ID
+            action_name = 'session.fetchresult'
+            post_data = a2u('{"id":%s}' % result_id).encode('utf-8')
+            headers = {
+                'Content-Type': 'application/json',
+                'Content-Length': str(len(post_data)),
+            }
+
+            if get_option('cas.debug.requests'):
+                _print_request('POST', url, dict(self._req_sess.headers, **headers),
+                               post_data)
+
+            post_retries = 0
+            while post_retries < connection_retries:
+                res = self._req_sess.post(url, data=post_data, headers=headers,
+                                          timeout=_timeout())
+                if res.status_code == 502:
+                    logger.debug('HTTP 502 error code, retrying...')
+                    time.sleep(connection_retry_interval)
+                    post_retries += 1
+                    continue
+                break
+
+            if get_option('cas.debug.responses'):
+                _print_response(res.text)
+
+            return res
+
+        raise SWATError('Could not retrieve results of action call')
+
+    def _set_results(self, results, metrics):
+        '''
+        Store the parsed response of an action call
+
+        Parameters
+        ----------
+        results : dict
+            The parsed response
+        metrics : dict
+            The request and response sizes to add to the performance
+            information of the response
+
+        Raises
+        ------
+        SWATError
+            If the response does not contain a disposition
+
+        '''
+        self._results = results
+
+        _add_metrics(results, **metrics)
+
         try:
-            if self._results.get('disposition', None) is None:
-                if self._results.get('error'):
-                    msg = self._results['error']
-                    if self._results.get('details'):
-                        msg = '{}: {}'.format(msg, self._results['details'])
+            if results.get('disposition', None) is None:
+                if results.get('error'):
+                    msg = results['error']
+                    if results.get('details'):
+                        msg = '{}: {}'.format(msg, results['details'])
                     raise SWATError(msg)
                 else:
                     raise SWATError('Unknown error')
         except ValueError as exc:
             raise SWATError(str(exc))
 
-        return self
-
     def receive(self):
         ''' Retrieve the next message from the server '''
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
         out = REST_CASMessage(self._results, connection=self)
         self._results = {}
         return out
@@ -758,7 +1274,18 @@ class REST_CASConnection(object):
 
     def hasPendingResponses(self):
         ''' Do we have pending responses? '''
-        return False
+        return self._pending is not None
+
+    def getPendingResponse(self):
+        '''
+        Get the future of the pending action request
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future` or None
+
+        '''
+        return self._pending
 
     def setZeroIndexedParameters(self):
         ''' Declare the interface as a zero-indexed language '''
@@ -768,6 +1295,10 @@ class REST_CASConnection(object):
         ''' Copy the connection object '''
         scheme, auth_value = self._auth.split(b' ', 1)
 
+        adapters = None
+        if get_option('cas.http.share_pool'):
+            adapters = self._adapters
+
         if scheme == b'Basic':
             logger.debug("Using Basic authentication credentials for the request.")
             username, password = base64.b64decode(
@@ -779,7 +1310,8 @@ class REST_CASConnection(object):
                 a2u(username),
                 a2u(password),
                 self._soptions,
-                self._error
+                self._error,
+                adapters=adapters
             )
 
         elif scheme == b'Bearer':
@@ -790,7 +1322,8 @@ class REST_CASConnection(object):
                 None,
                 a2u(auth_value),
                 self._soptions,
-                self._error
+                self._error,
+                adapters=adapters
             )
 
         else:
@@ -812,42 +1345,115 @@ class REST_CASConnection(object):
         ''' Get the connection session ID '''
         return self._session
 
-    def close(self):
-        ''' Close the connection '''
+    def close(self, wait=True):
+        '''
+        Close the connection
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Cancel a running action and wait for its request to finish
+            before closing the connection?  This is disabled when the
+            connection is garbage collected, so finalizers never block.
+
+        '''
+        pending = getattr(self, '_pending', None)
+        if wait and pending is not None and not pending.done():
+            self.stopAction()
+            try:
+                pending.result()
+            except Exception:
+                pass
         self._session = None
+        if getattr(self, '_executor', None) is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         if self._req_sess is not None:
+            # Leave the connection pools of shared adapters open
+            if getattr(self, '_shared_adapters', False):
+                self._req_sess.adapters.clear()
             self._req_sess.close()
 
     def __del__(self):
-        self.close()
+        self.close(wait=False)
 
     def upload(self, file_name, params):
-        ''' Upload a data file '''
-        with open(file_name, 'rb') as datafile:
-            data = datafile.read()
+        '''
+        Upload a data file
 
-        self._req_sess.headers.update({
+        The data is streamed to the server rather than being read into
+        memory first.
+
+        Parameters
+        ----------
+        file_name : string or callable
+            The path of the file to upload, or a function that returns
+            an iterator of bytes.  Iterators are sent using chunked
+            transfer encoding.  The function is called again if the
+            upload needs to be retried on another host.
+        params : dict
+            The parameters to the ``table.upload`` action.
+
+        Returns
+        -------
+        :class:`REST_CASResponse`
+
+        '''
+        headers = {}
+        size = None
+        if callable(file_name):
+            # Remove the session Content-Length so that the body is chunked
+            headers['Content-Length'] = None
+        else:
+            size = os.path.getsize(file_name)
+            headers['Content-Length'] = str(size)
+
+        encoding = _content_encoding(size)
+        if encoding:
+            headers['Content-Length'] = None
+            headers['Content-Encoding'] = encoding
+
+        headers.update({
             'Accept': 'application/json',
             'Content-Type': 'application/octet-stream',
-            'Content-Length': str(len(data)),
-            'JSON-Parameters': json.dumps(_normalize_params(params))
+            'JSON-Parameters': get_codec().dumps(_normalize_params(params),
+                                                 ensure_ascii=True)
         })
 
         while True:
+            datafile = None
             try:
                 url = urllib.parse.urljoin(self._current_baseurl,
                                            'cas/sessions/%s/actions/table.upload' %
                                            self._session)
 
+                counts = dict(requestBytes=size or 0, requestWireBytes=size or 0)
+                if callable(file_name):
+                    data = file_name()
+                else:
+                    data = datafile = open(file_name, 'rb')
+
+                if callable(file_name) or encoding:
+                    counts = dict(requestBytes=0, requestWireBytes=0)
+                    if datafile is not None:
+                        data = _iter_file(datafile)
+                    data = _iter_count(data, counts, 'requestBytes')
+                    if encoding:
+                        data = _iter_compress(data, encoding)
+                    data = _iter_count(data, counts, 'requestWireBytes')
+
                 if get_option('cas.debug.requests'):
-                    _print_request('DELETE', url, self._req_sess.headers, data)
+                    _print_request('PUT', url,
+                                   dict(self._req_sess.headers, **headers))
 
-                res = self._req_sess.put(url, data=data)
+                res = self._req_sess.put(url, data=data, headers=headers,
+                                         timeout=_timeout())
 
                 if get_option('cas.debug.responses'):
                     _print_response(res.text)
 
-                res = res.text
+                counts['responseBytes'], counts['responseWireBytes'] = \
+                    _response_sizes(res)
                 break
 
             except requests.ConnectionError:
@@ -857,16 +1463,18 @@ class REST_CASConnection(object):
                 raise SWATError(str(exc))
 
             finally:
-                del self._req_sess.headers['JSON-Parameters']
+                if datafile is not None:
+                    datafile.close()
 
         try:
-            txt = a2u(res, 'utf-8')
-            out = json.loads(txt, strict=False)
+            out = get_codec().loads(res.content)
         except Exception:
-            sys.stderr.write(txt)
+            sys.stderr.write(res.text)
             sys.stderr.write('\n')
             raise
 
+        _add_metrics(out, **counts)
+
         try:
             if out.get('disposition', None) is None:
                 if out.get('error'):
@@ -877,9 +1485,19 @@ class REST_CASConnection(object):
         except ValueError as exc:
             raise SWATError(str(exc))
 
-    def stopAption(self):
+    def stopAction(self):
         ''' Stop the current action '''
-        return
+        if self._pending is None or self._pending.done() or not self._session:
+            return
+        url = urllib.parse.urljoin(self._current_baseurl,
+                                   'cas/sessions/%s/cancel' % self._session)
+        logger.debug('Cancelling action in session {}'.format(self._session))
+        try:
+            self._req_sess.put(url, data=b'', timeout=10)
+        except requests.RequestException as exc:
+            logger.debug('Could not cancel action: {}'.format(exc))
+
+    stopAption = stopAction
 
     def getOptionType(self, option):
         ''' Get the option type '''
@@ -228,6 +228,22 @@ class REST_CASResponse(object):
         ''' Get the memory quota '''
         return self._metrics.get('memory_quota')
 
+    def getRequestBytes(self):
+        ''' Get the size of the request body '''
+        return self._metrics.get('request_bytes')
+
+    def getRequestWireBytes(self):
+        ''' Get the number of request body bytes sent after compression '''
+        return self._metrics.get('request_wire_bytes')
+
+    def getResponseBytes(self):
+        ''' Get the size of the response body '''
+        return self._metrics.get('response_bytes')
+
+    def getResponseWireBytes(self):
+        ''' Get the number of response body bytes received before decompression '''
+        return self._metrics.get('response_wire_bytes')
+
     def getLastErrorMessage(self):
         ''' Get the last generated error message '''
         return ''
@@ -27,8 +27,9 @@ import base64
 import decimal
 import numpy as np
 import pandas as pd
+from ..utils import datetime as casdt
 from ..utils.datetime import cas2python_date, cas2python_time, cas2python_datetime
-from ...utils.compat import items_types, float64, int32, int64
+from ...utils.compat import float64, int32, int64
 
 COL_TYPE_MAP = {
     'string': 'varchar',
@@ -36,6 +37,19 @@ COL_TYPE_MAP = {
 }
 
 
+def _cas2python_datetime_array(values):
+    ''' Convert CAS datetimes to an array of Python datetimes '''
+    return casdt.cas2python_datetime_array(values).to_pydatetime()
+
+
+# Vectorized counterparts of the scalar date / time conversion functions
+ARRAY_CONVERTERS = {
+    casdt.cas2python_datetime: _cas2python_datetime_array,
+    casdt.cas2python_date: casdt.cas2python_date_array,
+    casdt.cas2python_time: casdt.cas2python_time_array,
+}
+
+
 def _strip(value):
     ''' If `value` is a string, strip the whitespace '''
     if hasattr(value, 'strip'):
@@ -43,6 +57,40 @@ def _strip(value):
     return value
 
 
+def _b64decode(data):
+    ''' Decode base64 data that may be missing its padding '''
+    try:
+        return base64.b64decode(data)
+    except Exception:
+        try:
+            return base64.b64decode(data + '=')
+        except Exception:
+            return base64.b64decode(data + '==')
+
+
+def _convert_column(values, func, missing):
+    '''
+    Convert a column of CAS date / time values
+
+    Parameters
+    ----------
+    values : sequence of ints
+        The CAS values
+    func : callable
+        The scalar conversion function
+    missing : Decimal
+        Values less than this are missing
+
+    Returns
+    -------
+    sequence
+
+    '''
+    if func in ARRAY_CONVERTERS:
+        return ARRAY_CONVERTERS[func](values)
+    return [pd.NaT if x < missing else func(x) for x in values]
+
+
 def _attr2python(attr):
     ''' Convert an attribute to a Python object '''
     atype = attr['type']
@@ -71,7 +119,10 @@ class REST_CASTable(object):
     Parameters
     ----------
     obj : dict
-        The object returned by the CAS connection
+        The object returned by the CAS connection.  The data is either
+        a list of rows in the 'rows' key or, for streamed responses,
+        a list of columns in the 'columns' key.  Integer columns of
+        streamed responses are NumPy arrays.
 
     Returns
     -------
@@ -129,8 +180,28 @@ class REST_CASTable(object):
 
     def getNRows(self):
         ''' Get the number of rows '''
+        if 'rows' not in self._obj and 'columns' in self._obj:
+            columns = self._obj['columns']
+            return columns and len(columns[0]) or 0
         return len(self._obj.get('rows'))
 
+    def _get_first_value(self, i):
+        ''' Return the value of column `i` in the first row, or None '''
+        if 'rows' not in self._obj and 'columns' in self._obj:
+            columns = self._obj['columns']
+            if i < len(columns) and len(columns[i]):
+                return columns[i][0]
+            return
+        rows = self._obj.get('rows')
+        if rows and rows[0]:
+            return rows[0][i]
+
+    def _iter_columns(self):
+        ''' Iterate over the sequences of values in each column '''
+        if 'rows' not in self._obj and 'columns' in self._obj:
+            return iter(self._obj['columns'])
+        return zip(*self._obj.get('rows', []))
+
     def getColumnName(self, i):
         ''' Get the column name '''
         return self._obj.get('schema')[i].get('name')
@@ -143,8 +214,7 @@ class REST_CASTable(object):
         ''' Get the column type '''
         ctype = COL_TYPE_MAP.get(self._obj.get('schema')[i].get('type'),
                                  self._obj.get('schema')[i].get('type'))
-        rows = self._obj.get('rows')
-        if rows and rows[0] and isinstance(rows[0][i], (list, tuple)):
+        if isinstance(self._get_first_value(i), (list, tuple)):
             return '%s-array' % ctype
         return ctype
 
@@ -160,8 +230,7 @@ class REST_CASTable(object):
         ''' Get the number of array items in a column '''
         ctype = self.getColumnType(i)
         if ctype.endswith('-array'):
-            rows = self._obj.get('rows')
-            return len(rows[0][i])
+            return len(self._get_first_value(i))
         return 1
 
     def getLastErrorMessage(self):
@@ -265,47 +334,41 @@ class REST_CASTable(object):
     def toTuples(self, errors, cas2python_datetime, cas2python_date,
                  cas2python_time):
         ''' Get the table data as a list of tuples '''
+        # Streamed integer columns are NumPy arrays
+        columns = [x.tolist() if hasattr(x, 'tolist') else x
+                   for x in self.toColumns(errors, cas2python_datetime,
+                                           cas2python_date, cas2python_time)]
+        return list(zip(*columns))
+
+    def toColumns(self, errors, cas2python_datetime, cas2python_date,
+                  cas2python_time):
+        ''' Get the table data as a list of column value sequences '''
+        if not self.getNRows():
+            return [[] for i in range(self.getNColumns())]
+
         out = []
-        dtypes = []
-        for i in range(self.getNColumns()):
-            dtypes.append(self.getColumnType(i))
-        for row in self._obj.get('rows', []):
-            outrow = []
-            for dtype, item in zip(dtypes, row):
-                # Check for arrays
-                if isinstance(item, items_types):
-                    for elem in item:
-                        outrow.append(elem)
-                # Check for binary
-                elif isinstance(item, dict):
-                    try:
-                        outrow.append(base64.b64decode(item['data']))
-                    except Exception:
-                        try:
-                            outrow.append(base64.b64decode(item['data'] + '='))
-                        except Exception:
-                            outrow.append(base64.b64decode(item['data'] + '=='))
-                # Check for datetime, date, time
-                elif dtype == 'datetime':
-                    if item < decimal.Decimal('-9223372036854775807.5'):
-                        outrow.append(pd.NaT)
-                    else:
-                        outrow.append(cas2python_datetime(item))
-                elif dtype == 'date':
-                    if item < decimal.Decimal('-2147483647.5'):
-                        outrow.append(pd.NaT)
-                    else:
-                        outrow.append(cas2python_date(item))
-                elif dtype == 'time':
-                    if item < decimal.Decimal('-9223372036854775807.5'):
-                        outrow.append(pd.NaT)
-                    else:
-                        outrow.append(cas2python_time(item))
-                # Character
-                elif dtype in ['char', 'varchar']:
-                    outrow.append(item.rstrip())
-                # Everything else
-                else:
-                    outrow.append(_strip(item))
-            out.append(tuple(outrow))
+        for i, values in enumerate(self._iter_columns()):
+            dtype = self.getColumnType(i)
+            # Arrays are expanded into one column per element
+            if dtype.endswith('-array'):
+                out.extend(zip(*values))
+            # Numerics need no conversion
+            elif dtype in ['double', 'int32', 'int64']:
+                out.append(values)
+            elif dtype == 'datetime':
+                out.append(_convert_column(values, cas2python_datetime,
+                                           decimal.Decimal('-9223372036854775807.5')))
+            elif dtype == 'date':
+                out.append(_convert_column(values, cas2python_date,
+                                           decimal.Decimal('-2147483647.5')))
+            elif dtype == 'time':
+                out.append(_convert_column(values, cas2python_time,
+                                           decimal.Decimal('-9223372036854775807.5')))
+            # Character
+            elif dtype in ['char', 'varchar']:
+                out.append([x.rstrip() for x in values])
+            # Binary is base64 encoded
+            else:
+                out.append([_b64decode(x['data']) if isinstance(x, dict) else _strip(x)
+                            for x in values])
         return out
@@ -29,6 +29,7 @@ import inspect
 import numbers
 import re
 import sys
+import time
 import uuid
 import warnings
 import weakref
@@ -38,7 +39,7 @@ import six
 from .utils.datetime import sas2python_datetime
 from .utils.params import ParamManager, ActionParamManager
 from .utils.misc import super_dir
-from ..config import get_option
+from ..config import get_option, option_context
 from ..exceptions import SWATError
 from ..utils import dict2kwargs, getattr_safe_property, xdict
 from ..utils.compat import (int_types, binary_types, text_types, items_types,
@@ -78,6 +79,7 @@ OPERATOR_NAMES = {
 }
 
 MAX_INT64_INDEX = 2**63 - 1 - 1  # Extra one is for 1 indexing
+MAX_CHUNKSIZE = 10**6
 
 
 def _gen_table_name():
@@ -2221,6 +2223,26 @@ class CASTable(ParamManager, ActionParamManager):
             return dict(sortby=self._sortby, sastypes=False)
         return dict(sastypes=False)
 
+    def _merge_fetch_params(self, kwargs):
+        ''' Return a copy of `kwargs` with the fetch options and By variables added '''
+        kwargs = kwargs.copy()
+        for key, value in six.iteritems(self.get_fetch_params()):
+            if key in kwargs:
+                continue
+            if key == 'sortby' and ('orderby' in kwargs or 'orderBy' in kwargs):
+                continue
+            kwargs[key] = value
+
+        # Add grouping columns if they aren't in the list
+        groups = self.get_groupby_vars()
+        if groups and 'fetchvars' in kwargs:
+            kwargs['fetchvars'] = list(kwargs['fetchvars'])
+            for group in reversed(groups):
+                if group not in kwargs['fetchvars']:
+                    kwargs['fetchvars'].insert(0, group)
+
+        return kwargs
+
     def to_params(self):
         '''
         Return parameters of CASTable object
@@ -3080,6 +3102,191 @@ class CASTable(ParamManager, ActionParamManager):
         for col in self.columns:
             yield (col, self._to_column(col))
 
+    def _estimate_chunksize(self, budget):
+        '''
+        Estimate the number of rows that fit in the given number of bytes
+
+        The row size is estimated from the column widths in the
+        ``table.columninfo`` action results.
+
+        Parameters
+        ----------
+        budget : int
+            The target number of bytes for each fetch.
+
+        Returns
+        -------
+        int
+
+        '''
+        try:
+            width = int(self._columninfo['Width'].sum())
+        except Exception:
+            width = 0
+        return int(min(max(budget // max(width, 8), 1), MAX_CHUNKSIZE))
+
+    @staticmethod
+    def _adapt_chunksize(chunksize, nrows, nbytes, seconds, budget, latency):
+        '''
+        Compute the next chunk size from the measurements of the last fetch
+
+        Parameters
+        ----------
+        chunksize : int
+            The current chunk size.
+        nrows : int
+            The number of rows in the last fetch.
+        nbytes : int
+            The size of the last fetched DataFrame in bytes.
+        seconds : float
+            The duration of the last fetch.
+        budget : int
+            The target number of bytes for each fetch.
+        latency : float
+            The target duration of each fetch in seconds.  Zero means
+            that only the byte budget is used.
+
+        Returns
+        -------
+        int
+
+        '''
+        size = budget * nrows / float(max(nbytes, 1))
+        if latency and seconds > 0:
+            size = min(size, latency * nrows / seconds)
+        # Limit the change in each step to avoid oscillation
+        size = min(max(size, chunksize / 2.0), chunksize * 2.0)
+        return int(min(max(size, 1), MAX_CHUNKSIZE))
+
+    def _iter_chunks(self, chunksize, prefetch=0, chunk_hook=None):
+        '''
+        Iterate over the table data in chunks of rows
+
+        Parameters
+        ----------
+        chunksize : int or 'auto'
+            The number of rows to retrieve in each fetch.  If 'auto', the
+            chunk size is adjusted after each fetch to target the byte budget
+            and latency in the cas.dataset.iter_chunk_bytes and
+            cas.dataset.iter_chunk_seconds options.
+        prefetch : int, optional
+            The number of chunks to fetch in a background thread while
+            the current chunk is being processed.
+        chunk_hook : callable, optional
+            Function called with a dictionary of measurements after each
+            fetch.  The keys are 'start', 'stop', 'rows', 'bytes',
+            'seconds', and 'chunksize' (the chunk size for the next fetch).
+
+        Yields
+        ------
+        :class:`SASDataFrame`
+
+        '''
+        if prefetch:
+            for out in self._prefetch_chunks(chunksize, prefetch, chunk_hook=chunk_hook):
+                yield out
+            return
+
+        adaptive = chunksize == 'auto'
+        if adaptive:
+            budget = get_option('cas.dataset.iter_chunk_bytes')
+            latency = get_option('cas.dataset.iter_chunk_seconds')
+            chunksize = self._estimate_chunksize(budget)
+
+        start = 1
+        stop = chunksize
+
+        while True:
+            started = time.time()
+            out = self._fetch(from_=start, to=stop)
+            seconds = time.time() - started
+
+            if not len(out):
+                break
+
+            if adaptive or chunk_hook is not None:
+                nbytes = int(out.memory_usage(index=False, deep=True).sum())
+                if adaptive:
+                    chunksize = self._adapt_chunksize(chunksize, len(out), nbytes,
+                                                      seconds, budget, latency)
+                if chunk_hook is not None:
+                    chunk_hook(dict(start=start, stop=stop, rows=len(out),
+                                    bytes=nbytes, seconds=seconds,
+                                    chunksize=chunksize))
+
+            yield out
+
+            start = stop + 1
+            stop = start + chunksize - 1
+
+    def _prefetch_chunks(self, chunksize, prefetch, chunk_hook=None):
+        '''
+        Iterate over chunks of rows that are fetched in a background thread
+
+        At most `prefetch` chunks are held in the queue, so memory use is
+        bounded.  When the iterator is closed, the background thread is
+        stopped after the fetch that is in progress finishes.
+
+        Parameters
+        ----------
+        chunksize : int or 'auto'
+            The number of rows to retrieve in each fetch.
+        prefetch : int
+            The maximum number of chunks to fetch ahead of the consumer.
+        chunk_hook : callable, optional
+            Function called with the measurements of each fetch.
+            It is called from the background thread.
+
+        Yields
+        ------
+        :class:`SASDataFrame`
+
+        '''
+        import threading
+        from six.moves import queue
+
+        chunks = queue.Queue(maxsize=prefetch)
+        done = threading.Event()
+
+        def put(item):
+            ''' Add an item to the queue unless the iterator was closed '''
+            while not done.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch():
+            ''' Fetch chunks until the end of the table is reached '''
+            try:
+                for out in self._iter_chunks(chunksize, chunk_hook=chunk_hook):
+                    if not put(out):
+                        return
+            except Exception as exc:
+                put(exc)
+                return
+            put(None)
+
+        thread = threading.Thread(target=fetch)
+        thread.daemon = True
+        thread.start()
+
+        try:
+            while True:
+                out = chunks.get()
+                if out is None:
+                    break
+                if isinstance(out, Exception):
+                    raise out
+                yield out
+
+        finally:
+            done.set()
+            # Wait for the current fetch so that the connection can be reused
+            thread.join()
+
     def _generic_iter(self, name, *args, **kwargs):
         '''
         Generic iterator for various iteration implementations
@@ -3107,22 +3314,20 @@ class CASTable(ParamManager, ActionParamManager):
         if chunksize is None:
             chunksize = 200
 
+        prefetch = kwargs.pop('prefetch', None)
+        if prefetch is None:
+            prefetch = get_option('cas.dataset.prefetch')
+
+        chunk_hook = kwargs.pop('chunk_hook', None)
+
         # Remove index, we apply it ourselves
         if has_index:
             kwargs['index'] = False
 
         iterrows = name == 'iterrows' and True or False
 
-        start = 1
-        stop = chunksize
-
         i = 0
-        while True:
-            out = self._fetch(from_=start, to=stop)
-
-            if not len(out):
-                break
-
+        for out in self._iter_chunks(chunksize, prefetch=prefetch, chunk_hook=chunk_hook):
             for item in getattr(out, name)(*args, **kwargs):
                 # iterrows
                 if iterrows:
@@ -3140,17 +3345,26 @@ class CASTable(ParamManager, ActionParamManager):
 
                 i += 1
 
-            start = stop + 1
-            stop = start + chunksize
-
-    def iterrows(self, chunksize=None):
+    def iterrows(self, chunksize=None, prefetch=None, chunk_hook=None):
         '''
         Iterate over the rows of a CAS table as (index, :class:`pandas.Series`) pairs
 
         Parameters
         ----------
-        chunksize : int or long, optional
-            The number of rows to retrieve in each fetch.
+        chunksize : int or long or 'auto', optional
+            The number of rows to retrieve in each fetch.  If 'auto', the
+            chunk size is adjusted after each fetch to target the byte budget
+            and latency set by cas.dataset.iter_chunk_bytes and
+            cas.dataset.iter_chunk_seconds.
+        prefetch : int, optional
+            The number of chunks to fetch in a background thread while the
+            current chunk is processed.  The connection should not be used
+            for other actions until the iteration is complete or the iterator
+            is closed.  The default is set by cas.dataset.prefetch.
+        chunk_hook : callable, optional
+            Function called after each fetch with a dictionary containing
+            the keys 'start', 'stop', 'rows', 'bytes', 'seconds', and
+            'chunksize' (the chunk size for the next fetch).
 
         See Also
         --------
@@ -3162,9 +3376,10 @@ class CASTable(ParamManager, ActionParamManager):
         iterator of (index, :class:`pandas.Series`) tuples
 
         '''
-        return self._generic_iter('iterrows', chunksize=chunksize)
+        return self._generic_iter('iterrows', chunksize=chunksize, prefetch=prefetch,
+                                  chunk_hook=chunk_hook)
 
-    def itertuples(self, index=True, chunksize=None):
+    def itertuples(self, index=True, chunksize=None, prefetch=None, chunk_hook=None):
         '''
         Iterate over rows as tuples
 
@@ -3172,8 +3387,20 @@ class CASTable(ParamManager, ActionParamManager):
         ----------
         index : boolean, optional
             If True, return the index as the first item of the tuple.
-        chunksize : int or long, optional
-            The number of rows to retrieve in each fetch.
+        chunksize : int or long or 'auto', optional
+            The number of rows to retrieve in each fetch.  If 'auto', the
+            chunk size is adjusted after each fetch to target the byte budget
+            and latency set by cas.dataset.iter_chunk_bytes and
+            cas.dataset.iter_chunk_seconds.
+        prefetch : int, optional
+            The number of chunks to fetch in a background thread while the
+            current chunk is processed.  The connection should not be used
+            for other actions until the iteration is complete or the iterator
+            is closed.  The default is set by cas.dataset.prefetch.
+        chunk_hook : callable, optional
+            Function called after each fetch with a dictionary containing
+            the keys 'start', 'stop', 'rows', 'bytes', 'seconds', and
+            'chunksize' (the chunk size for the next fetch).
 
         See Also
         --------
@@ -3185,7 +3412,8 @@ class CASTable(ParamManager, ActionParamManager):
         iterator of row tuples
 
         '''
-        return self._generic_iter('itertuples', index=index, chunksize=chunksize)
+        return self._generic_iter('itertuples', index=index, chunksize=chunksize,
+                                  prefetch=prefetch, chunk_hook=chunk_hook)
 
     def get_value(self, index, col, **kwargs):
         ''' Retrieve a single scalar value '''
@@ -6770,17 +6998,8 @@ class CASTable(ParamManager, ActionParamManager):
         :class:`SASDataFrame`
 
         '''
-        from .. import dataframe as df
-
-        kwargs = kwargs.copy()
         groups = self.get_groupby_vars()
-
-        for key, value in six.iteritems(self.get_fetch_params()):
-            if key in kwargs:
-                continue
-            if key == 'sortby' and ('orderby' in kwargs or 'orderBy' in kwargs):
-                continue
-            kwargs[key] = value
+        kwargs = self._merge_fetch_params(kwargs)
 
         from_ = 0
         if 'from' in kwargs:
@@ -6808,33 +7027,16 @@ class CASTable(ParamManager, ActionParamManager):
         if 'index' not in kwargs:
             kwargs['index'] = True
 
-        # Add grouping columns if they aren't in the list
-        columns = None
-        if groups and 'fetchvars' in kwargs:
-            kwargs['fetchvars'] = list(kwargs['fetchvars'])
-            for group in reversed(groups):
-                if group not in kwargs['fetchvars']:
-                    kwargs['fetchvars'].insert(0, group)
-            columns = kwargs['fetchvars']
-        elif 'fetchvars' in kwargs:
-            columns = kwargs['fetchvars']
+        columns = kwargs.get('fetchvars')
 
         tbl = self._sample(sample_pct=sample_pct, sample_seed=sample_seed,
                            stratify_by=stratify_by, columns=columns)
 
-        # Sort based on 'Fetch#' key.  This will be out of order in REST.
-        values = [x[1] for x in sorted(tbl._retrieve('table.fetch', **kwargs).items(),
-                  key=lambda x: int(x[0].replace('Fetch', '') or '0'))]
-        out = df.concat(values)
+        out = self._fetch_results_to_frame(tbl._retrieve('table.fetch', **kwargs))
 
         if tbl is not self:
             tbl._retrieve('table.droptable')
 
-        if len(out.columns) and out.columns[0] == '_Index_':
-            out['_Index_'] = out['_Index_'] - 1
-            out = out.set_index('_Index_')
-            out.index.name = None
-
         if grouped and groups:
             return out.groupby(groups)
 
@@ -6885,6 +7087,139 @@ class CASTable(ParamManager, ActionParamManager):
 
         return out
 
+    @staticmethod
+    def _fetch_results_to_frame(results):
+        '''
+        Combine the tables from a table.fetch action into one DataFrame
+
+        Parameters
+        ----------
+        results : dict-like
+            The results of the table.fetch action
+
+        Returns
+        -------
+        :class:`SASDataFrame`
+
+        '''
+        from .. import dataframe as df
+
+        # Sort based on 'Fetch#' key.  This will be out of order in REST.
+        values = [x[1] for x in sorted(results.items(),
+                  key=lambda x: int(x[0].replace('Fetch', '') or '0'))]
+        out = df.concat(values)
+
+        if len(out.columns) and out.columns[0] == '_Index_':
+            out['_Index_'] = out['_Index_'] - 1
+            out = out.set_index('_Index_')
+            out.index.name = None
+
+        return out
+
+    def _fetch_parallel(self, parallel, **kwargs):
+        '''
+        Fetch rows using multiple sessions concurrently
+
+        The requested rows are split into `parallel` disjoint ranges
+        which are each fetched by a session created by :meth:`CAS.fork`.
+        The fetches are started with :meth:`invoke` (with the
+        cas.http.concurrent_invoke option enabled for REST connections)
+        and collected with :func:`getnext`.  The results are combined in
+        row order.  Only tables that are
+        visible to other sessions (i.e., global tables) can be fetched
+        in parallel.  Session tables are fetched using a single session.
+
+        Parameters
+        ----------
+        parallel : int
+            The maximum number of sessions to use.
+        **kwargs : keyword arguments, optional
+            Additional keyword parameters to the ``table.fetch`` CAS action.
+
+        Returns
+        -------
+        :class:`SASDataFrame`
+
+        '''
+        from .. import dataframe as df
+        from .connection import getnext
+        from .rest.connection import REST_CASConnection
+
+        kwargs = kwargs.copy()
+
+        from_ = kwargs.pop('from', kwargs.pop('from_', 1)) or 1
+        to = min(kwargs.pop('to', MAX_INT64_INDEX), self._numrows)
+        nrows = max(to - from_ + 1, 0)
+        parallel = min(parallel, nrows)
+
+        if parallel > 1 and \
+                not self._retrieve('table.tableinfo')['TableInfo']['Global'].iloc[0]:
+            warnings.warn('Session tables can not be fetched in parallel.  '
+                          'Use a global table for parallel fetches.', RuntimeWarning)
+            parallel = 1
+
+        if parallel < 2:
+            kwargs['from'] = from_
+            kwargs['to'] = to
+            return self._fetch(**kwargs)
+
+        kwargs = self._merge_fetch_params(kwargs)
+
+        if 'index' not in kwargs:
+            kwargs['index'] = True
+
+        # Split the rows into contiguous, disjoint ranges
+        size = (nrows + parallel - 1) // parallel
+        ranges = [(start, min(start + size - 1, to))
+                  for start in range(from_, to + 1, size)]
+
+        conn = self.get_connection()
+        conns = conn.fork(len(ranges))
+        try:
+            tables = []
+            for item in conns:
+                tbl = self.copy()
+                tbl.set_connection(item)
+                tables.append(tbl)
+
+            with option_context('cas.http.concurrent_invoke', True):
+                for tbl, (start, stop) in zip(tables, ranges):
+                    tbl.invoke('table.fetch', _apptag='UI', _messagelevel='error',
+                               **dict(kwargs, **{'from': start, 'to': stop}))
+
+            # Read all of the responses, so that none are left on the
+            # connection of this table if a fetch fails
+            results = [{} for x in conns]
+            errors = []
+            for resp, item in getnext(conns):
+                if resp is None or item is None:
+                    continue
+                if resp.disposition.severity > 1:
+                    errors.append(resp.disposition.status)
+                    continue
+                i = [id(x) for x in conns].index(id(item))
+                for key, value in resp:
+                    results[i][key] = value
+            if errors:
+                raise SWATError(errors[0])
+
+        finally:
+            # Wait for REST requests that are still running after an error
+            for item in conns:
+                if isinstance(item._sw_connection, REST_CASConnection) \
+                        and item._sw_connection.hasPendingResponses():
+                    try:
+                        item._sw_connection.receive()
+                    except Exception:
+                        pass
+            for item in conns[1:]:
+                try:
+                    item.terminate()
+                except Exception:
+                    item.close()
+
+        return df.concat([self._fetch_results_to_frame(x) for x in results])
+
     def _fetchall(self, grouped=False, sample_pct=None, sample_seed=None,
                   sample=False, stratify_by=None, **kwargs):
         ''' Fetch all rows '''
@@ -7230,7 +7565,7 @@ class CASTable(ParamManager, ActionParamManager):
             buf.write(u'memory usage: %s\n' % details['AllocatedMemory'])
 
     def to_frame(self, sample_pct=None, sample_seed=None, sample=False,
-                 stratify_by=None, **kwargs):
+                 stratify_by=None, parallel=None, **kwargs):
         '''
         Retrieve entire table as a SASDataFrame
 
@@ -7242,6 +7577,13 @@ class CASTable(ParamManager, ActionParamManager):
         sample_seed : int, optional
             The seed to use for sampling.  This is used when deterministic
             results are required.
+        parallel : int, optional
+            The number of sessions to use to fetch disjoint ranges of rows
+            concurrently.  Additional sessions are created using
+            :meth:`CAS.fork` and are ended when the fetch is complete.
+            This only applies to global tables that aren't sampled.
+            When fetching in parallel, rows are only returned in a consistent
+            order if the table is sorted (e.g., using :meth:`sort_values`).
         **kwargs : keyword arguments, optional
             Additional keyword parameters to the ``table.fetch`` CAS action.
 
@@ -7250,6 +7592,8 @@ class CASTable(ParamManager, ActionParamManager):
         :class:`SASDataFrame`
 
         '''
+        if parallel and parallel > 1 and not (sample or sample_pct or stratify_by):
+            return self._fetch_parallel(parallel, **kwargs)
         return self._fetchall(sample_pct=sample_pct, sample_seed=sample_seed,
                               sample=sample, stratify_by=stratify_by, **kwargs)
 
@@ -9381,9 +9725,10 @@ class CASColumn(CASTable):
         for item in self._generic_iter('itertuples', index=False):
             yield item[0]
 
-    def iteritems(self, chunksize=None):
+    def iteritems(self, chunksize=None, prefetch=None, chunk_hook=None):
         ''' Lazily iterate over (index, value) tuples '''
-        return self._generic_iter('itertuples', index=True, chunksize=chunksize)
+        return self._generic_iter('itertuples', index=True, chunksize=chunksize,
+                                  prefetch=prefetch, chunk_hook=chunk_hook)
 
     def _is_numeric(self):
         ''' Return boolean indicating if the data type is numeric '''
@@ -24,23 +24,30 @@ Utilities for converting to and from Python and CAS arguments
 from __future__ import print_function, division, absolute_import, unicode_literals
 
 import base64
+import collections
+import copy
 import datetime
+import functools
+import logging
 import warnings
 import numpy as np
 import pandas as pd
 import re
 import six
+import threading
 from .utils import datetime as casdt
 from .. import clib
 from ..utils.compat import (a2u, a2n, int32, int64, float64, text_types,
                             binary_types, int32_types, int64_types,
                             float64_types, items_types, dict_types,
                             MAX_INT32, MIN_INT32)
+from ..utils.config import subscribe
 from ..utils.keyword import keywordify
 from ..config import get_option
 from ..clib import errorcheck
 from ..formatter import SASFormatter
-from ..dataframe import SASDataFrame, SASColumnSpec
+from ..logging import logger
+from ..dataframe import SASDataFrame, LazySASDataFrame, SASColumnSpec
 from .table import CASTable
 from .types import nil, blob
 from .utils.params import ParamManager
@@ -135,6 +142,540 @@ def _caslist2py(_sw_value, soptions, echk, connection=None):
         return output
 
 
+# Option values and conversion plans used by ctb2tabular.  These are
+# cleared whenever an option is set.
+_option_cache = {}
+_plan_cache = collections.OrderedDict()
+_plan_lock = threading.Lock()
+
+
+def _clear_caches(key, value):
+    ''' Clear the option value and conversion plan caches '''
+    _option_cache.clear()
+    with _plan_lock:
+        _plan_cache.clear()
+
+
+subscribe(_clear_caches)
+
+
+def _get_option(key):
+    ''' Return the cached value of an option '''
+    try:
+        return _option_cache[key]
+    except KeyError:
+        value = _option_cache[key] = get_option(key)
+        return value
+
+
+def _format_regex(key):
+    ''' Create a regular expression that matches the formats in the given option '''
+    formats = _get_option(key)
+    if isinstance(formats, six.string_types):
+        formats = [formats]
+    return re.compile(r'^(%s)(\d*\.\d*)?$' % '|'.join(formats), flags=re.I)
+
+
+def _table_schema(_sw_table):
+    '''
+    Return a hashable description of the columns in a SWIG table
+
+    This is the key of the conversion plan cache, so only column
+    properties that are cheap to read are used.  The extended attributes
+    of the columns are read when a plan is built.
+
+    Parameters
+    ----------
+    _sw_table : SWIG table object
+       The SWIG CASTable object
+
+    Returns
+    -------
+    tuple
+       One tuple per column containing the name, label, type, format,
+       width, and number of array items of the column
+
+    '''
+    check = errorcheck
+    out = []
+    for i in range(check(_sw_table.getNColumns(), _sw_table)):
+        dtype = check(a2u(_sw_table.getColumnType(i), 'utf-8'), _sw_table)
+        out.append((
+            check(a2u(_sw_table.getColumnName(i), 'utf-8'), _sw_table),
+            check(a2u(_sw_table.getColumnLabel(i), 'utf-8'), _sw_table),
+            dtype,
+            check(a2u(_sw_table.getColumnFormat(i), 'utf-8'), _sw_table),
+            check(_sw_table.getColumnWidth(i), _sw_table),
+            check(_sw_table.getColumnArrayNItems(i), _sw_table)
+            if dtype.endswith('-array') else 1))
+    return tuple(out)
+
+
+def _conversion_plan(_sw_table):
+    '''
+    Return the conversion plan for the columns of a SWIG table
+
+    Plans are kept in a least-recently-used cache whose size is set by
+    the cas.dataset.plan_cache_size option.  The cache can be used from
+    multiple threads.
+
+    Parameters
+    ----------
+    _sw_table : SWIG table object
+       The SWIG CASTable object
+
+    Returns
+    -------
+    dict
+
+    '''
+    schema = _table_schema(_sw_table)
+    with _plan_lock:
+        plan = _plan_cache.pop(schema, None)
+    if plan is None:
+        plan = _build_plan(_sw_table, schema)
+    size = _get_option('cas.dataset.plan_cache_size')
+    if size:
+        with _plan_lock:
+            _plan_cache[schema] = plan
+            while len(_plan_cache) > size:
+                _plan_cache.popitem(last=False)
+    return plan
+
+
+def _build_plan(_sw_table, schema):
+    '''
+    Compute the column data types and conversions for a SWIG table
+
+    Parameters
+    ----------
+    _sw_table : SWIG table object
+       The SWIG CASTable object
+    schema : tuple
+       The table schema from :func:`_table_schema`
+
+    Returns
+    -------
+    dict
+
+    '''
+    datetime_regex = _format_regex('cas.dataset.datetime_formats')
+    date_regex = _format_regex('cas.dataset.date_formats')
+    time_regex = _format_regex('cas.dataset.time_formats')
+
+    caslib = None
+    tablename = None
+    castable = None
+    rowscol = None
+    columnscol = None
+    unknownname = None
+    dtypes = []
+    colinfo = {}
+    mimetypes = {}
+    dates = []
+    datetimes = []
+    times = []
+    intmiss = {}
+    for i, (name, label, dtype, format, width, nitems) in enumerate(schema):
+        attrs = SASColumnSpec.attrs_fromtable(_sw_table, i)
+        col = SASColumnSpec(name=name, label=label, dtype=dtype, width=width,
+                            format=format, size=(1, nitems), attrs=attrs)
+        if col.attrs.get('MIMEType'):
+            mimetypes[col.name] = col.attrs.get('MIMEType')
+        lowercolname = col.name.lower()
+        if lowercolname == 'caslib':
+            caslib = col.name
+        elif lowercolname == 'tablename':
+            tablename = col.name
+        elif lowercolname == 'castable':
+            castable = col.name
+        elif lowercolname == 'name':
+            unknownname = col.name
+        elif lowercolname == 'rows':
+            rowscol = col.name
+        elif lowercolname == 'columns':
+            columnscol = col.name
+        if dtype == 'double':
+            dtypes.append((col.name, 'f8'))
+            colinfo[col.name] = col
+            if col.format:
+                if datetime_regex.match(col.format):
+                    datetimes.append(col.name)
+                elif date_regex.match(col.format):
+                    dates.append(col.name)
+                elif time_regex.match(col.format):
+                    times.append(col.name)
+        elif dtype in set(['char', 'varchar']):
+            dtypes.append((col.name, 'O'))
+            colinfo[col.name] = col
+        elif dtype == 'int32':
+            dtypes.append((col.name, 'i4'))
+            colinfo[col.name] = col
+            intmiss[col.name] = -2147483648
+        elif dtype == 'int64':
+            dtypes.append((col.name, 'i8'))
+            colinfo[col.name] = col
+            intmiss[col.name] = -9223372036854775808
+        elif dtype in 'datetime':
+            dtypes.append((col.name, 'O'))
+            colinfo[col.name] = col
+        elif dtype == 'date':
+            dtypes.append((col.name, 'O'))
+            colinfo[col.name] = col
+        elif dtype == 'time':
+            dtypes.append((col.name, 'O'))
+            colinfo[col.name] = col
+        elif dtype in set(['binary', 'varbinary']):
+            dtypes.append((col.name, 'O'))
+            colinfo[col.name] = col
+        elif dtype.endswith('-array'):
+            npdtype = {'int32-array': 'i4', 'int64-array': 'i8',
+                       'double-array': 'f8'}.get(dtype)
+            if npdtype is None:
+                continue
+            for elem in range(nitems):
+                col = SASColumnSpec(name=name + str(elem + 1), label=label,
+                                    dtype=dtype, width=width, format=format,
+                                    size=(1, nitems), attrs=dict(attrs))
+                dtypes.append((col.name, npdtype))
+                colinfo[col.name] = col
+                if npdtype == 'i4':
+                    intmiss[col.name] = -2147483648
+                elif npdtype == 'i8':
+                    intmiss[col.name] = -9223372036854775808
+
+    # Detect casout tables
+    if not(tablename) and unknownname and columnscol and rowscol:
+        tablename = unknownname
+
+    strcols = [x[0] for x in dtypes if colinfo[x[0]].dtype in ['char', 'varchar']]
+
+    return dict(dtypes=dtypes, colinfo=colinfo, dates=dates, datetimes=datetimes,
+                times=times, intmiss=intmiss, caslib=caslib, tablename=tablename,
+                castable=castable, strcols=strcols,
+                converters=_column_converters(dates, datetimes, times, intmiss,
+                                              mimetypes, strcols))
+
+
+def _ctb2columns(_sw_table, dtypes):
+    '''
+    Decode the data in a SWIG table into one NumPy array per column
+
+    Parameters
+    ----------
+    _sw_table : SWIG table object
+       The SWIG CASTable object
+    dtypes : list of two-element tuples
+       The column names and NumPy data types of the output columns
+
+    Returns
+    -------
+    OrderedDict
+       Column names mapped to NumPy arrays
+
+    '''
+    args = (a2n(_get_option('encoding_errors'), 'utf-8'),
+            casdt.cas2python_datetime, casdt.cas2python_date, casdt.cas2python_time)
+
+    # Use column-oriented data if the table supports it, otherwise transpose the rows
+    if hasattr(_sw_table, 'toColumns'):
+        columns = _sw_table.toColumns(*args)
+    else:
+        columns = list(zip(*_sw_table.toTuples(*args))) or [()] * len(dtypes)
+
+    out = collections.OrderedDict()
+    for (name, dtype), values in zip(dtypes, columns):
+        if dtype == 'O':
+            # Assign into an empty array so that sequence values are not broadcast
+            out[name] = np.empty(len(values), dtype=object)
+            out[name][:] = values
+        else:
+            out[name] = np.asarray(values, dtype=dtype)
+    return out
+
+
+def _int_missing_array(values, missing, nullable=False):
+    '''
+    Convert integer missing values
+
+    Parameters
+    ----------
+    values : :func:`numpy.ndarray`
+       The integer column data
+    missing : int
+       The missing value of the column
+    nullable : bool, optional
+       Should a pandas nullable integer array be returned?  If False,
+       columns containing missing values are converted to float64.
+
+    Returns
+    -------
+    array-like
+
+    '''
+    mask = values == missing
+    if nullable:
+        return pd.arrays.IntegerArray(values, mask)
+    if mask.any():
+        values = values.astype('float64')
+        values[mask] = np.nan
+    return values
+
+
+def _categorical_array(values, ratio):
+    '''
+    Convert character data to a categorical if it has few unique values
+
+    Parameters
+    ----------
+    values : :func:`numpy.ndarray`
+       The character column data
+    ratio : float
+       The maximum ratio of unique values to rows
+
+    Returns
+    -------
+    :func:`numpy.ndarray` or :class:`pandas.Categorical`
+
+    '''
+    if not len(values):
+        return values
+    out = pd.Categorical(values)
+    if len(out.categories) <= ratio * len(values):
+        return out
+    return values
+
+
+def _image_array(values, Image):
+    ''' Convert binary data to Image objects '''
+    from io import BytesIO
+    out = np.empty(len(values), dtype=object)
+    out[:] = [Image.open(BytesIO(x)) for x in values]
+    return out
+
+
+def _column_converters(dates, datetimes, times, intmiss, mimetypes, strcols):
+    '''
+    Return the functions that convert the raw data of each column
+
+    Parameters
+    ----------
+    dates, datetimes, times : lists of strings
+       The names of SAS date, datetime, and time columns
+    intmiss : dict
+       Integer column names mapped to their missing value
+    mimetypes : dict
+       Column names mapped to the MIME type of their data
+    strcols : list of strings
+       The names of the character columns
+
+    Returns
+    -------
+    dict
+       Column names mapped to conversion functions
+
+    '''
+    converters = {}
+
+    nullable = _get_option('cas.dataset.int_missing') == 'nullable'
+    for name, missing in intmiss.items():
+        converters[name] = functools.partial(_int_missing_array, missing=missing,
+                                             nullable=nullable)
+
+    ratio = _get_option('cas.dataset.categorical_ratio')
+    if ratio:
+        for name in strcols:
+            converters[name] = functools.partial(_categorical_array, ratio=ratio)
+
+    Image = True
+    for name, value in mimetypes.items():
+        if value.startswith('image/'):
+            if Image is True:
+                Image = None
+                try:
+                    from PIL import Image
+                except ImportError:
+                    warnings.warn('The PIL or Pillow package is required '
+                                  'to convert bytes to Image objects',
+                                  RuntimeWarning)
+            if Image is None:
+                continue
+            converters[name] = functools.partial(_image_array, Image=Image)
+
+    for name in dates:
+        converters[name] = casdt.sas2python_date_array
+    for name in datetimes:
+        converters[name] = casdt.sas2python_datetime_array
+    for name in times:
+        converters[name] = casdt.sas2python_time_array
+
+    return converters
+
+
+def _report_string_memory(data, colinfo, strcols):
+    '''
+    Log the memory used by character columns
+
+    The memory used is reported along with the memory that fixed-width
+    NumPy strings would have used.  This is only computed when debug
+    logging is enabled.
+
+    Parameters
+    ----------
+    data : OrderedDict
+       Column names mapped to column data
+    colinfo : dict
+       Column names mapped to :class:`SASColumnSpec` objects
+    strcols : list of strings
+       The names of the character columns
+
+    '''
+    if not strcols or not logger.isEnabledFor(logging.DEBUG):
+        return
+    fixed = 0
+    used = 0
+    for name in strcols:
+        fixed += 4 * (colinfo[name].width or 0) * len(data[name])
+        used += pd.Series(data[name]).memory_usage(index=False, deep=True)
+    logger.debug('Character columns use {} bytes, {} bytes less than '
+                 'fixed-width strings'.format(used, fixed - used))
+
+
+def _set_index(cdf):
+    '''
+    Set the index of a DataFrame according to the cas.dataset.index_name option
+
+    Parameters
+    ----------
+    cdf : DataFrame
+       The DataFrame to modify in place
+
+    Returns
+    -------
+    DataFrame
+
+    '''
+    index = _get_option('cas.dataset.index_name')
+    if index:
+        if not isinstance(index, (list, tuple, set)):
+            index = [index]
+        for idx in index:
+            if idx in cdf.columns:
+                if cdf.attrs.get('ByVar1'):
+                    cdf.set_index([idx], append=True, inplace=True)
+                else:
+                    cdf.set_index([idx], inplace=True)
+                adjust = _get_option('cas.dataset.index_adjustment')
+                if adjust != 0 and str(cdf.index.dtype).lower().startswith('int'):
+                    names = cdf.index.names
+                    cdf.index = cdf.index.values + adjust
+                    cdf.index.names = names
+                if _get_option('cas.dataset.drop_index_name'):
+                    names = list(cdf.index.names)
+                    names[-1] = None
+                    cdf.index.names = names
+                # Only set one index
+                break
+    return cdf
+
+
+def _columns2arrow(columns, colinfo, meta, dates, datetimes, times, intmiss):
+    '''
+    Convert decoded table columns to a PyArrow Table
+
+    Parameters
+    ----------
+    columns : OrderedDict
+       Column names mapped to NumPy arrays
+    colinfo : dict
+       Column names mapped to :class:`SASColumnSpec` objects
+    meta : dict
+       The name, label, and title of the table
+    dates, datetimes, times : lists of strings
+       The names of SAS date, datetime, and time columns
+    intmiss : dict
+       Integer column names mapped to their missing value
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+
+    '''
+    import pyarrow as pa
+
+    arrays = []
+    fields = []
+    for name, values in columns.items():
+        col = colinfo[name]
+        if name in intmiss:
+            array = pa.array(values, mask=(values == intmiss[name]))
+        elif name in datetimes:
+            array = pa.array(casdt.sas2python_datetime_array(values))
+        elif name in dates:
+            array = pa.array(casdt.sas2python_date_array(values),
+                             type=pa.date32(), from_pandas=True)
+        elif name in times:
+            array = pa.array(casdt.sas2python_time_array(values),
+                             type=pa.time64('us'), from_pandas=True)
+        elif col.dtype in ['char', 'varchar']:
+            array = pa.array(values, type=pa.string(), from_pandas=True)
+        elif col.dtype in ['binary', 'varbinary']:
+            array = pa.array(values, type=pa.binary(), from_pandas=True)
+        else:
+            array = pa.array(values, from_pandas=True)
+
+        # CAS column metadata is stored as field metadata
+        fieldmeta = dict(type=col.dtype)
+        for key in ['label', 'format', 'width']:
+            value = getattr(col, key, None)
+            if value:
+                fieldmeta[key] = '%s' % value
+
+        arrays.append(array)
+        fields.append(pa.field(name, array.type, metadata=fieldmeta))
+
+    return pa.Table.from_arrays(arrays, schema=pa.schema(
+        fields, metadata=dict((k, v) for k, v in meta.items() if v)))
+
+
+def _lazy_frame(kwargs, converters):
+    '''
+    Create a LazySASDataFrame from the arguments for a SASDataFrame
+
+    The column specified by the cas.dataset.index_name option is
+    converted immediately and used as the index.
+
+    Parameters
+    ----------
+    kwargs : dict
+       The SASDataFrame constructor arguments
+    converters : dict
+       Column names mapped to conversion functions
+
+    Returns
+    -------
+    :class:`LazySASDataFrame`
+
+    '''
+    kwargs = kwargs.copy()
+    data = kwargs.pop('data')
+
+    index = None
+    names = _get_option('cas.dataset.index_name')
+    if names:
+        if not isinstance(names, (list, tuple, set)):
+            names = [names]
+        for idx in names:
+            if idx in data:
+                values = data.pop(idx)
+                if idx in converters:
+                    values = converters.pop(idx)(values)
+                index = _set_index(pd.DataFrame({idx: values})).index
+                break
+
+    return LazySASDataFrame(data, converters=converters, index=index, **kwargs)
+
+
 def ctb2tabular(_sw_table, soptions='', connection=None):
     '''
     Convert SWIG table to a tabular structure based on cas.dataset.format option
@@ -160,14 +701,16 @@ def ctb2tabular(_sw_table, soptions='', connection=None):
        Any variant of the Pandas DataFrame.to_dict() results
     tuple
        A tuple of tuples of the data values only
+    pyarrow.Table
+       PyArrow Table with CAS column metadata in the field metadata
 
     '''
-    tformat = get_option('cas.dataset.format')
+    tformat = _get_option('cas.dataset.format')
     needattrs = (tformat == 'dataframe:sas')
 
     # We can short circuit right away if they just want tuples
     if tformat.startswith('tuple'):
-        return _sw_table.toTuples(a2n(get_option('encoding_errors'), 'utf-8'),
+        return _sw_table.toTuples(a2n(_get_option('encoding_errors'), 'utf-8'),
                                   casdt.cas2python_datetime,
                                   casdt.cas2python_date,
                                   casdt.cas2python_time)
@@ -230,192 +773,67 @@ def ctb2tabular(_sw_table, soptions='', connection=None):
                         _sw_table))
     kwargs['attrs'] = attrs
 
-    # Setup date / datetime regexes
+    # Get the conversion plan for the columns
+    plan = _conversion_plan(_sw_table)
+    dtypes = plan['dtypes']
+    dates = plan['dates']
+    datetimes = plan['datetimes']
+    times = plan['times']
+    intmiss = plan['intmiss']
+    caslib = plan['caslib']
+    tablename = plan['tablename']
+    castable = plan['castable']
+
+    # Each result gets its own column metadata since it can be modified
+    colinfo = {}
+    for key, value in plan['colinfo'].items():
+        colinfo[key] = copy.copy(value)
+        colinfo[key].attrs = dict(value.attrs)
+    kwargs['colinfo'] = colinfo
 
-    dt_formats = get_option('cas.dataset.datetime_formats')
-    if isinstance(dt_formats, six.string_types):
-        dt_formats = [dt_formats]
-    datetime_regex = re.compile(r'^(%s)(\d*\.\d*)?$' % '|'.join(dt_formats), flags=re.I)
+    # Decode the data into one array per column
+    kwargs['data'] = _ctb2columns(_sw_table, dtypes)
 
-    d_formats = get_option('cas.dataset.date_formats')
-    if isinstance(d_formats, six.string_types):
-        d_formats = [d_formats]
-    date_regex = re.compile(r'^(%s)(\d*\.\d*)?$' % '|'.join(d_formats), flags=re.I)
+    if tformat in ['arrow', 'dataframe:arrow']:
+        out = _columns2arrow(kwargs['data'], colinfo,
+                             dict(name=kwargs['name'], label=kwargs['label'],
+                                  title=kwargs['title']),
+                             dates, datetimes, times, intmiss)
+        if tformat == 'arrow':
+            return out
+        return _set_index(out.to_pandas(types_mapper=pd.ArrowDtype))
 
-    t_formats = get_option('cas.dataset.time_formats')
-    if isinstance(t_formats, six.string_types):
-        t_formats = [t_formats]
-    time_regex = re.compile(r'^(%s)(\d*\.\d*)?$' % '|'.join(t_formats), flags=re.I)
+    data = kwargs['data']
+    strcols = plan['strcols']
+    converters = dict(plan['converters'])
 
-    # Construct columns
-    ncolumns = check(_sw_table.getNColumns(), _sw_table)
-    caslib = None
-    tablename = None
-    castable = None
-    rowscol = None
-    columnscol = None
-    unknownname = None
-    dtypes = []
-    colinfo = {}
-    mimetypes = {}
-    dates = []
-    datetimes = []
-    times = []
-    intmiss = {}
-    for i in range(ncolumns):
-        col = SASColumnSpec.fromtable(_sw_table, i)
-        if col.attrs.get('MIMEType'):
-            mimetypes[col.name] = col.attrs.get('MIMEType')
-        lowercolname = col.name.lower()
-        if lowercolname == 'caslib':
-            caslib = col.name
-        elif lowercolname == 'tablename':
-            tablename = col.name
-        elif lowercolname == 'castable':
-            castable = col.name
-        elif lowercolname == 'name':
-            unknownname = col.name
-        elif lowercolname == 'rows':
-            rowscol = col.name
-        elif lowercolname == 'columns':
-            columnscol = col.name
-        dtype = col.dtype
-        if dtype == 'double':
-            dtypes.append((col.name, 'f8'))
-            colinfo[col.name] = col
-            if col.format:
-                if datetime_regex.match(col.format):
-                    datetimes.append(col.name)
-                elif date_regex.match(col.format):
-                    dates.append(col.name)
-                elif time_regex.match(col.format):
-                    times.append(col.name)
-        elif dtype in set(['char', 'varchar']):
-            dtypes.append((col.name, '|U%d' % (col.width or 1)))
-            colinfo[col.name] = col
-        elif dtype == 'int32':
-            dtypes.append((col.name, 'i4'))
-            colinfo[col.name] = col
-            intmiss[col.name] = {-2147483648: np.nan}
-        elif dtype == 'int64':
-            dtypes.append((col.name, 'i8'))
-            colinfo[col.name] = col
-            intmiss[col.name] = {-9223372036854775808: np.nan}
-        elif dtype in 'datetime':
-            dtypes.append((col.name, 'O'))
-            colinfo[col.name] = col
-        elif dtype == 'date':
-            dtypes.append((col.name, 'O'))
-            colinfo[col.name] = col
-        elif dtype == 'time':
-            dtypes.append((col.name, 'O'))
-            colinfo[col.name] = col
-        elif dtype in set(['binary', 'varbinary']):
-            dtypes.append((col.name, 'O'))
-            colinfo[col.name] = col
-        elif dtype == 'int32-array':
-            for elem in range(col.size[1]):
-                col = SASColumnSpec.fromtable(_sw_table, i, elem=elem)
-                dtypes.append((col.name, 'i4'))
-                colinfo[col.name] = col
-                intmiss[col.name] = {-2147483648: np.nan}
-        elif dtype == 'int64-array':
-            for elem in range(col.size[1]):
-                col = SASColumnSpec.fromtable(_sw_table, i, elem=elem)
-                dtypes.append((col.name, 'i8'))
-                colinfo[col.name] = col
-                intmiss[col.name] = {-9223372036854775808: np.nan}
-        elif dtype == 'double-array':
-            for elem in range(col.size[1]):
-                col = SASColumnSpec.fromtable(_sw_table, i, elem=elem)
-                dtypes.append((col.name, 'f8'))
-                colinfo[col.name] = col
-    kwargs['colinfo'] = colinfo
+    # Defer the conversions until the columns are accessed
+    if _get_option('cas.dataset.lazy') and tformat == 'dataframe:sas' \
+            and not attrs.get('ByVar1') and not (caslib and tablename and not castable):
+        return _lazy_frame(kwargs, converters)
 
-    # Numpy doesn't like unicode column names in Python 2, so map them to utf-8
-    dtypes = [(a2n(x[0], 'utf-8'), x[1]) for x in dtypes]
+    for name, func in converters.items():
+        data[name] = func(data[name])
 
-    # Create a np.array and fill it
-    kwargs['data'] = np.array(_sw_table.toTuples(a2n(
-        get_option('encoding_errors'), 'utf-8'),
-        casdt.cas2python_datetime, casdt.cas2python_date,
-        casdt.cas2python_time), dtype=dtypes)
+    _report_string_memory(data, colinfo, strcols)
 
-    # Short circuit for numpy arrays
-#   if tformat == 'numpy_array':
-#       return kwargs['data']
+    kwargs['columns'] = [x[0] for x in dtypes]
+    kwargs['copy'] = False
 
     cdf = SASDataFrame(**kwargs)
 
-    # Map column names back to unicode in pandas
-    cdf.columns = [a2u(x[0], 'utf-8') for x in dtypes]
-
-    # Apply int missing values
-    if intmiss:
-        cdf = cdf.replace(to_replace=intmiss)
-
-    # Apply mimetype transformations
-    if mimetypes:
-        from io import BytesIO
-        Image = True
-        for key, value in mimetypes.items():
-            if value.startswith('image/'):
-                if Image is True:
-                    Image = None
-                    try:
-                        from PIL import Image
-                    except ImportError:
-                        warnings.warn('The PIL or Pillow package is required '
-                                      'to convert bytes to Image objects',
-                                      RuntimeWarning)
-                if Image is None:
-                    continue
-                cdf[key] = cdf[key].map(lambda x: Image.open(BytesIO(x)))
-
-    # Apply date / datetime transformations
-    for item in dates:
-        cdf[item] = cdf[item].apply(casdt.sas2python_date)
-    for item in datetimes:
-        cdf[item] = cdf[item].apply(casdt.sas2python_datetime)
-    for item in times:
-        cdf[item] = cdf[item].apply(casdt.sas2python_time)
-
     # Check for By group information
-    optbycol = get_option('cas.dataset.bygroup_columns')
-    optbyidx = get_option('cas.dataset.bygroup_as_index')
-    optbysfx = get_option('cas.dataset.bygroup_formatted_suffix')
-    optbycolsfx = get_option('cas.dataset.bygroup_collision_suffix')
+    optbycol = _get_option('cas.dataset.bygroup_columns')
+    optbyidx = _get_option('cas.dataset.bygroup_as_index')
+    optbysfx = _get_option('cas.dataset.bygroup_formatted_suffix')
+    optbycolsfx = _get_option('cas.dataset.bygroup_collision_suffix')
     cdf = cdf.reshape_bygroups(bygroup_columns=optbycol,
                                bygroup_as_index=optbyidx,
                                bygroup_formatted_suffix=optbysfx,
                                bygroup_collision_suffix=optbycolsfx)
 
     # Add an index as needed
-    index = get_option('cas.dataset.index_name')
-    if index:
-        if not isinstance(index, (list, tuple, set)):
-            index = [index]
-        for idx in index:
-            if idx in cdf.columns:
-                if cdf.attrs.get('ByVar1'):
-                    cdf.set_index([idx], append=True, inplace=True)
-                else:
-                    cdf.set_index([idx], inplace=True)
-                adjust = get_option('cas.dataset.index_adjustment')
-                if adjust != 0 and str(cdf.index.dtype).startswith('int'):
-                    names = cdf.index.names
-                    cdf.index = cdf.index.values + adjust
-                    cdf.index.names = names
-                if get_option('cas.dataset.drop_index_name'):
-                    names = list(cdf.index.names)
-                    names[-1] = None
-                    cdf.index.names = names
-                # Only set one index
-                break
-
-    # Detect casout tables
-    if not(tablename) and unknownname and columnscol and rowscol:
-        tablename = unknownname
+    cdf = _set_index(cdf)
 
     # if we have enough information to build CASTable objects, do it
     if caslib and tablename and not castable:
@@ -487,7 +905,7 @@ def cas2py(_sw_value, soptions, connection=None):
 
     '''
     return _sw_value.toPython(_sw_value, soptions,
-                              a2n(get_option('encoding_errors'), 'utf-8'),
+                              a2n(_get_option('encoding_errors'), 'utf-8'),
                               connection, ctb2tabular,
                               base64.b64decode, casdt.cas2python_datetime,
                               casdt.cas2python_date, casdt.cas2python_time)
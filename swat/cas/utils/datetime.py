@@ -35,6 +35,10 @@ from ...utils.compat import int64, int32, text_types, binary_types
 CAS_EPOCH = datetime.datetime(month=1, day=1, year=1960)
 UTC_TZ = pytz.timezone('UTC')
 
+NP_CAS_EPOCH = np.datetime64('1960-01-01T00:00:00', 'us')
+CAS_MISSING_INT32 = np.iinfo(np.int32).min
+CAS_MISSING_INT64 = np.iinfo(np.int64).min
+
 
 def _astimezone(dt, tz):
     '''
@@ -702,6 +706,218 @@ def python2sas_time(pytm):
     return python2cas_time(pytm) / float(10**6)
 
 
+# Vectorized conversions
+#
+# These functions convert entire columns of values at once.  SAS values are
+# floats where NaN is missing.  CAS values are integers where the minimum
+# integer of the type is missing.
+
+
+def _sas2cas_array(values, scale):
+    '''
+    Convert SAS values to CAS integers and a missing value mask
+
+    Parameters
+    ----------
+    values : array-like of floats
+        SAS dates, times, or datetimes.
+    scale : int
+        The multiplier from SAS units to CAS units.
+
+    Returns
+    -------
+    (:func:`numpy.ndarray`, :func:`numpy.ndarray`)
+        CAS values as int64, missing value mask
+
+    '''
+    values = np.asarray(values, dtype='float64')
+    mask = np.isnan(values)
+    if mask.any():
+        values = np.where(mask, 0, values)
+    return (values * scale).astype('int64'), mask
+
+
+def _cas2numpy_datetime(values, mask):
+    ''' Convert CAS microseconds to a :func:`numpy.datetime64` array '''
+    out = NP_CAS_EPOCH + values.astype('timedelta64[us]')
+    if mask.any():
+        out[mask] = np.datetime64('NaT')
+    return out
+
+
+def _localize_array(values, tz):
+    ''' Apply the timezone logic of :func:`_astimezone` to a DatetimeIndex '''
+    if tz is None:
+        tz = get_option('timezone')
+    elif isinstance(tz, (text_types, binary_types)):
+        tz = pytz.timezone(tz)
+    if tz is None:
+        return values
+    return values.tz_localize(UTC_TZ).tz_convert(tz)
+
+
+def _cas2python_time_array(values, mask):
+    ''' Convert CAS times to an array of :class:`datetime.time` objects '''
+    times = _cas2numpy_datetime(values % (24 * 60 * 60 * 10**6), mask)
+    return np.asarray(pd.DatetimeIndex(times).time, dtype=object)
+
+
+def _cas2python_date_array(values, mask):
+    ''' Convert CAS dates to an array of :class:`datetime.date` objects '''
+    out = (NP_CAS_EPOCH.astype('datetime64[D]')
+           + values.astype('timedelta64[D]')).astype(object)
+    if mask.any():
+        out[mask] = pd.NaT
+    return out
+
+
+def sas2python_timestamp_array(sts, tz=None):
+    '''
+    Convert an array of SAS datetimes to a :class:`pandas.DatetimeIndex`
+
+    Parameters
+    ----------
+    sts : array-like of floats
+        SAS timestamps.  NaN values are converted to NaT.
+    tz : string or tzinfo, optional
+        The timezone of the output.  The default is the ``timezone`` option.
+
+    Examples
+    --------
+    >>> sas2python_timestamp_array([315662400.0, np.nan])
+    DatetimeIndex(['1970-01-01 12:00:00', 'NaT'], dtype='datetime64[us]', freq=None)
+
+    Returns
+    -------
+    :class:`pandas.DatetimeIndex`
+
+    '''
+    values, mask = _sas2cas_array(sts, 10**6)
+    return _localize_array(pd.DatetimeIndex(_cas2numpy_datetime(values, mask)), tz)
+
+
+sas2python_datetime_array = sas2python_timestamp_array
+
+
+def sas2python_date_array(sdt):
+    '''
+    Convert an array of SAS dates to Python dates
+
+    Parameters
+    ----------
+    sdt : array-like of floats
+        SAS dates.  NaN values are converted to NaT.
+
+    Examples
+    --------
+    >>> sas2python_date_array([3653.0, np.nan])
+    array([datetime.date(1970, 1, 1), NaT], dtype=object)
+
+    Returns
+    -------
+    :func:`numpy.ndarray` of :class:`datetime.date` objects
+
+    '''
+    return _cas2python_date_array(*_sas2cas_array(sdt, 1))
+
+
+def sas2python_time_array(sts):
+    '''
+    Convert an array of SAS times to Python times
+
+    Parameters
+    ----------
+    sts : array-like of floats
+        SAS times.  NaN values are converted to NaT.
+
+    Examples
+    --------
+    >>> sas2python_time_array([43200.0, np.nan])
+    array([datetime.time(12, 0), NaT], dtype=object)
+
+    Returns
+    -------
+    :func:`numpy.ndarray` of :class:`datetime.time` objects
+
+    '''
+    return _cas2python_time_array(*_sas2cas_array(sts, 10**6))
+
+
+def cas2python_timestamp_array(cts, tz=None):
+    '''
+    Convert an array of CAS datetimes to a :class:`pandas.DatetimeIndex`
+
+    Parameters
+    ----------
+    cts : array-like of ints
+        CAS timestamps.  CAS missing values are converted to NaT.
+    tz : string or tzinfo, optional
+        The timezone of the output.  The default is the ``timezone`` option.
+
+    Examples
+    --------
+    >>> cas2python_timestamp_array([315662400000000])
+    DatetimeIndex(['1970-01-01 12:00:00'], dtype='datetime64[us]', freq=None)
+
+    Returns
+    -------
+    :class:`pandas.DatetimeIndex`
+
+    '''
+    values = np.asarray(cts, dtype='int64')
+    mask = values == CAS_MISSING_INT64
+    return _localize_array(pd.DatetimeIndex(_cas2numpy_datetime(values, mask)), tz)
+
+
+cas2python_datetime_array = cas2python_timestamp_array
+
+
+def cas2python_date_array(cdt):
+    '''
+    Convert an array of CAS dates to Python dates
+
+    Parameters
+    ----------
+    cdt : array-like of ints
+        CAS dates.  CAS missing values are converted to NaT.
+
+    Examples
+    --------
+    >>> cas2python_date_array([3653])
+    array([datetime.date(1970, 1, 1)], dtype=object)
+
+    Returns
+    -------
+    :func:`numpy.ndarray` of :class:`datetime.date` objects
+
+    '''
+    values = np.asarray(cdt, dtype='int64')
+    return _cas2python_date_array(values, values == CAS_MISSING_INT32)
+
+
+def cas2python_time_array(ctm):
+    '''
+    Convert an array of CAS times to Python times
+
+    Parameters
+    ----------
+    ctm : array-like of ints
+        CAS times.  CAS missing values are converted to NaT.
+
+    Examples
+    --------
+    >>> cas2python_time_array([43200000000])
+    array([datetime.time(12, 0)], dtype=object)
+
+    Returns
+    -------
+    :func:`numpy.ndarray` of :class:`datetime.time` objects
+
+    '''
+    values = np.asarray(ctm, dtype='int64')
+    return _cas2python_time_array(values, values == CAS_MISSING_INT64)
+
+
 def _local_time_offset(timestamp):
     '''
     Return offset of local zone from GMT
@@ -258,18 +258,32 @@ register_option('cas.missing.datetime', 'int', check_int, -2**(64 - 1),
 # Tabular data options
 #
 
-register_option('cas.dataset.format', 'string',
-                functools.partial(check_string,
-                                  valid_values=['dataframe:sas', 'dataframe',
-                                                'dict', 'dict:list',
-                                                'dict:series', 'dict:split',
-                                                'dict:records', 'tuple']),
+
+def check_dataset_format(value):
+    ''' Verify that the value is a supported data structure name '''
+    value = check_string(value, valid_values=['dataframe:sas', 'dataframe',
+                                              'dataframe:arrow', 'dict',
+                                              'dict:list', 'dict:series',
+                                              'dict:split', 'dict:records',
+                                              'tuple', 'arrow'])
+    if value in ['arrow', 'dataframe:arrow']:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise SWATOptionError('The pyarrow package must be installed to use '
+                                  'the %s format.' % value)
+    return value
+
+
+register_option('cas.dataset.format', 'string', check_dataset_format,
                 'dataframe:sas',
                 'Data structure for tabular data returned from CAS.  The following\n'
                 'formats are supported.\n'
                 'dataframe:sas : Pandas Dataframe extended with SAS metadata such as\n'
                 '    SAS data formats, titles, labels, etc.\n'
                 'dataframe : Standard Pandas Dataframe\n'
+                'dataframe:arrow : Standard Pandas Dataframe with pandas.ArrowDtype\n'
+                '    columns.  This requires the pyarrow package.\n'
                 'dict : Dictionary like {column => {index => value}}\n'
                 'dict:list : Dictionary like {column => [values]}\n'
                 'dict:series : Dictionary like {column => pandas.Series(values)\n'
@@ -278,7 +292,10 @@ register_option('cas.dataset.format', 'string',
                 '                              data => [values]}\n'
                 'dict:records : List like [{column => value}, ... ,\n'
                 '                          {column => value}]\n'
-                'tuple : A tuple where each element is a tuple of the data values only.')
+                'tuple : A tuple where each element is a tuple of the data values only.\n'
+                'arrow : PyArrow Table where the column labels, formats, and widths\n'
+                '    are stored in the field metadata.  This requires the pyarrow\n'
+                '    package.')
 
 register_option('cas.dataset.auto_castable', 'boolean', check_boolean, True,
                 'Should a column of CASTable objects be automatically\n'
@@ -339,6 +356,53 @@ register_option('cas.dataset.index_adjustment', 'int', check_int, -1,
                 'This can be used to adjust SAS 1-based index data sets to\n'
                 '0-based Pandas DataFrames.')
 
+register_option('cas.dataset.int_missing', 'string',
+                functools.partial(check_string, valid_values=['float', 'nullable']),
+                'float',
+                'Specifies how integer columns containing missing values are\n'
+                'represented in DataFrames.\n'
+                'float : Columns with missing values are converted to float64\n'
+                '    and missing values are NaN.\n'
+                'nullable : Columns use the pandas Int32 and Int64 extension types\n'
+                '    so that values are kept exact and missing values are NA.')
+
+register_option('cas.dataset.prefetch', 'int',
+                functools.partial(check_int, minimum=0), 0,
+                'The number of chunks of rows to fetch in a background thread\n'
+                'while iterating over the rows of a CASTable.  A value of zero\n'
+                'disables prefetching.')
+
+register_option('cas.dataset.iter_chunk_bytes', 'int',
+                functools.partial(check_int, minimum=1), 4 * 1024**2,
+                'The target number of bytes in each fetch when iterating over\n'
+                'the rows of a CASTable with chunksize=\'auto\'.')
+
+register_option('cas.dataset.iter_chunk_seconds', 'float',
+                functools.partial(check_float, minimum=0), 1.0,
+                'The target duration in seconds of each fetch when iterating over\n'
+                'the rows of a CASTable with chunksize=\'auto\'.  A value of zero\n'
+                'only uses the byte budget in cas.dataset.iter_chunk_bytes.')
+
+register_option('cas.dataset.plan_cache_size', 'int',
+                functools.partial(check_int, minimum=0), 128,
+                'The number of table schemas to cache the column conversion\n'
+                'information for.  The cache is cleared whenever an option\n'
+                'is set.  A value of zero disables the cache.')
+
+register_option('cas.dataset.lazy', 'boolean', check_boolean, False,
+                'If True, tables in the dataframe:sas format are returned as\n'
+                'LazySASDataFrame objects.  The columns of these objects are\n'
+                'only converted (dates, missing values, etc.) when they are\n'
+                'accessed.  Tables containing By group information are always\n'
+                'converted immediately.')
+
+register_option('cas.dataset.categorical_ratio', 'float',
+                functools.partial(check_float, minimum=0, maximum=1), 0.0,
+                'Character columns where the ratio of the number of unique values\n'
+                'to the number of rows is less than or equal to this value are\n'
+                'converted to pandas.Categorical columns.  A value of zero\n'
+                'disables the conversion.')
+
 
 def check_max_rows_fetched(val):
     ''' Check the max_rows_fetched value and print warning '''
@@ -390,6 +454,180 @@ register_option('cas.dataset.bygroup_casout_threshold', 'int', check_int, 25000,
                 'cardinality of each by group variable.')
 
 
+#
+# Upload options
+#
+def check_upload_format(value):
+    ''' Verify that the value is a supported upload format '''
+    value = check_string(value, valid_values=['csv', 'parquet'])
+    if value == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise SWATOptionError('The pyarrow package must be installed to use '
+                                  'the parquet upload format.')
+    return value
+
+
+register_option('cas.upload.format', 'string', check_upload_format, 'csv',
+                'The file format used when CAS.upload sends a DataFrame to the\n'
+                'server.  The following formats are supported.\n'
+                'csv : Comma-separated values.  The column types are guessed by\n'
+                '    the server parser.\n'
+                'parquet : Parquet, which preserves the column types.  This requires\n'
+                '    the pyarrow package.  If the server rejects the Parquet file\n'
+                '    type, the data is uploaded as CSV.')
+
+register_option('cas.upload.pipeline', 'boolean', check_boolean, False,
+                'Should data message handlers fill the next data buffer in a\n'
+                'background thread while the current buffer is being sent to\n'
+                'the server?  This overlaps reading the data source with the\n'
+                'network transfer and server ingest.')
+
+register_option('cas.upload.chunk_rows', 'int',
+                functools.partial(check_int, minimum=1), 10000,
+                'The number of DataFrame rows serialized at a time when a\n'
+                'DataFrame is streamed to the server by CAS.upload.')
+
+register_option('cas.upload.buffer_bytes', 'int',
+                functools.partial(check_int, minimum=0), 4 * 1024**2,
+                'The target size in bytes of the data buffer of a data message\n'
+                'handler created without nrecs.  The number of records in the\n'
+                'buffer is computed from the estimated size of each record.\n'
+                'A value of zero uses 1000 records.')
+
+register_option('cas.upload.batch_seconds', 'float',
+                functools.partial(check_float, minimum=0), 1.0,
+                'The target duration in seconds of sending each batch of records\n'
+                'from a data message handler created without nrecs.  Batches that\n'
+                'take longer are made smaller, up to the size of the data buffer.\n'
+                'A value of zero always fills the whole buffer.')
+
+
+#
+# HTTP options
+#
+register_option('cas.http.compression', 'string',
+                functools.partial(check_string,
+                                  valid_values=['none', 'gzip', 'deflate']), 'none',
+                'The content encoding used to compress REST request bodies.\n'
+                'The following encodings are supported.\n'
+                'none : Request bodies are not compressed.\n'
+                'gzip : gzip compression\n'
+                'deflate : zlib compression\n'
+                'Compressed responses are always requested and decoded.',
+                environ='CAS_HTTP_COMPRESSION')
+
+register_option('cas.http.compression_threshold', 'int',
+                functools.partial(check_int, minimum=0), 4096,
+                'The minimum size in bytes of a REST request body to compress\n'
+                'when cas.http.compression is set.  Streamed upload bodies of\n'
+                'unknown size are always compressed.')
+
+register_option('cas.http.compression_level', 'int',
+                functools.partial(check_int, minimum=1, maximum=9), 6,
+                'The compression level (1-9) used for REST request bodies.')
+
+
+register_option('cas.http.pool_connections', 'int',
+                functools.partial(check_int, minimum=1), 10,
+                'The number of hosts for which HTTP connections are pooled by a\n'
+                'REST connection.')
+
+register_option('cas.http.pool_maxsize', 'int',
+                functools.partial(check_int, minimum=1), 10,
+                'The maximum number of idle HTTP connections kept in the pool\n'
+                'for each host.  Connections opened beyond this number when\n'
+                'the pool is shared are closed after use.')
+
+register_option('cas.http.share_pool', 'boolean', check_boolean, True,
+                'Should copies of a REST connection (CAS.copy and CAS.fork) share\n'
+                'the HTTP connection pool of the original connection?  This\n'
+                'reuses open connections instead of doing a new TCP and TLS\n'
+                'handshake for each session.')
+
+register_option('cas.http.keepalive', 'boolean', check_boolean, True,
+                'Should TCP keep-alive probes be sent on idle REST connections?\n'
+                'This keeps pooled connections and connections waiting for long\n'
+                'running actions from being dropped by firewalls and proxies.')
+
+register_option('cas.http.tcp_nodelay', 'boolean', check_boolean, True,
+                'Should Nagle\'s algorithm be disabled (TCP_NODELAY) on REST\n'
+                'connections?')
+
+register_option('cas.http.connect_timeout', 'float',
+                functools.partial(check_float, minimum=0), 0.0,
+                'The number of seconds to wait for a REST connection to the\n'
+                'server.  A value of zero waits indefinitely.')
+
+register_option('cas.http.read_timeout', 'float',
+                functools.partial(check_float, minimum=0), 0.0,
+                'The number of seconds to wait for data from the server on a\n'
+                'REST connection.  This includes the run time of actions.\n'
+                'A value of zero waits indefinitely.')
+
+register_option('cas.http.concurrent_invoke', 'boolean', check_boolean, False,
+                'Should REST action requests be sent by a background thread of\n'
+                'the connection?  Actions invoked on several connections then\n'
+                'run concurrently, and getnext returns their responses in the\n'
+                'order they arrive.  Errors sending a request or parsing its\n'
+                'response are raised when the response is read (e.g., by getnext)\n'
+                'rather than by invoke.  Each connection uses one thread.')
+
+
+def check_http_stream(value):
+    ''' Verify that the incremental JSON parser is available '''
+    value = check_boolean(value)
+    if value:
+        try:
+            import ijson  # noqa: F401
+        except ImportError:
+            raise SWATOptionError('The ijson package must be installed to stream '
+                                  'REST responses.')
+    return value
+
+
+register_option('cas.http.stream', 'boolean', check_http_stream, False,
+                'Should REST action responses be parsed incrementally as they are\n'
+                'received?  The rows of result tables are stored by column as they\n'
+                'are parsed, which avoids holding the response body, the decoded\n'
+                'text, and the parsed rows in memory at the same time.  This\n'
+                'requires the ijson package.  Parsing is several times slower\n'
+                'than decoding the whole response at once, even with the C\n'
+                'backend of ijson, so this trades speed for lower peak memory.\n'
+                'Responses are not streamed when cas.debug.responses is enabled.',
+                environ='CAS_HTTP_STREAM')
+
+
+def check_json_codec(value):
+    ''' Verify that the JSON package of the codec is available '''
+    value = check_string(value, valid_values=['auto', 'orjson', 'simdjson',
+                                              'ujson', 'json'])
+    if value not in ['auto', 'json']:
+        try:
+            __import__(value)
+        except ImportError:
+            raise SWATOptionError('The %s package must be installed to use '
+                                  'it as the JSON codec.' % value)
+    return value
+
+
+register_option('cas.http.json_codec', 'string', check_json_codec, 'auto',
+                'The JSON package used to decode REST responses.  The following\n'
+                'codecs are supported.\n'
+                'auto : The first installed package of orjson, simdjson, ujson,\n'
+                '    and json.\n'
+                'orjson : The orjson package.\n'
+                'simdjson : The pysimdjson package.\n'
+                'ujson : The ujson package.\n'
+                'json : The json package in the Python standard library.\n'
+                'Text that the selected package rejects (such as NaN values or\n'
+                'control characters in strings) is handled by the json package.\n'
+                'Requests are always encoded by the json package, which keeps\n'
+                'NaN and infinite parameter values.',
+                environ='CAS_HTTP_JSON_CODEC')
+
+
 #
 # Debugging options
 #
@@ -28,6 +28,7 @@ import datetime
 import functools
 import json
 import re
+import numpy as np
 import pandas as pd
 import six
 try:
@@ -97,7 +98,8 @@ def concat(objs, **kwargs):
 
     This function is equivalent to :func:`pandas.concat` except that it also
     preserves metadata in :class:`SASDataFrames`.  It can be used on standard
-    :class:`pandas.DataFrames` as well.
+    :class:`pandas.DataFrames` as well.  :class:`LazySASDataFrames` with the
+    same columns are concatenated without converting their data.
 
     Parameters
     ----------
@@ -116,11 +118,20 @@ def concat(objs, **kwargs):
 
     Returns
     -------
-    :class:`SASDataFrame`
+    :class:`SASDataFrame` or :class:`LazySASDataFrame`
 
     '''
     proto = objs[0]
 
+    if isinstance(proto, LazySASDataFrame):
+        if all(isinstance(x, LazySASDataFrame) for x in objs) \
+                and all(list(x._data) == list(proto._data) for x in objs) \
+                and not kwargs:
+            return _concat_lazy(objs)
+        proto = proto.to_frame()
+
+    objs = [x.to_frame() if isinstance(x, LazySASDataFrame) else x for x in objs]
+
     if not isinstance(proto, SASDataFrame):
         return pd.concat(objs, **kwargs)
 
@@ -263,7 +274,28 @@ class SASColumnSpec(object):
         format = errorcheck(a2u(_sw_table.getColumnFormat(col), 'utf-8'), _sw_table)
         size = (1, errorcheck(_sw_table.getColumnArrayNItems(col), _sw_table))
 
-        # Get table attributes
+        attrs = cls.attrs_fromtable(_sw_table, col)
+
+        return cls(name=name, label=label, dtype=dtype, width=width, format=format,
+                   size=size, attrs=attrs)
+
+    @staticmethod
+    def attrs_fromtable(_sw_table, col):
+        '''
+        Get the extended attributes of a column in a SWIG table
+
+        Parameters
+        ----------
+        _sw_table : SWIG table object
+           The table object to get column information from
+        col : int or long
+           The index of the column
+
+        Returns
+        -------
+        dict
+
+        '''
         attrs = {}
         if hasattr(_sw_table, 'getColumnAttributes'):
             attrs = _sw_table.getColumnAttributes(col)
@@ -319,8 +351,7 @@ class SASColumnSpec(object):
                                                                         i),
                             _sw_table))
 
-        return cls(name=name, label=label, dtype=dtype, width=width, format=format,
-                   size=size, attrs=attrs)
+        return attrs
 
     def __str__(self):
         return 'SASColumnSpec(%s)' % \
@@ -1295,3 +1326,302 @@ class SASDataFrame(pd.DataFrame):
         output.append('</table>')
 
         return '\n'.join(output)
+
+
+class LazySASDataFrame(object):
+    '''
+    Tabular data whose columns are converted the first time they are used
+
+    A :class:`LazySASDataFrame` holds the raw data decoded from a CAS table
+    along with the conversions (dates, missing values, etc.) that need to be
+    applied to each column.  Columns are converted individually when accessed
+    using ``frame[name]``.  The table and column metadata are available
+    without converting any data.  Any other attribute access converts all
+    columns into a :class:`SASDataFrame` and is delegated to it.
+
+    This class is not a subclass of :class:`pandas.DataFrame`, so
+    ``isinstance(frame, pd.DataFrame)`` is False and pandas functions
+    that require a DataFrame may not accept it.  Use :meth:`to_frame`
+    to get the converted :class:`SASDataFrame` in those cases.
+
+    Attributes
+    ----------
+    name : string
+        The name given to the table.
+    label : string
+        The SAS label for the table.
+    title : string
+        Displayed title for the table.
+    attrs : dict
+        Table extended attributes.
+    formatter : :class:`SASFormatter`
+        A :class:`SASFormatter` object for applying SAS data formats.
+    colinfo : dict
+        Metadata for the columns in the table.
+
+    Parameters
+    ----------
+    data : dict
+        Column names mapped to arrays of raw column data.
+    converters : dict, optional
+        Column names mapped to functions that convert the raw data of
+        a column to its final form.
+    index : :class:`pandas.Index`, optional
+        Index to use for the resulting frame.
+    name : string, optional
+        Name of the table.
+    label : string, optional
+        Label on the table.
+    title : string, optional
+        Title of the table.
+    formatter : :class:`SASFormatter` object, optional
+        :class:`SASFormatter` to use for all formatting operations.
+    attrs : dict, optional
+        Table extended attributes.
+    colinfo : dict, optional
+        Dictionary of SASColumnSpec objects containing column metadata.
+
+    Returns
+    -------
+    :class:`LazySASDataFrame` object
+
+    '''
+
+    def __init__(self, data, converters=None, index=None, name=None, label=None,
+                 title=None, formatter=None, attrs=None, colinfo=None):
+        self._data = collections.OrderedDict(data)
+        self._converters = dict(converters or {})
+        self._index = index
+        self._frame = None
+        self.colinfo = {}
+        if colinfo:
+            for col in self._data:
+                if col in colinfo:
+                    self.colinfo[col] = colinfo[col]
+        self.name = a2u(name)
+        self.label = a2u(label)
+        self.title = a2u(title)
+        self.attrs = attrs or {}
+        self.formatter = formatter
+        if self.formatter is None:
+            self.formatter = SASFormatter()
+
+    @property
+    def columns(self):
+        ''' The column labels of the table '''
+        return pd.Index(list(self._data.keys()))
+
+    @property
+    def index(self):
+        ''' The index of the table '''
+        if self._index is None:
+            return pd.RangeIndex(len(self))
+        return self._index
+
+    @property
+    def shape(self):
+        ''' The number of rows and columns in the table '''
+        return (len(self), len(self._data))
+
+    @property
+    def is_materialized(self):
+        ''' Have all of the columns been converted? '''
+        return not self._converters
+
+    def __len__(self):
+        for value in self._data.values():
+            return len(value)
+        if self._index is not None:
+            return len(self._index)
+        return 0
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def keys(self):
+        ''' Return the column labels '''
+        return self.columns
+
+    def get_column_data(self, key):
+        '''
+        Return the converted data for a column
+
+        Parameters
+        ----------
+        key : string
+            The name of the column.
+
+        Returns
+        -------
+        array-like
+
+        '''
+        if key in self._converters:
+            self._data[key] = self._converters.pop(key)(self._data[key])
+        return self._data[key]
+
+    def __getitem__(self, key):
+        '''
+        Retrieve one or more converted columns
+
+        Parameters
+        ----------
+        key : string or list of strings or any
+            The column name or names.  Any other key (such as a boolean
+            mask or a slice) converts all columns and is passed to
+            :meth:`SASDataFrame.__getitem__`.
+
+        Returns
+        -------
+        :class:`pandas.Series` or :class:`SASDataFrame`
+
+        '''
+        if isinstance(key, six.string_types):
+            if key not in self._data:
+                raise KeyError(key)
+            return pd.Series(self.get_column_data(key), index=self.index, name=key)
+        if isinstance(key, (list, tuple, pd.Index)) and \
+                all(isinstance(x, six.string_types) for x in key):
+            return self._to_frame(list(key))
+        return self.to_frame()[key]
+
+    def __setitem__(self, key, value):
+        '''
+        Set the data of a column
+
+        Parameters
+        ----------
+        key : string
+            The column name.
+        value : any
+            The column data.  This is aligned to the index of the table
+            in the same way as :meth:`pandas.DataFrame.__setitem__`.
+
+        '''
+        self._data[key] = pd.Series(value, index=self.index).array
+        self._converters.pop(key, None)
+        self._frame = None
+        if key not in self.colinfo:
+            self.colinfo[key] = SASColumnSpec(key)
+
+    def set_index(self, keys, **kwargs):
+        '''
+        Set the index of the table using an existing column
+
+        A single column name is handled without converting the other
+        columns.  Anything else is delegated to :meth:`SASDataFrame.set_index`.
+
+        Parameters
+        ----------
+        keys : string or list
+            The column to use as the index.
+        **kwargs : keyword arguments, optional
+            Additional arguments to :meth:`pandas.DataFrame.set_index`.
+
+        Returns
+        -------
+        :class:`LazySASDataFrame` or :class:`SASDataFrame`
+
+        '''
+        if kwargs or not isinstance(keys, six.string_types):
+            return self.to_frame().set_index(keys, **kwargs)
+        if keys not in self._data:
+            raise KeyError(keys)
+        index = pd.Index(self.get_column_data(keys), name=keys)
+        data = collections.OrderedDict((k, v) for k, v in self._data.items()
+                                       if k != keys)
+        return LazySASDataFrame(data, converters=self._converters, index=index,
+                                name=self.name, label=self.label, title=self.title,
+                                formatter=self.formatter, attrs=self.attrs.copy(),
+                                colinfo=self.colinfo)
+
+    def _to_frame(self, columns):
+        ''' Convert the given columns into a SASDataFrame '''
+        data = collections.OrderedDict()
+        for col in columns:
+            if col not in self._data:
+                raise KeyError(col)
+            data[col] = self.get_column_data(col)
+        return SASDataFrame(data, index=self.index, columns=columns,
+                            name=self.name, label=self.label, title=self.title,
+                            formatter=self.formatter, attrs=self.attrs.copy(),
+                            colinfo=self.colinfo)
+
+    def to_frame(self):
+        '''
+        Convert all columns and return the table as a SASDataFrame
+
+        The resulting :class:`SASDataFrame` is cached, so subsequent calls
+        return the same object.
+
+        Returns
+        -------
+        :class:`SASDataFrame`
+
+        '''
+        if self._frame is None:
+            self._frame = self._to_frame(list(self._data.keys()))
+        return self._frame
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name in ['_data', '_converters', '_index',
+                                             '_frame']:
+            raise AttributeError(name)
+        return getattr(self.to_frame(), name)
+
+    def __repr__(self):
+        return repr(self.to_frame())
+
+    def __str__(self):
+        return str(self.to_frame())
+
+    def _repr_html_(self):
+        return self.to_frame()._repr_html_()
+
+    def _render_html_(self):
+        return self.to_frame()._render_html_()
+
+
+def _concat_lazy(objs):
+    '''
+    Concatenate :class:`LazySASDataFrames` without converting the data
+
+    Parameters
+    ----------
+    objs : list of :class:`LazySASDataFrames`
+        The tables to concatenate.  They must all have the same columns.
+
+    Returns
+    -------
+    :class:`LazySASDataFrame`
+
+    '''
+    proto = objs[0]
+
+    data = collections.OrderedDict()
+    converters = {}
+    for col in proto._data:
+        # Only columns that haven't been converted in any table can stay raw
+        if all(col in x._converters for x in objs):
+            data[col] = np.concatenate([x._data[col] for x in objs])
+            converters[col] = proto._converters[col]
+        else:
+            data[col] = pd.concat([pd.Series(x.get_column_data(col)) for x in objs],
+                                  ignore_index=True).array
+
+    index = None
+    if any(x._index is not None for x in objs):
+        index = objs[0].index.append([x.index for x in objs[1:]])
+
+    attrs = {}
+    colinfo = {}
+    for item in objs:
+        attrs.update(item.attrs)
+        colinfo.update(item.colinfo)
+
+    return LazySASDataFrame(data, converters=converters, index=index,
+                            name=proto.name, label=proto.label, title=proto.title,
+                            formatter=proto.formatter, attrs=attrs, colinfo=colinfo)
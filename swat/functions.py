@@ -71,7 +71,7 @@ def concat(objs, **kwargs):
     if isinstance(objs[0], table.CASTable):
         return table.concat(objs, **kwargs)
 
-    if isinstance(objs[0], dataframe.SASDataFrame):
+    if isinstance(objs[0], (dataframe.SASDataFrame, dataframe.LazySASDataFrame)):
         return dataframe.concat(objs, **kwargs)
 
     return pd.concat(objs, **kwargs)
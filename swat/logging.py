@@ -41,3 +41,28 @@ logger.setLevel(dict(
 handler = logging.StreamHandler(sys.stderr)
 handler.setFormatter(logging.Formatter(default_format))
 logger.addHandler(handler)
+
+
+def log_progress(info):
+    '''
+    Log the measurements passed to an upload progress callback
+
+    This function can be used as the `progress` argument of
+    :meth:`CAS.upload` and the related methods, or as the ``progress``
+    attribute of a data message handler.  The messages are logged at
+    the info level.
+
+    Parameters
+    ----------
+    info : dict
+        The measurements of an upload stage.
+
+    '''
+    values = []
+    for key, value in sorted(info.items()):
+        if key == 'stage' or value is None:
+            continue
+        if isinstance(value, float):
+            value = '%.3f' % value
+        values.append('%s=%s' % (key, value))
+    logger.info('upload %s: %s', info.get('stage'), ', '.join(values))
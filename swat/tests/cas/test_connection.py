@@ -280,6 +280,38 @@ class TestConnection(tm.TestCase):
             if slist[i]._session != self.s._session:
                 slist[i].endsession()
 
+    def test_async_connection(self):
+        if self.s._protocol not in ['http', 'https']:
+            tm.TestCase.skipTest(self, 'REST-only test')
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need aiohttp installed')
+
+        import asyncio
+        from swat.cas import aio
+
+        async def run():
+            conn = await aio.CAS.create(HOST, PORT, USER, PASSWD, protocol=PROTOCOL)
+            conns = await conn.fork(3)
+            out = await asyncio.gather(*[x.builtins.serverstatus() for x in conns])
+            tbl = conns[0].CASTable(self.tablename, caslib=self.srcLib)
+            info = await tbl.columninfo()
+            sessions = [x._session for x in conns]
+            for x in conns:
+                await x.aclose(close_session=True)
+            return out, info, sessions
+
+        out, info, sessions = asyncio.run(run())
+
+        self.assertEqual(len(out), 3)
+        self.assertTrue('About' in out[0])
+        self.assertEqual(len(set(sessions)), 3)
+        self.assertTrue('ColumnInfo' in info)
+
+        with self.assertRaises(SWATError):
+            aio.CAS(HOST, PORT, USER, PASSWD, protocol='cas')
+
     def test_upload(self):
         import swat.tests as st
 
@@ -1372,5 +1404,694 @@ class TestConnectionInfo(tm.TestCase):
                                'myuserid', 'mytoken', 'cas'))
 
 
+class FakeRESTSession(object):
+    ''' Requests session that records requests instead of sending them '''
+
+    def __init__(self):
+        import requests
+        self.headers = requests.structures.CaseInsensitiveDict(
+            {'Content-Length': '0'})
+        self.requests = []
+
+    def put(self, url, data=None, headers=None, **kwargs):
+        if hasattr(data, 'read'):
+            body = data.read()
+        elif isinstance(data, bytes):
+            body = data
+        else:
+            body = b''.join(data)
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        self.requests.append((url, body, merged))
+        text = '{"disposition": {"severity": 0}}'
+        return type('Response', (object,),
+                    dict(text=text, content=text.encode('utf-8'),
+                         headers={'Content-Length': str(len(text))}))
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        merged = dict(self.headers)
+        merged.update(headers)
+        self.requests.append((url, data, merged))
+        text = '{"disposition": {"severity": 0}, "results": {"x": 1}}'
+        return type('Response', (object,),
+                    dict(text=text, content=text.encode('utf-8'),
+                         status_code=200, headers={}))
+
+    def close(self):
+        pass
+
+
+def get_rest_connection():
+    ''' Return a REST connection that uses a FakeRESTSession '''
+    from swat.cas.rest.connection import REST_CASConnection
+    conn = REST_CASConnection.__new__(REST_CASConnection)
+    conn._req_sess = FakeRESTSession()
+    conn._current_baseurl = 'http://localhost:8777/'
+    conn._session = 'abc'
+    conn._pending = None
+    conn._executor = None
+    return conn
+
+
+class TestUploadStream(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def test_iter_csv(self):
+        from swat.cas.connection import _iter_csv, _to_csv
+
+        df = pd.DataFrame({'a': np.arange(25) / 3.0,
+                           'b': ['x,"y"'] * 25,
+                           'c': pd.date_range('2000-01-01', periods=25, freq='h')})
+
+        chunks = list(_iter_csv(df, chunksize=7))
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(b''.join(chunks), _to_csv(df).encode('utf-8'))
+
+        swat.options.cas.upload.chunk_rows = 10
+        chunks = list(_iter_csv(df, date_format='%Y'))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(b''.join(chunks),
+                         _to_csv(df, date_format='%Y').encode('utf-8'))
+
+    def test_rest_upload(self):
+        conn = get_rest_connection()
+
+        conn.upload(lambda: iter([b'a,b\r\n', b'1,2\r\n']), dict(casout='foo'))
+        url, body, headers = conn._req_sess.requests[-1]
+        self.assertTrue(url.endswith('cas/sessions/abc/actions/table.upload'))
+        self.assertEqual(body, b'a,b\r\n1,2\r\n')
+        self.assertEqual(headers['Content-Length'], None)
+        self.assertTrue('JSON-Parameters' not in conn._req_sess.headers)
+
+        import tempfile
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp:
+            tmp.write(b'a,b\r\n3,4\r\n')
+        try:
+            conn.upload(tmp.name, dict(casout='foo'))
+        finally:
+            os.remove(tmp.name)
+        url, body, headers = conn._req_sess.requests[-1]
+        self.assertEqual(body, b'a,b\r\n3,4\r\n')
+        self.assertEqual(headers['Content-Length'], '10')
+
+    def test_upload_progress(self):
+        conn = swat.CAS.__new__(swat.CAS)
+        conn._sw_connection = get_rest_connection()
+        conn._soptions = ''
+        conn._actionset_classes = {}
+        conn._get_results = lambda items: items[0][0]
+
+        events = []
+        df = pd.DataFrame({'a': np.arange(25) / 3.0, 'b': ['x'] * 25})
+        swat.options.cas.upload.chunk_rows = 10
+        out = conn.upload(df, casout=dict(name='foo'), progress=events.append)
+
+        self.assertEqual([x['stage'] for x in events],
+                         ['encode'] * 4 + ['transfer', 'server', 'total'])
+        self.assertEqual([x['rows'] for x in events[:4]], [0, 10, 10, 5])
+        nbytes = sum(x['bytes'] for x in events[:4])
+        self.assertEqual(events[4]['bytes'], nbytes)
+        self.assertEqual(events[4]['bytes'], out.performance.request_bytes)
+        self.assertEqual(events[4]['wire_bytes'], nbytes)
+        self.assertTrue(events[4]['seconds'] >= 0)
+        self.assertEqual(events[5]['seconds'], None)
+        self.assertEqual(events[6]['rows'], 25)
+        self.assertEqual(events[6]['bytes'], nbytes)
+        self.assertTrue(events[6]['rows_per_second'] > 0)
+
+        swat.options.log.level = 'info'
+        with self.assertLogs('swat.logging', level='INFO') as logs:
+            for item in events:
+                swat.logging.log_progress(item)
+        self.assertEqual(len(logs.output), 7)
+        self.assertTrue('upload total: bytes=%d' % nbytes in logs.output[-1])
+
+    def test_parquet(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need pyarrow installed')
+
+        from swat.cas.connection import _to_parquet
+
+        df = pd.DataFrame({'a': np.arange(5, dtype='int32'),
+                           'b': np.arange(5) / 2.0,
+                           'c': pd.date_range('2000-01-01', periods=5, freq='ms'),
+                           'd': list('abcde')}, index=list('vwxyz'))
+
+        out = pq.read_table(pa.BufferReader(_to_parquet(df))).to_pandas()
+        self.assertEqual(out.columns.tolist(), ['a', 'b', 'c', 'd'])
+        self.assertEqual(str(out['a'].dtype), 'int32')
+        self.assertEqual(out['c'].tolist(), df['c'].tolist())
+
+        with self.assertRaises(SWATError):
+            swat.options.cas.upload.format = 'xml'
+
+    def test_parquet_fallback(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need pyarrow installed')
+
+        calls = []
+
+        status = ['File type is not supported']
+
+        class Results(object):
+            def __init__(self, severity):
+                self.severity = severity
+                self.status = status[0]
+                self.messages = ['ERROR: Could not load tmp1234.parquet.']
+
+        def upload(data, importoptions=None, casout=None, **kwargs):
+            calls.append((kwargs.get('parquet') is not None, importoptions, casout))
+            if status[0] == 'raise':
+                raise SWATError('Connection reset')
+            return Results(2 if kwargs.get('parquet') is not None else 0)
+
+        conn = swat.CAS.__new__(swat.CAS)
+        conn._upload = upload
+        df = pd.DataFrame({'a': [1, 2, 3]})
+
+        conn.upload(df, casout=dict(name='foo'))
+        self.assertEqual([x[0] for x in calls], [False])
+
+        swat.options.cas.upload.format = 'parquet'
+        with self.assertWarns(RuntimeWarning):
+            out = conn.upload(df, casout=dict(name='foo'))
+        self.assertEqual(out.severity, 0)
+        self.assertEqual([x[0] for x in calls], [False, True, False])
+        self.assertEqual(calls[-1][1:], ({}, dict(name='foo')))
+
+        # Other errors are returned without uploading CSV
+        del calls[:]
+        status[0] = 'The table FOO already exists'
+        out = conn.upload(df, casout=dict(name='foo'))
+        self.assertEqual(out.severity, 2)
+        self.assertEqual([x[0] for x in calls], [True])
+
+        del calls[:]
+        status[0] = 'raise'
+        with self.assertRaises(SWATError):
+            conn.upload(df, casout=dict(name='foo'))
+        self.assertEqual([x[0] for x in calls], [True])
+
+        # An explicit file type disables Parquet
+        del calls[:]
+        status[0] = 'File type is not supported'
+        conn.upload(df, importoptions=dict(filetype='csv'))
+        self.assertEqual([x[0] for x in calls], [False])
+
+    def get_parallel_connection(self, fail=False):
+        conn = swat.CAS.__new__(swat.CAS)
+        conn.uploads = []
+        conn.dropped = []
+        conn.terminated = []
+
+        class Results(dict):
+            severity = 0
+            status = None
+
+        def upload(data, importoptions=None, casout=None, **kwargs):
+            conn.uploads.append((data['a'].tolist(), casout))
+            out = Results()
+            if fail and data['a'].iloc[0] >= 5:
+                out.severity = 2
+                out.status = 'Upload failed'
+            return out
+
+        def retrieve(_name_, **kwargs):
+            if _name_ == 'sessionprop.getsessopt':
+                return dict(caslib='CASUSER')
+            conn.dropped.append((kwargs['name'], kwargs['caslib']))
+
+        def fork(num):
+            return [conn] + [type('Fork', (object,), dict(
+                upload=staticmethod(upload),
+                terminate=lambda self, i=i: conn.terminated.append(i)))()
+                for i in range(1, num)]
+
+        conn.upload = upload
+        conn.retrieve = retrieve
+        conn.fork = fork
+        return conn
+
+    def test_upload_frame_parallel(self):
+        from unittest import mock
+
+        conn = self.get_parallel_connection()
+        df = pd.DataFrame({'a': np.arange(10)})
+
+        def concat(tables, casout=None):
+            return [x.params['name'] for x in tables], casout
+
+        with mock.patch('swat.cas.table.concat', new=concat):
+            names, casout = conn.upload_frame(df, casout=dict(name='out', replace=True),
+                                              parallel=3, chunk_rows=3)
+
+        self.assertEqual(casout, dict(name='out', replace=True))
+        self.assertEqual(sorted(x[0] for x in conn.uploads),
+                         [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]])
+        self.assertEqual([x[1]['name'] for x in sorted(conn.uploads)], names)
+        self.assertTrue(all(x[1]['promote'] for x in conn.uploads))
+        self.assertTrue(all(x[1]['caslib'] == 'CASUSER' for x in conn.uploads))
+        self.assertEqual(sorted(conn.terminated), [1, 2])
+        self.assertEqual(conn.dropped, [(x, 'CASUSER') for x in names])
+
+    def test_upload_frame_parallel_error(self):
+        conn = self.get_parallel_connection(fail=True)
+        df = pd.DataFrame({'a': np.arange(10)})
+
+        with self.assertRaises(SWATError):
+            conn.upload_frame(df, casout=dict(name='out', caslib='public'),
+                              parallel=2)
+
+        # All temporary tables are dropped, including ones that were not created
+        self.assertEqual(len(conn.dropped), 2)
+        self.assertEqual(set(x[1] for x in conn.dropped), set(['public']))
+        self.assertEqual(conn.terminated, [1])
+
+
+class TestRESTCompression(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def test_rest_compression(self):
+        import gzip
+        import zlib
+
+        conn = get_rest_connection()
+        swat.options.cas.http.compression = 'gzip'
+
+        data = b'a,b\r\n' + b'1,2\r\n' * 1000
+        out = conn.upload(lambda: iter([data[:100], data[100:]]), dict(casout='foo'))
+        url, body, headers = conn._req_sess.requests[-1]
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(body), data)
+        self.assertEqual(out.getRequestBytes(), len(data))
+        self.assertEqual(out.getRequestWireBytes(), len(body))
+        self.assertTrue(len(body) < len(data) / 10)
+
+        # Small action parameters are sent as is
+        swat.options.cas.http.compression = 'deflate'
+        conn.invoke('builtins.echo', dict(a=1))
+        url, body, headers = conn._req_sess.requests[-1]
+        self.assertTrue('Content-Encoding' not in headers)
+        self.assertEqual(conn._results['metrics']['requestBytes'], len(body))
+
+        code = 'data foo; set bar; x = 1; run;' * 1000
+        conn.invoke('datastep.runcode', dict(code=code))
+        url, body, headers = conn._req_sess.requests[-1]
+        self.assertEqual(headers['Content-Encoding'], 'deflate')
+        self.assertEqual(headers['Content-Length'], str(len(body)))
+        self.assertTrue(code in zlib.decompress(body).decode('utf-8'))
+
+        metrics = conn.receive().toResponse(conn)._metrics
+        self.assertEqual(metrics['request_wire_bytes'], len(body))
+        self.assertTrue(metrics['request_bytes'] > len(code))
+
+
+class TestJSONCodec(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def test_json_codec(self):
+        import json
+        from swat.cas.rest.codec import load_codec
+
+        codec = load_codec('json')
+        self.assertEqual(codec.loads(b'{"a": [1, NaN, "x\ty"]}')['a'][2], 'x\ty')
+        self.assertEqual(codec.dumps({'a': u'\xe9'}, ensure_ascii=True),
+                         '{"a": "\\u00e9"}')
+
+        for name in ['orjson', 'simdjson', 'ujson']:
+            try:
+                codec = load_codec(name)
+            except ImportError:
+                continue
+
+            # Unsupported values fall back to the json package
+            text = b'{"a": [1, 2.5, NaN, "x\ty", 123456789012345678901234567890]}'
+            out = codec.loads(text)
+            self.assertEqual(out['a'][:2], [1, 2.5])
+            self.assertTrue(np.isnan(out['a'][2]))
+            self.assertEqual(out['a'][3:], ['x\ty', 123456789012345678901234567890])
+
+            obj = {'a': [1, 2.5, u'\xe9']}
+            self.assertEqual(json.loads(codec.dumps(obj)), obj)
+            self.assertTrue(codec.dumps(obj, ensure_ascii=True).isascii())
+
+            # NaN and infinity are encoded as the server expects
+            self.assertEqual(codec.dumps({'a': float('nan'), 'b': float('inf')}),
+                             '{"a": NaN, "b": Infinity}')
+
+        conn = get_rest_connection()
+        conn.invoke('builtins.echo', dict(a=float('nan')))
+        conn
+        self.assertEqual(conn._req_sess.requests[-1][1], b'{"a": NaN}')
+
+        conn.invoke('builtins.echo', dict(a=1, b=u'\xe9', c=[1.5, 'x']))
+        conn
+        url, body, headers = conn._req_sess.requests[-1]
+        self.assertEqual(json.loads(body.decode('utf-8')),
+                         dict(a=1, b=u'\xe9', c=[1.5, 'x']))
+        self.assertEqual(conn._results['results'], dict(x=1))
+
+        conn.upload(lambda: iter([b'a\r\n']), dict(casout=dict(name=u'\xe9')))
+        url, body, headers = conn._req_sess.requests[-1]
+        self.assertEqual(json.loads(headers['JSON-Parameters']),
+                         dict(casout=dict(name=u'\xe9')))
+        self.assertTrue(headers['JSON-Parameters'].isascii())
+
+        with self.assertRaises(swat.SWATOptionError):
+            swat.options.cas.http.json_codec = 'foo'
+
+
+class TestAsyncConnection(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def test_async_invoke(self):
+        try:
+            import aiohttp
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need aiohttp installed')
+
+        import asyncio
+        import json
+        from swat.cas.rest.aio import REST_CASAsyncConnection
+
+        class Response(object):
+
+            status = 200
+            content_length = None
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+            async def read(self):
+                return b'{"disposition": {"severity": 0}, "results": {"x": 1}}'
+
+        class HTTP(object):
+
+            closed = False
+
+            def __init__(self):
+                self.requests = []
+
+            def post(self, url, data=None, headers=None):
+                self.requests.append((url, data, headers))
+                return Response()
+
+            async def close(self):
+                self.closed = True
+
+        http = HTTP()
+        conn = REST_CASAsyncConnection.__new__(REST_CASAsyncConnection)
+        conn._req_sess = get_rest_connection()._req_sess
+        conn._req_sess.headers['Authorization'] = b'Bearer abc'
+        conn._current_baseurl = 'http://localhost:8777/'
+        conn._session = 'abc'
+        conn._aiohttp = aiohttp
+        conn._http = http
+        conn._pending = None
+        conn._executor = None
+
+        asyncio.run(conn.ainvoke('builtins.echo', dict(a=1)))
+
+        url, body, headers = http.requests[-1]
+        self.assertTrue(url.endswith('cas/sessions/abc/actions/builtins.echo'))
+        self.assertEqual(json.loads(body.decode('utf-8')), dict(a=1))
+        self.assertEqual(headers['Authorization'], 'Bearer abc')
+        self.assertTrue('Content-Length' not in headers)
+
+        response = conn.receive().toResponse(conn)
+        self.assertEqual(response._metrics['response_bytes'], 53)
+
+        asyncio.run(conn.aclose())
+        self.assertTrue(http.closed)
+
+    def test_async_blocking_methods(self):
+        import asyncio
+        from swat.cas import aio
+
+        conn = aio.CAS.__new__(aio.CAS)
+        conn._sw_connection = get_rest_connection()
+        conn._protocol = 'http'
+
+        # Methods that would block on action results raise errors
+        with self.assertRaises(swat.SWATError):
+            with conn:
+                pass
+        with self.assertRaises(swat.SWATError):
+            conn.__exit__(None, None, None)
+        with self.assertRaises(swat.SWATError):
+            conn.close(close_session=True)
+        with self.assertRaises(swat.SWATError):
+            conn.terminate()
+        with self.assertRaises(swat.SWATError):
+            with conn.session_context(locale='fr'):
+                pass
+        with self.assertRaises(swat.SWATError):
+            conn.upload('cars.csv')
+        with self.assertRaises(swat.SWATError):
+            conn.upload_frame(pd.DataFrame({'x': [1]}))
+        with self.assertRaises(swat.SWATError):
+            conn._upload_frame_parallel(pd.DataFrame({'x': [1]}), 2)
+
+        # Data message handlers are rejected before the action is called
+        with self.assertRaises(swat.SWATError):
+            asyncio.run(conn.retrieve('table.addtable', datamsghandler=object()))
+
+        # aterminate ends the session
+        calls = []
+
+        async def aclose(close_session=False):
+            calls.append(close_session)
+
+        conn.aclose = aclose
+        asyncio.run(conn.aterminate())
+        self.assertEqual(calls, [True])
+
+        # Closing without ending the session does not block
+        conn.close()
+        self.assertTrue(conn._sw_connection._session is None)
+
+    def test_async_create(self):
+        import asyncio
+        import threading
+        from swat.cas import aio
+
+        class AsyncCAS(aio.CAS):
+
+            def __init__(self, *args, **kwargs):
+                self.args = args
+                self.thread = threading.current_thread()
+
+        conn = asyncio.run(AsyncCAS.create('localhost', 8777))
+        self.assertEqual(conn.args, ('localhost', 8777))
+        self.assertFalse(conn.thread is threading.current_thread())
+
+
+class TestRESTGetnext(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def test_getnext_rest(self):
+        import time
+        from swat.cas.connection import getnext
+        from swat.cas.response import CASResponse
+
+        def get_connection(delay):
+            conn = swat.CAS.__new__(swat.CAS)
+            conn._sw_connection = get_rest_connection()
+            post = conn._sw_connection._req_sess.post
+
+            def delayed_post(url, data=None, headers=None, **kwargs):
+                time.sleep(delay)
+                return post(url, data=data, headers=headers, **kwargs)
+
+            conn._sw_connection._req_sess.post = delayed_post
+            return conn
+
+        swat.options.cas.http.concurrent_invoke = True
+        conns = [get_connection(x) for x in [0.4, 0.0, 0.2]]
+        for conn in conns:
+            conn._sw_connection.invoke('builtins.echo', dict(a=1))
+            self.assertTrue(conn._sw_connection.hasPendingResponses())
+
+        # Responses are returned in the order they arrive
+        out = [conn for response, conn in getnext(conns)]
+        self.assertTrue(out[0] is conns[1])
+        self.assertTrue(out[1] is conns[2])
+        self.assertTrue(out[2] is conns[0])
+        self.assertFalse(conns[0]._sw_connection.hasPendingResponses())
+
+        # Wait timeouts return empty responses
+        conns[0]._sw_connection.invoke('builtins.echo', dict(a=1))
+        out = list(getnext(conns[0], timeout=0.05))
+        self.assertEqual(out[0], ([], None))
+        self.assertTrue(out[-1][1] is conns[0])
+        self.assertTrue(isinstance(out[-1][0], CASResponse))
+
+        # Running actions are cancelled on interrupt
+        for conn in conns[:2]:
+            conn._sw_connection.invoke('builtins.echo', dict(a=1))
+        riter = getnext(conns[:2])
+        self.assertTrue(next(riter)[1] is conns[1])
+        with self.assertRaises(KeyboardInterrupt):
+            riter.throw(KeyboardInterrupt)
+        url = conns[0]._sw_connection._req_sess.requests[-1][0]
+        self.assertTrue(url.endswith('cas/sessions/abc/cancel'))
+        self.assertFalse([x for x in conns[1]._sw_connection._req_sess.requests
+                          if x[0].endswith('cancel')])
+
+    def test_close_pending(self):
+        import threading
+        import time
+
+        conn = get_rest_connection()
+        post = conn._req_sess.post
+        started = threading.Event()
+
+        def delayed_post(url, data=None, headers=None, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            return post(url, data=data, headers=headers, **kwargs)
+
+        conn._req_sess.post = delayed_post
+
+        # The running action is cancelled and finished before closing
+        swat.options.cas.http.concurrent_invoke = True
+        conn.invoke('builtins.echo', dict(a=1))
+        started.wait()
+        conn.close()
+        urls = [x[0] for x in conn._req_sess.requests]
+        self.assertTrue(urls[0].endswith('cas/sessions/abc/cancel'))
+        self.assertTrue(urls[1].endswith('cas/sessions/abc/actions/builtins.echo'))
+        self.assertTrue(conn._pending.done())
+        self.assertEqual(conn._session, None)
+
+        # Finalizers do not cancel or wait
+        conn = get_rest_connection()
+        conn._req_sess.post = delayed_post
+        started.clear()
+        conn.invoke('builtins.echo', dict(a=1))
+        started.wait()
+        conn.close(wait=False)
+        self.assertFalse(conn._pending.done())
+        self.assertEqual(conn._req_sess.requests, [])
+        conn._pending.result()
+
+    def test_invoke_sync(self):
+        import threading
+
+        # Requests are sent by invoke unless concurrent_invoke is enabled
+        conn = get_rest_connection()
+        threads = threading.active_count()
+        conn.invoke('builtins.echo', dict(a=1))
+        self.assertFalse(conn.hasPendingResponses())
+        self.assertEqual(conn._executor, None)
+        self.assertEqual(threading.active_count(), threads)
+        self.assertEqual(conn.receive().toResponse(conn).getNextResult().getKey(), 'x')
+
+        def failed_post(url, **kwargs):
+            raise ValueError('bad response')
+
+        conn._req_sess.post = failed_post
+        with self.assertRaises(SWATError):
+            conn.invoke('builtins.echo', dict(a=1))
+
+
+class TestHTTPPool(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def test_http_pool(self):
+        import socket
+        from unittest import mock
+        from swat.cas.rest.connection import (REST_CASConnection, PoolAdapter,
+                                              _socket_options, _timeout)
+
+        self.assertEqual(_timeout(), None)
+        swat.options.cas.http.read_timeout = 30
+        self.assertEqual(_timeout(), (None, 30.0))
+        swat.options.cas.http.connect_timeout = 5
+        self.assertEqual(_timeout(), (5.0, 30.0))
+
+        self.assertEqual(_socket_options(),
+                         [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                          (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        swat.options.cas.http.tcp_nodelay = False
+        swat.options.cas.http.keepalive = False
+        self.assertEqual(_socket_options(), [])
+
+        with self.assertRaises(swat.SWATOptionError):
+            swat.options.cas.http.pool_maxsize = 0
+
+        swat.reset_option()
+        swat.options.cas.http.pool_maxsize = 32
+
+        with mock.patch.object(REST_CASConnection, '_connect'):
+            conn = REST_CASConnection('localhost', 8777, None, 'abc', '', None)
+            for prefix in ['http://', 'https://']:
+                adapter = conn._req_sess.get_adapter(prefix + 'localhost')
+                self.assertTrue(isinstance(adapter, PoolAdapter))
+                self.assertEqual(adapter._pool_maxsize, 32)
+                self.assertEqual(adapter.poolmanager.connection_pool_kw['socket_options'],
+                                 _socket_options())
+
+            # Copies share the connection pools
+            conn2 = conn.copy()
+            self.assertTrue(conn2._adapters is conn._adapters)
+            self.assertTrue(conn2._req_sess.get_adapter('http://localhost')
+                            is conn._req_sess.get_adapter('http://localhost'))
+            conn2.close()
+            self.assertTrue(conn._req_sess.get_adapter('http://localhost')
+                            is conn._adapters['http://'])
+
+            swat.options.cas.http.share_pool = False
+            conn3 = conn.copy()
+            self.assertTrue(conn3._req_sess.get_adapter('http://localhost')
+                            is not conn._req_sess.get_adapter('http://localhost'))
+            conn3.close()
+            conn.close()
+
+        # Request headers do not modify the session headers
+        conn = get_rest_connection()
+        headers = dict(conn._req_sess.headers)
+        swat.options.cas.http.compression = 'deflate'
+        conn.invoke('datastep.runcode', dict(code='x = 1;' * 1000))
+        conn
+        self.assertEqual(conn._req_sess.requests[-1][2]['Content-Encoding'], 'deflate')
+        conn.upload(lambda: iter([b'a\r\n']), dict(casout='foo'))
+        self.assertEqual(conn._req_sess.requests[-1][2]['Content-Type'],
+                         'application/octet-stream')
+        self.assertEqual(dict(conn._req_sess.headers), headers)
+
+
 if __name__ == '__main__':
     tm.runtests()
@@ -33,7 +33,9 @@ import swat.utils.testing as tm
 import sys
 import time
 import unittest
+import warnings
 from swat.cas.datamsghandlers import *  # noqa: F403
+from swat.cas.datamsghandlers import _python2datetime64
 
 # Pick sort keys that will match across SAS and Pandas sorting orders
 SORT_KEYS = ['Origin', 'MSRP', 'Horsepower', 'Model']
@@ -514,5 +516,384 @@ class TestDataMsgHandlers(tm.TestCase):
             pass
 
 
+class RecordingDataBuffer(object):
+    ''' Data buffer that records the values written to it '''
+
+    def __init__(self, *args, **kwargs):
+        self.values = {}
+
+    def getLastErrorMessage(self):
+        return ''
+
+    def _set(self, row, offset, value):
+        self.values[(row, offset)] = value
+
+    setString = setInt32 = setInt64 = setDouble = _set
+
+
+class TestColumnWrites(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def setUp(self):
+        swat.reset_option()
+
+        from unittest import mock
+        self.patches = [mock.patch.object(swat.clib, 'SW_CASError',
+                                          new=RecordingDataBuffer),
+                        mock.patch.object(swat.clib, 'SW_CASDataBuffer',
+                                          new=RecordingDataBuffer)]
+        for item in self.patches:
+            item.start()
+
+    def tearDown(self):
+        for item in self.patches:
+            item.stop()
+        swat.reset_option()
+
+    def assertRecordEqual(self, first, second):
+        if isinstance(second, float) and np.isnan(second):
+            self.assertTrue(np.isnan(first))
+        else:
+            self.assertEqual(first, second)
+            self.assertEqual(type(first), type(second))
+
+    def get_data(self, nrows=25):
+        return pd.DataFrame({
+            'dbl': [x / 4.0 if x % 5 else np.nan for x in range(nrows)],
+            'i32': np.arange(nrows, dtype='int32'),
+            'i64': np.arange(nrows, dtype='int64') * 2**40,
+            'str': ['s%d' % x if x % 7 else None for x in range(nrows)],
+            'dt': pd.date_range('1959-12-31 23:00', periods=nrows, freq='37min'),
+            'tz': pd.date_range('2001-01-01', periods=nrows,
+                                freq='s', tz='US/Eastern'),
+        })
+
+    def write_rows(self, dmh):
+        row = 0
+        while True:
+            values = dmh.getrow(row)
+            if values is None:
+                break
+            dmh.write(row % dmh.nrecs, values)
+            row += 1
+        return row
+
+    def test_writecolumns(self):
+        data = self.get_data()
+
+        rows = PandasDataFrame(data, nrecs=100)  # noqa: F405
+        self.assertEqual(self.write_rows(rows), 25)
+
+        cols = PandasDataFrame(data, nrecs=100)  # noqa: F405
+        self.assertTrue(cols._use_getrows())
+        self.assertEqual(cols._fill_columns(0, cols.nrecs), 25)
+
+        self.assertEqual(len(rows._sw_databuffer.values), 25 * 6)
+        self.assertEqual(len(cols._sw_databuffer.values), 25 * 6)
+        for key, value in rows._sw_databuffer.values.items():
+            self.assertRecordEqual(cols._sw_databuffer.values[key], value)
+
+    def test_writecolumns_chunks(self):
+        data = self.get_data(50)
+        chunks = [data.iloc[i:i + 20] for i in range(0, 50, 20)]
+
+        cols = PandasDataFrame(iter(chunks), nrecs=30)  # noqa: F405
+        self.assertEqual(cols._fill_columns(0, cols.nrecs), 30)
+        self.assertEqual(cols._fill_columns(30, cols.nrecs), 20)
+        self.assertEqual(cols._fill_columns(50, cols.nrecs), 0)
+
+        # The buffer holds rows 0-19 from the second fill
+        rows = PandasDataFrame(data, nrecs=30)  # noqa: F405
+        for i in range(20):
+            rows.write(i, rows.getrow(30 + i))
+        for key, value in rows._sw_databuffer.values.items():
+            self.assertRecordEqual(cols._sw_databuffer.values[key], value)
+
+    def upload(self, dmh):
+        sent = []
+
+        def send(connection, nrecs, buf):
+            values = sorted((key, None if value != value else value)
+                            for key, value in buf.values.items() if key[0] < nrecs)
+            sent.append((id(buf), nrecs, values))
+
+        dmh._send = send
+        dmh.getone = lambda connection: (None, connection)
+        dmh(None, None)
+        return sent
+
+    def test_pipeline(self):
+        data = self.get_data(95)
+
+        expected = self.upload(PandasDataFrame(data, nrecs=20))  # noqa: F405
+        self.assertEqual([x[1] for x in expected], [20, 20, 20, 20, 15, 0])
+        self.assertEqual(len(set(x[0] for x in expected)), 1)
+
+        swat.options.cas.upload.pipeline = True
+        sent = self.upload(PandasDataFrame(data, nrecs=20))  # noqa: F405
+        self.assertEqual([x[1:] for x in sent[:-1]], [x[1:] for x in expected[:-1]])
+
+        # The buffers alternate
+        ids = [x[0] for x in sent[:-1]]
+        self.assertEqual(len(set(ids)), 2)
+        self.assertTrue(all(a != b for a, b in zip(ids, ids[1:])))
+
+        # Handlers that only implement getrow are pipelined too
+        class RowHandler(PandasDataFrame):  # noqa: F405
+
+            def getrow(self, row):
+                return super(RowHandler, self).getrow(row)
+
+        sent = self.upload(RowHandler(data, nrecs=20))
+        self.assertEqual([x[1:] for x in sent[:-1]], [x[1:] for x in expected[:-1]])
+
+    def test_auto_nrecs(self):
+        data = self.get_data()
+
+        dmh = PandasDataFrame(data)  # noqa: F405
+        self.assertTrue(dmh._auto_nrecs)
+        self.assertTrue(dmh._record_bytes() > dmh.reclen)
+        self.assertEqual(dmh.nrecs, 4 * 1024**2 // dmh._record_bytes())
+
+        swat.options.cas.upload.buffer_bytes = 1000
+        dmh = PandasDataFrame(data)  # noqa: F405
+        self.assertEqual(dmh.nrecs, 1000 // dmh._record_bytes())
+
+        swat.options.cas.upload.buffer_bytes = 1
+        self.assertEqual(PandasDataFrame(data).nrecs, 1)  # noqa: F405
+
+        swat.options.cas.upload.buffer_bytes = 0
+        self.assertEqual(PandasDataFrame(data).nrecs, 1000)  # noqa: F405
+
+        dmh = PandasDataFrame(data, nrecs=20)  # noqa: F405
+        self.assertFalse(dmh._auto_nrecs)
+        self.assertEqual(dmh.nrecs, 20)
+
+    def test_adapt_nrecs(self):
+        data = self.get_data()
+
+        dmh = PandasDataFrame(data)  # noqa: F405
+        dmh.nrecs = 100
+        self.assertEqual(dmh._adapt_nrecs(40, 40, 1.25), 32)
+        self.assertEqual(dmh._adapt_nrecs(40, 40, 10.0), 20)
+        self.assertEqual(dmh._adapt_nrecs(40, 40, 0.1), 80)
+        self.assertEqual(dmh._adapt_nrecs(80, 80, 0.1), 100)
+
+        # The last batch is not used
+        self.assertEqual(dmh._adapt_nrecs(40, 25, 10.0), 40)
+
+        swat.options.cas.upload.batch_seconds = 0
+        self.assertEqual(dmh._adapt_nrecs(40, 40, 10.0), 40)
+
+        swat.options.cas.upload.batch_seconds = 1
+        dmh = PandasDataFrame(data, nrecs=100)  # noqa: F405
+        self.assertEqual(dmh._adapt_nrecs(40, 40, 10.0), 40)
+
+    def test_adaptive_upload(self):
+        from unittest import mock
+
+        data = self.get_data(95)
+
+        # Each batch takes two seconds
+        for pipeline, expected in [(False, [20, 10, 5, 2, 1]),
+                                   (True, [20, 20, 10, 10, 5])]:
+            swat.options.cas.upload.pipeline = pipeline
+            dmh = PandasDataFrame(data)  # noqa: F405
+            dmh.nrecs = 20
+            with mock.patch('swat.cas.datamsghandlers.time') as clock:
+                clock.time.side_effect = [2.0 * i for i in range(1000)]
+                sent = self.upload(dmh)
+            self.assertEqual([x[1] for x in sent[:5]], expected)
+            self.assertEqual(sum(x[1] for x in sent), 95)
+
+    def get_cursor(self, nrows=25):
+        import sqlite3
+
+        con = sqlite3.connect(':memory:')
+        self.addCleanup(con.close)
+        cur = con.cursor()
+        cur.execute('CREATE TABLE Data(Num DOUBLE, Str TEXT, Int INTEGER)')
+        cur.executemany('INSERT INTO Data VALUES(?, ?, ?)',
+                        [(x / 4.0 if x % 5 else None, 's%d' % x, x)
+                         for x in range(nrows)])
+        cur.execute('SELECT * FROM Data')
+        return sqlite3, cur
+
+    def test_dbapi_getrows(self):
+        rows = DBAPI(*self.get_cursor(), nrecs=10)  # noqa: F405
+        self.assertTrue(rows._use_getrows())
+        row = 0
+        while True:
+            values = rows.getrow(row)
+            if values is None:
+                break
+            rows.write(row, values)
+            row += 1
+        self.assertEqual(row, 25)
+
+        cols = DBAPI(*self.get_cursor(), nrecs=10)  # noqa: F405
+        self.assertEqual(cols.cursor.arraysize, 10)
+        self.assertEqual(cols._fill_columns(0, 30), 25)
+        self.assertEqual(cols._fill_columns(25, 30), 0)
+
+        self.assertEqual(len(cols._sw_databuffer.values), 25 * 3)
+        for key, value in rows._sw_databuffer.values.items():
+            self.assertRecordEqual(cols._sw_databuffer.values[key], value)
+
+        # Blocks are split at the requested size
+        cols = DBAPI(*self.get_cursor(), nrecs=10)  # noqa: F405
+        self.assertEqual(len(cols.getrows(0, 10)[0]), 10)
+        self.assertEqual(cols.getrows(10, 20)[2], list(range(10, 25)))
+        self.assertEqual(cols.getrows(25, 20), None)
+
+    def test_dbapi_datetime(self):
+        dts = [datetime.datetime(2001, 2, 3, 4, 5, 6, 789), None,
+               datetime.datetime(1950, 1, 1)]
+        out = _python2datetime64(dts)
+        self.assertEqual(out.dtype, np.dtype('M8[us]'))
+        self.assertTrue(pd.isnull(out[1]))
+
+        class Module(object):
+            DATETIME = datetime.datetime
+
+        class Cursor(object):
+            description = [('dt', datetime.datetime)]
+            rows = [[x] for x in dts]
+
+            def fetchmany(self, nrows):
+                out, self.rows = self.rows[:nrows], self.rows[nrows:]
+                return out
+
+        cols = DBAPI(Module, Cursor(), nrecs=10)  # noqa: F405
+        self.assertEqual(cols.getrows(0, 10)[0].dtype, np.dtype('M8[us]'))
+
+        rows = DBAPI(Module, Cursor(), nrecs=10)  # noqa: F405
+        cols = DBAPI(Module, Cursor(), nrecs=10)  # noqa: F405
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            for i, value in enumerate(dts):
+                rows.write(i, [value])
+            self.assertEqual(cols._fill_columns(0, 10), 3)
+        self.assertEqual(rows._sw_databuffer.values, cols._sw_databuffer.values)
+
+        # Timezone-aware values use the transformer
+        dts[0] = dts[0].replace(tzinfo=datetime.timezone.utc)
+        self.assertTrue(_python2datetime64(dts) is dts)  # noqa: F405
+
+    def test_dbapi_arrow(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need pyarrow installed')
+
+        table = pa.table({'Num': [1.5, None, 3.0, 4.0],
+                          'Str': ['a', 'b', None, 'd']})
+
+        class Module(object):
+            pass
+
+        class Cursor(object):
+            description = [('Num', float), ('Str', str)]
+
+            def fetch_record_batch(self):
+                return pa.RecordBatchReader.from_batches(
+                    table.schema, table.to_batches(max_chunksize=3))
+
+        dmh = DBAPI(Module, Cursor(), nrecs=2)  # noqa: F405
+        self.assertEqual(dmh._fill_columns(0, 2), 2)
+        self.assertEqual(dmh._fill_columns(2, 2), 2)
+        self.assertEqual(dmh._fill_columns(4, 2), 0)
+        self.assertEqual(dmh._sw_databuffer.values[(0, 0)], 3.0)
+        self.assertEqual(dmh._sw_databuffer.values[(1, 8)], 'd')
+        self.assertEqual(dmh._sw_databuffer.values[(0, 8)], '')
+
+    def test_image_workers(self):
+        import shutil
+        import tempfile
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        for label in ['cat', 'dog']:
+            os.mkdir(os.path.join(tmpdir, label))
+            for i in range(5):
+                with open(os.path.join(tmpdir, label, '%d.png' % i), 'wb') as out:
+                    out.write(('%s %d' % (label, i)).encode('utf-8') * (i + 1))
+
+        expected = Image(tmpdir)  # noqa: F405
+        expected = [expected.getrow(i) for i in range(11)]
+        self.assertEqual(expected[-1], None)
+        self.assertEqual(len(set(x[0] for x in expected[:-1])), 10)
+
+        for pool in ['thread', 'process']:
+            dmh = Image(tmpdir, workers=2, pool=pool, prefetch=3)  # noqa: F405
+            self.assertEqual(dmh.getrow(0), expected[0])
+            self.assertEqual([x[0] for x in dmh._queue], [1, 2])
+            self.assertEqual([dmh.getrow(i) for i in range(1, 11)], expected[1:])
+            self.assertTrue(dmh._pool is None)
+
+        # Out of order rows discard the queue
+        dmh = Image(tmpdir, workers=2)  # noqa: F405
+        self.assertEqual(dmh.getrow(0), expected[0])
+        self.assertEqual(dmh.getrow(7), expected[7])
+        self.assertEqual([x[0] for x in dmh._queue], [8, 9])
+        dmh._shutdown()
+
+        with self.assertRaises(swat.SWATError):
+            Image(tmpdir, workers=2, pool='fiber')  # noqa: F405
+
+    def test_image_workers_arrays(self):
+        try:
+            import PIL.Image
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need Pillow installed')
+
+        rng = np.random.RandomState(1)
+        arrays = [rng.randint(0, 255, size=(8, 8, 3)).astype('uint8')
+                  for i in range(6)]
+        images = [PIL.Image.fromarray(x) for x in arrays]
+
+        expected = Image(arrays)  # noqa: F405
+        expected = [expected.getrow(i) for i in range(7)]
+
+        for data in [arrays, images]:
+            for pool in ['thread', 'process']:
+                dmh = Image(data, workers=3, pool=pool)  # noqa: F405
+                self.assertEqual([dmh.getrow(i) for i in range(7)], expected)
+
+    def test_progress(self):
+        data = self.get_data(95)
+
+        for pipeline in [False, True]:
+            swat.options.cas.upload.pipeline = pipeline
+            events = []
+            dmh = PandasDataFrame(data, nrecs=20)  # noqa: F405
+            dmh.progress = events.append
+            nbytes = dmh._record_bytes()
+            self.upload(dmh)
+
+            self.assertEqual([x['stage'] for x in events], ['batch'] * 5 + ['total'])
+            self.assertEqual([x['rows'] for x in events[:-1]], [20, 20, 20, 20, 15])
+            self.assertEqual([x['total_rows'] for x in events[:-1]],
+                             [20, 40, 60, 80, 95])
+            self.assertEqual(events[0]['bytes'], 20 * nbytes)
+            self.assertTrue(all(x['fill_seconds'] >= 0 for x in events[:-1]))
+
+            total = events[-1]
+            self.assertEqual(total['batches'], 5)
+            self.assertEqual(total['rows'], 95)
+            self.assertEqual(total['bytes'], 95 * nbytes)
+            self.assertEqual(total['server_seconds'], None)
+
+    def test_getrow_override(self):
+
+        class RowHandler(PandasDataFrame):  # noqa: F405
+
+            def getrow(self, row):
+                return super(RowHandler, self).getrow(row)
+
+        self.assertFalse(RowHandler(self.get_data())._use_getrows())
+
+
 if __name__ == '__main__':
     tm.runtests()
@@ -5013,6 +5013,37 @@ class TestCASTable(tm.TestCase):
         sorttbl = self.table.sort_values(SORT_KEYS).to_frame(maxrows=20)
         self.assertTablesEqual(df, sorttbl)
 
+    def test_to_frame_parallel(self):
+        df = self.get_cars_df().sort_values(SORT_KEYS)
+
+        # Session tables are fetched with one session
+        with self.assertWarns(RuntimeWarning):
+            out = self.table.sort_values(SORT_KEYS).to_frame(parallel=3)
+        self.assertTablesEqual(df, out)
+
+        name = self.table.params['name'] + '_global'
+        self.table.partition(casout=dict(name=name, promote=True))
+        try:
+            tbl = self.s.CASTable(name, caslib=self.table.params.get('caslib'))
+            out = tbl.sort_values(SORT_KEYS).to_frame(parallel=3)
+            self.assertTablesEqual(df, out)
+            self.assertEqual(list(out.index), list(range(len(df))))
+            self.assertEqual(sorted(out.colinfo.keys()), sorted(df.columns))
+
+            # By variables are added to fetchvars, as in a serial fetch
+            gtbl = tbl.sort_values(SORT_KEYS)
+            gtbl.params['groupby'] = ['Origin']
+            self.assertEqual(list(gtbl.to_frame(parallel=3, fetchvars=['MSRP']).columns),
+                             list(gtbl.to_frame(fetchvars=['MSRP']).columns))
+
+            # Failed fetches leave no responses on the table's connection
+            with self.assertRaises(swat.SWATError):
+                tbl.to_frame(parallel=3, fetchvars=['NotAColumn'])
+            self.assertTablesEqual(df, tbl.sort_values(SORT_KEYS).to_frame())
+        finally:
+            self.s.table.droptable(name=name,
+                                   caslib=self.table.params.get('caslib'), quiet=True)
+
     def test_fillna(self):
         df = self.get_cars_df().sort_values(SORT_KEYS)
         sorttbl = self.table.sort_values(SORT_KEYS)
@@ -6163,5 +6194,118 @@ class TestCASTable(tm.TestCase):
         self.assertTablesEqual(head2, head3)
 
 
+class ChunkedTable(swat.CASTable):
+    ''' CASTable that generates rows locally rather than fetching them '''
+
+    def _fetch(self, from_=1, to=None, **kwargs):
+        self.fetches.append((from_, to))
+        if self.fail_at is not None and from_ >= self.fail_at:
+            raise swat.SWATError('fetch failed')
+        return pd.DataFrame({'a': list(range(from_, min(to, self.nrows) + 1))})
+
+
+class TestTableIteration(tm.TestCase):
+
+    # NOTE: These tests do not require a CAS server.
+
+    def setUp(self):
+        swat.reset_option()
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def get_table(self, nrows, fail_at=None):
+        tbl = ChunkedTable('chunks')
+        tbl.fetches = []
+        tbl.nrows = nrows
+        tbl.fail_at = fail_at
+        return tbl
+
+    def test_prefetch(self):
+        tbl = self.get_table(1000)
+        expected = [x[1] for x in tbl.itertuples(chunksize=100)]
+        self.assertEqual(expected, list(range(1, 1001)))
+
+        tbl = self.get_table(1000)
+        out = [x[1] for x in tbl.itertuples(chunksize=100, prefetch=2)]
+        self.assertEqual(out, expected)
+
+        swat.options.cas.dataset.prefetch = 3
+        tbl = self.get_table(1000)
+        out = [x[1]['a'] for x in tbl.iterrows(chunksize=100)]
+        self.assertEqual(out, expected)
+
+    def test_prefetch_close(self):
+        tbl = self.get_table(100000)
+        it = tbl.itertuples(chunksize=10, prefetch=2)
+        self.assertEqual(next(it), (0, 1))
+        it.close()
+
+        # The background thread is stopped after the queue fills
+        nfetches = len(tbl.fetches)
+        self.assertTrue(nfetches <= 4)
+        self.assertEqual(len(tbl.fetches), nfetches)
+
+    def test_prefetch_error(self):
+        tbl = self.get_table(1000, fail_at=500)
+        out = []
+        with self.assertRaises(swat.SWATError):
+            for item in tbl.itertuples(chunksize=100, prefetch=2):
+                out.append(item[1])
+        self.assertTrue(len(out) >= 400)
+
+    def test_chunk_hook(self):
+        tbl = self.get_table(250)
+        stats = []
+        out = [x[1] for x in tbl.itertuples(chunksize=100, chunk_hook=stats.append)]
+        self.assertEqual(out, list(range(1, 251)))
+        self.assertEqual(tbl.fetches, [(1, 100), (101, 200), (201, 300), (301, 400)])
+        self.assertEqual([x['rows'] for x in stats], [100, 100, 50])
+        self.assertEqual([x['chunksize'] for x in stats], [100, 100, 100])
+        self.assertTrue(all(x['bytes'] > 0 for x in stats))
+
+    def test_chunk_rows(self):
+        # Every fetch requests exactly chunksize rows, so no row is fetched twice
+        for chunksize in [1, 7, 100]:
+            tbl = self.get_table(250)
+            chunks = list(tbl._iter_chunks(chunksize))
+            self.assertEqual([len(x) for x in chunks[:-1]],
+                             [chunksize] * (len(chunks) - 1))
+            self.assertTrue(0 < len(chunks[-1]) <= chunksize)
+            self.assertEqual(pd.concat(chunks)['a'].tolist(), list(range(1, 251)))
+            self.assertEqual(set(stop - start + 1 for start, stop in tbl.fetches),
+                             set([chunksize]))
+
+    def test_auto_chunksize(self):
+        # Column widths are not available, so the row size defaults to 8 bytes
+        swat.options.cas.dataset.iter_chunk_bytes = 800
+        swat.options.cas.dataset.iter_chunk_seconds = 0
+        tbl = self.get_table(5000)
+        stats = []
+        out = [x[1] for x in tbl.itertuples(chunksize='auto', chunk_hook=stats.append)]
+        self.assertEqual(out, list(range(1, 5001)))
+        self.assertEqual(stats[0]['rows'], 100)
+
+        # Each row is measured at 8 bytes, so the size stays constant
+        self.assertEqual(set(x['chunksize'] for x in stats), set([100]))
+
+        # Larger budgets grow by at most a factor of two per fetch
+        swat.options.cas.dataset.iter_chunk_bytes = 80000
+        tbl = self.get_table(5000)
+        tbl._estimate_chunksize = lambda budget: 10
+        stats = []
+        out = [x[1] for x in tbl.itertuples(chunksize='auto', chunk_hook=stats.append)]
+        self.assertEqual(out, list(range(1, 5001)))
+        self.assertEqual([x['chunksize'] for x in stats[:4]], [20, 40, 80, 160])
+
+    def test_adapt_chunksize(self):
+        adapt = swat.CASTable._adapt_chunksize
+        self.assertEqual(adapt(100, 100, 1000, 0.1, 1000, 0), 100)
+        self.assertEqual(adapt(100, 100, 1000, 0.1, 1500, 0), 150)
+        self.assertEqual(adapt(100, 100, 1000, 0.1, 100, 0), 50)
+        self.assertEqual(adapt(100, 100, 1000, 2.0, 1000, 1.0), 50)
+        self.assertEqual(adapt(100, 100, 1000, 0.8, 1000, 1.0), 100)
+
+
 if __name__ == '__main__':
     tm.runtests()
@@ -0,0 +1,480 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+# NOTE: These tests do not require a CAS server.  The result tables are
+#       constructed from REST-style table objects.
+
+import copy
+import datetime
+import numpy as np
+import pandas as pd
+import swat
+import swat.utils.testing as tm
+import unittest
+from swat.cas.rest.table import REST_CASTable
+from swat.cas import transformers
+from swat.cas.transformers import ctb2tabular
+from swat.cas.utils import datetime as casdt
+from swat.utils.compat import text_types
+
+TABLE = {
+    'name': 'Fetch',
+    'label': 'Fetch label',
+    'title': 'Fetch title',
+    'attributes': {},
+    'schema': [
+        dict(name='Num', type='double', width=8),
+        dict(name='Date', type='double', width=8, format='DATE9.'),
+        dict(name='DateTime', type='double', width=8, format='DATETIME20.'),
+        dict(name='Time', type='double', width=8, format='TIME8.'),
+        dict(name='Str', type='varchar', width=100),
+        dict(name='Int64', type='int', width=8),
+        dict(name='Int32', type='int32', width=4),
+        dict(name='Arr', type='double', width=8),
+        dict(name='Bin', type='varbinary', width=8),
+    ],
+    'rows': [
+        [1.5, 3653, 315662400.5, 43200.0, 'abc  ', 5, -2147483648,
+         [1.0, 2.0], dict(data='YWJj')],
+        [None, None, None, None, 'x', -9223372036854775808, 3,
+         [3.0, None], dict(data='YQ')],
+        [10.0, 0, 0, 0, '', 10, 20, [5.0, 6.0], dict(data='')],
+    ],
+}
+
+
+class TestTransformers(tm.TestCase):
+
+    def setUp(self):
+        swat.reset_option()
+
+    def tearDown(self):
+        swat.reset_option()
+
+    def get_table(self, obj=TABLE):
+        return REST_CASTable(copy.deepcopy(obj))
+
+    def test_columns(self):
+        cols = self.get_table().toColumns('strict', None, None, None)
+
+        # Array columns are expanded
+        self.assertEqual(len(cols), 10)
+        self.assertEqual(list(cols[0]), [1.5, None, 10.0])
+        self.assertEqual(list(cols[4]), ['abc', 'x', ''])
+        self.assertEqual(list(cols[7]), [1.0, 3.0, 5.0])
+        self.assertEqual(list(cols[8]), [2.0, None, 6.0])
+        self.assertEqual(list(cols[9]), [b'abc', b'a', b''])
+
+        # Rows are the transpose of columns
+        rows = self.get_table().toTuples('strict', None, None, None)
+        self.assertEqual(rows, list(zip(*cols)))
+
+        empty = dict(TABLE, rows=[])
+        self.assertEqual(self.get_table(empty).toColumns('strict', None, None, None),
+                         [[]] * 9)
+        self.assertEqual(self.get_table(empty).toTuples('strict', None, None, None),
+                         [])
+
+    def test_dataframe(self):
+        df = ctb2tabular(self.get_table())
+
+        self.assertTrue(isinstance(df, swat.SASDataFrame))
+        self.assertEqual(df.name, 'Fetch')
+        self.assertEqual(df.label, 'Fetch label')
+        self.assertEqual(df.title, 'Fetch title')
+        self.assertEqual(list(df.columns),
+                         ['Num', 'Date', 'DateTime', 'Time', 'Str', 'Int64',
+                          'Int32', 'Arr1', 'Arr2', 'Bin'])
+        self.assertEqual(sorted(df.colinfo.keys()), sorted(df.columns))
+        self.assertEqual(df.colinfo['Str'].width, 100)
+
+        self.assertEqual(df['Num'].dtype, np.float64)
+        self.assertTrue(np.isnan(df['Num'][1]))
+        self.assertEqual(df['Str'].tolist(), ['abc', 'x', ''])
+        self.assertEqual(df['Arr2'].dtype, np.float64)
+        self.assertEqual(df['Bin'].tolist(), [b'abc', b'a', b''])
+
+        self.assertEqual(df['Date'][0], datetime.date(1970, 1, 1))
+        self.assertEqual(df['DateTime'][0],
+                         pd.Timestamp(datetime.datetime(1970, 1, 1, 12, 0, 0, 500000)))
+        self.assertEqual(df['Time'][0], datetime.time(12, 0))
+        self.assertTrue(pd.isnull(df['Date'][1]))
+        self.assertTrue(pd.isnull(df['DateTime'][1]))
+        self.assertTrue(pd.isnull(df['Time'][1]))
+
+        self.assertTrue(pd.isnull(df['Int64'][1]))
+        self.assertTrue(pd.isnull(df['Int32'][0]))
+        self.assertEqual(df['Int32'][1], 3)
+
+    def test_empty(self):
+        df = ctb2tabular(self.get_table(dict(TABLE, rows=[])))
+        self.assertEqual(len(df), 0)
+        # Array columns can not be detected without data
+        self.assertEqual(len(df.columns), 9)
+        self.assertEqual(df['Num'].dtype, np.float64)
+        self.assertEqual(df['Int32'].dtype, np.int32)
+
+    def test_datetime_arrays(self):
+        sas = np.array([315662400.5, np.nan, -0.5])
+        out = casdt.sas2python_datetime_array(sas)
+        self.assertEqual(out.dtype, np.dtype('M8[us]'))
+        self.assertEqual(list(out[[0, 2]]),
+                         [casdt.sas2python_datetime(x) for x in sas[[0, 2]]])
+        self.assertTrue(pd.isnull(out[1]))
+
+        out = casdt.sas2python_date_array([3653.0, np.nan, -0.5])
+        self.assertEqual(out[0], datetime.date(1970, 1, 1))
+        self.assertTrue(pd.isnull(out[1]))
+        self.assertEqual(out[2], casdt.sas2python_date(-0.5))
+
+        out = casdt.sas2python_time_array([43200.25, np.nan, -1.5])
+        self.assertEqual(out[0], datetime.time(12, 0, 0, 250000))
+        self.assertTrue(pd.isnull(out[1]))
+        self.assertEqual(out[2], casdt.sas2python_time(-1.5))
+
+        missing = np.iinfo(np.int64).min
+        out = casdt.cas2python_datetime_array([315662400000000, missing])
+        self.assertEqual(out[0], datetime.datetime(1970, 1, 1, 12, 0))
+        self.assertTrue(pd.isnull(out[1]))
+
+        out = casdt.cas2python_date_array([3653, np.iinfo(np.int32).min])
+        self.assertEqual(out[0], datetime.date(1970, 1, 1))
+        self.assertTrue(pd.isnull(out[1]))
+
+        out = casdt.cas2python_time_array([43200000000, missing])
+        self.assertEqual(out[0], datetime.time(12, 0))
+        self.assertTrue(pd.isnull(out[1]))
+
+    def test_timezone(self):
+        swat.options.timezone = 'US/Eastern'
+
+        out = casdt.cas2python_datetime_array([315662400000000])
+        self.assertEqual(out[0], casdt.cas2python_datetime(315662400000000))
+        self.assertEqual(casdt.cas2python_time_array([43200000000])[0],
+                         datetime.time(12, 0))
+
+        df = ctb2tabular(self.get_table())
+        self.assertEqual(str(df['DateTime'].dt.tz), 'US/Eastern')
+        self.assertEqual(df['DateTime'][0],
+                         casdt.sas2python_datetime(315662400.5))
+        self.assertEqual(df['Time'][0], datetime.time(12, 0))
+
+    def test_arrow(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need pyarrow installed')
+
+        swat.options.cas.dataset.format = 'arrow'
+        out = ctb2tabular(self.get_table())
+
+        self.assertTrue(isinstance(out, pa.Table))
+        self.assertEqual(out.column_names,
+                         ['Num', 'Date', 'DateTime', 'Time', 'Str', 'Int64',
+                          'Int32', 'Arr1', 'Arr2', 'Bin'])
+        self.assertEqual(out.schema.metadata[b'title'], b'Fetch title')
+
+        field = out.schema.field('Date')
+        self.assertEqual(field.type, pa.date32())
+        self.assertEqual(field.metadata[b'format'], b'DATE9.')
+        self.assertEqual(out.schema.field('Str').type, pa.string())
+        self.assertEqual(out.schema.field('Str').metadata[b'width'], b'100')
+        self.assertEqual(out.schema.field('Time').type, pa.time64('us'))
+        self.assertEqual(out.schema.field('DateTime').type, pa.timestamp('us'))
+        self.assertEqual(out.schema.field('Bin').type, pa.binary())
+
+        data = out.to_pydict()
+        self.assertEqual(data['Num'], [1.5, None, 10.0])
+        self.assertEqual(data['Date'][0], datetime.date(1970, 1, 1))
+        self.assertEqual(data['Time'][0], datetime.time(12, 0))
+        self.assertEqual(data['Str'], ['abc', 'x', ''])
+        self.assertEqual(data['Int64'], [5, None, 10])
+        self.assertEqual(data['Int32'], [None, 3, 20])
+        self.assertEqual(data['Bin'], [b'abc', b'a', b''])
+
+        swat.options.cas.dataset.format = 'dataframe:arrow'
+        df = ctb2tabular(self.get_table())
+        self.assertTrue(isinstance(df['Str'].dtype, pd.ArrowDtype))
+        self.assertEqual(df['Int64'].dtype, pd.ArrowDtype(pa.int64()))
+        self.assertTrue(pd.isnull(df['Int64'][1]))
+
+    def test_int_missing(self):
+        df = ctb2tabular(self.get_table())
+        self.assertEqual(df['Int64'].dtype, np.float64)
+        self.assertEqual(df['Int32'].dtype, np.float64)
+        self.assertEqual(df['Int64'].tolist()[::2], [5, 10])
+
+        # Columns without missing values keep their integer type
+        obj = dict(TABLE, rows=[TABLE['rows'][2]])
+        df = ctb2tabular(self.get_table(obj))
+        self.assertEqual(df['Int64'].dtype, np.int64)
+        self.assertEqual(df['Int32'].dtype, np.int32)
+
+        swat.options.cas.dataset.int_missing = 'nullable'
+        obj = dict(TABLE, rows=copy.deepcopy(TABLE['rows']))
+        obj['rows'][0][5] = 2**62 + 1
+        df = ctb2tabular(self.get_table(obj))
+        self.assertEqual(df['Int64'].dtype, pd.Int64Dtype())
+        self.assertEqual(df['Int32'].dtype, pd.Int32Dtype())
+        self.assertEqual(df['Int64'][0], 2**62 + 1)
+        self.assertTrue(pd.isnull(df['Int64'][1]))
+        self.assertTrue(pd.isnull(df['Int32'][0]))
+        self.assertEqual(df['Int32'][1], 3)
+
+    def test_categorical(self):
+        obj = dict(TABLE, rows=[list(TABLE['rows'][0]) for i in range(10)])
+        obj['rows'][0][4] = 'other'
+
+        df = ctb2tabular(self.get_table(obj))
+        self.assertNotEqual(df['Str'].dtype, 'category')
+
+        swat.options.cas.dataset.categorical_ratio = 0.1
+        df = ctb2tabular(self.get_table(obj))
+        self.assertNotEqual(df['Str'].dtype, 'category')
+
+        swat.options.cas.dataset.categorical_ratio = 0.2
+        swat.options.log.level = 'debug'
+        with self.assertLogs('swat.logging', level='DEBUG') as logs:
+            df = ctb2tabular(self.get_table(obj))
+        self.assertEqual(df['Str'].dtype, 'category')
+        self.assertEqual(df['Str'].tolist(), ['other'] + ['abc'] * 9)
+        self.assertTrue(any('fixed-width' in x for x in logs.output))
+
+        with self.assertRaises(swat.SWATOptionError):
+            swat.options.cas.dataset.categorical_ratio = 2
+
+    def test_lazy(self):
+        swat.options.cas.dataset.lazy = True
+
+        obj = copy.deepcopy(TABLE)
+        obj['schema'].append(dict(name='_Index_', type='int', width=8))
+        for i, row in enumerate(obj['rows']):
+            row.append(i + 1)
+
+        out = ctb2tabular(self.get_table(obj))
+        self.assertTrue(isinstance(out, swat.LazySASDataFrame))
+        self.assertFalse(out.is_materialized)
+        self.assertEqual(out.title, 'Fetch title')
+        self.assertEqual(out.colinfo['Str'].width, 100)
+        self.assertEqual(out.shape, (3, 10))
+        self.assertEqual(list(out.index), [0, 1, 2])
+        self.assertEqual(out._data['Date'][0], 3653)
+
+        # Only the accessed column is converted
+        self.assertEqual(out['Date'][0], datetime.date(1970, 1, 1))
+        self.assertTrue(pd.isnull(out['Int32'][0]))
+        self.assertTrue('Date' not in out._converters)
+        self.assertTrue('DateTime' in out._converters)
+
+        sub = out[['Num', 'Time']]
+        self.assertTrue(isinstance(sub, swat.SASDataFrame))
+        self.assertEqual(sub['Time'][0], datetime.time(12, 0))
+        self.assertEqual(sub.colinfo['Time'].format, 'TIME8.')
+
+        # Concatenation does not convert the data
+        both = swat.concat([out, ctb2tabular(self.get_table(obj))])
+        self.assertTrue(isinstance(both, swat.LazySASDataFrame))
+        self.assertEqual(list(both.index), [0, 1, 2, 0, 1, 2])
+        self.assertTrue('DateTime' in both._converters)
+        self.assertEqual(both['Date'].tolist()[::3], [datetime.date(1970, 1, 1)] * 2)
+
+        # The index of fetched tables is set without converting the data
+        def fetch_block(start):
+            data = {'_Index_': np.arange(start, start + 2),
+                    'Date': np.array([3653.0, 3654.0])}
+            return swat.LazySASDataFrame(
+                data, converters={'Date': casdt.sas2python_date_array})
+
+        fetched = swat.CASTable._fetch_results_to_frame(
+            {'Fetch1': fetch_block(3), 'Fetch': fetch_block(1)})
+        self.assertTrue(isinstance(fetched, swat.LazySASDataFrame))
+        self.assertFalse(fetched.is_materialized)
+        self.assertEqual(list(fetched.columns), ['Date'])
+        self.assertEqual(list(fetched.index), [0, 1, 2, 3])
+        self.assertEqual(fetched['Date'][3], datetime.date(1970, 1, 2))
+        self.assertEqual(fetched.index.name, None)
+
+        out2 = ctb2tabular(self.get_table(obj))
+        out2['Num'] = out2['Num'] * 2
+        self.assertEqual(out2['Num'].tolist()[::2], [3.0, 20.0])
+
+        # Boolean masks and slices use the fully converted DataFrame
+        out3 = ctb2tabular(self.get_table(obj))
+        masked = out3[out3['Num'] > 5]
+        self.assertTrue(isinstance(masked, swat.SASDataFrame))
+        self.assertEqual(masked['Num'].tolist(), [10.0])
+        self.assertEqual(len(out3[1:]), 2)
+        self.assertTrue(out3.is_materialized)
+        with self.assertRaises(KeyError):
+            out3[['Num', 'Missing']]
+
+        # Other attributes use the fully converted DataFrame
+        swat.options.cas.dataset.lazy = False
+        expected = ctb2tabular(self.get_table(obj))
+        self.assertEqual(out.dtypes.to_dict(), expected.dtypes.to_dict())
+        pd.testing.assert_frame_equal(pd.DataFrame(out.to_frame()),
+                                      pd.DataFrame(expected))
+        self.assertTrue(out.is_materialized)
+
+    def test_plan_cache(self):
+        df1 = ctb2tabular(self.get_table())
+        self.assertEqual(len(transformers._plan_cache), 1)
+
+        # Tables with the same schema use the same plan
+        df2 = ctb2tabular(self.get_table())
+        self.assertEqual(len(transformers._plan_cache), 1)
+        self.assertTrue(df1.colinfo['Str'] is not df2.colinfo['Str'])
+
+        # Column metadata is not shared between results
+        df1.colinfo['Str'].label = 'Changed'
+        df1.colinfo['Str'].attrs['x'] = 1
+        df4 = ctb2tabular(self.get_table())
+        self.assertEqual(df4.colinfo['Str'].label, None)
+        self.assertEqual(df4.colinfo['Str'].attrs, {})
+
+        obj = copy.deepcopy(TABLE)
+        obj['schema'][0]['format'] = 'DATE9.'
+        df3 = ctb2tabular(self.get_table(obj))
+        self.assertEqual(len(transformers._plan_cache), 2)
+        self.assertEqual(df3['Num'][0], datetime.date(1960, 1, 2))
+
+        # Setting an option clears the cache
+        swat.options.cas.dataset.date_formats = ['MMDDYY']
+        self.assertEqual(len(transformers._plan_cache), 0)
+        df3 = ctb2tabular(self.get_table(obj))
+        self.assertEqual(df3['Num'][0], 1.5)
+        self.assertTrue(isinstance(df3['Date'][0], float))
+
+        # Column attributes are only read when a plan is built
+        calls = []
+        attrs_fromtable = transformers.SASColumnSpec.attrs_fromtable
+
+        def count_attrs(_sw_table, col):
+            calls.append(col)
+            return attrs_fromtable(_sw_table, col)
+
+        transformers.SASColumnSpec.attrs_fromtable = staticmethod(count_attrs)
+        try:
+            ctb2tabular(self.get_table(obj))
+            self.assertEqual(calls, [])
+        finally:
+            transformers.SASColumnSpec.attrs_fromtable = staticmethod(attrs_fromtable)
+
+        # Labels are part of the schema
+        obj2 = copy.deepcopy(obj)
+        obj2['schema'][0]['label'] = 'Number'
+        df5 = ctb2tabular(self.get_table(obj2))
+        self.assertEqual(df5.colinfo['Num'].label, 'Number')
+        self.assertEqual(len(transformers._plan_cache), 2)
+
+        # The cache can be used from multiple threads
+        from concurrent.futures import ThreadPoolExecutor
+        swat.options.cas.dataset.plan_cache_size = 2
+        tables = [obj, obj2, TABLE] * 20
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            out = list(pool.map(lambda x: ctb2tabular(self.get_table(x)), tables))
+        self.assertEqual(len(out), 60)
+        self.assertEqual(len(transformers._plan_cache), 2)
+
+        swat.options.cas.dataset.plan_cache_size = 1
+        ctb2tabular(self.get_table())
+        ctb2tabular(self.get_table(obj))
+        self.assertEqual(len(transformers._plan_cache), 1)
+
+        swat.options.cas.dataset.plan_cache_size = 0
+        ctb2tabular(self.get_table())
+        self.assertEqual(len(transformers._plan_cache), 0)
+
+    def test_streamed(self):
+        try:
+            import ijson  # noqa: F401
+        except ImportError:
+            tm.TestCase.skipTest(self, 'Need ijson installed')
+
+        import io
+        import json
+        from swat.cas.rest.connection import _load_stream, _ResponseReader
+
+        obj = dict(TABLE, _ctb=True)
+        body = json.dumps(dict(disposition=dict(severity=0),
+                               results=dict(Fetch=obj, Other=dict(rows=[[1, 2]]))))
+        out = _load_stream(io.BytesIO(body.encode('utf-8')))
+
+        # Rows of tables are stored by column
+        self.assertTrue('rows' not in out['results']['Fetch'])
+        self.assertEqual(len(out['results']['Fetch']['columns']), 9)
+        self.assertEqual(out['results']['Fetch']['columns'][5].tolist(),
+                         [5, -9223372036854775808, 10])
+        self.assertEqual(out['results']['Fetch']['columns'][5].dtype, np.int64)
+        self.assertEqual(out['results']['Fetch']['columns'][6].dtype, np.int32)
+        self.assertEqual(out['results']['Other'], dict(rows=[[1, 2]]))
+        self.assertEqual(out['disposition'], dict(severity=0))
+
+        streamed = REST_CASTable(out['results']['Fetch'])
+        table = self.get_table()
+        self.assertEqual(streamed.getNRows(), 3)
+        self.assertEqual(streamed.getColumnType(7), 'double-array')
+        self.assertEqual(streamed.getColumnArrayNItems(7), 2)
+        self.assertEqual(streamed.toTuples('strict', None, None, None),
+                         table.toTuples('strict', None, None, None))
+        pd.testing.assert_frame_equal(
+            ctb2tabular(REST_CASTable(out['results']['Fetch'])),
+            ctb2tabular(self.get_table()))
+
+        # The int64 missing value is parsed in any chunking of the body
+        class ChunkReader(object):
+
+            def __init__(self, data, size):
+                self._fp = io.BytesIO(data)
+                self._size = size
+
+            def read(self, size=-1):
+                return self._fp.read(self._size if size else 0)
+
+        body = json.dumps(dict(rows=obj, items=[-9223372036854775808],
+                               text='a, -9223372036854775808]'))
+        for size in [1, 3, 7, 1024]:
+            chunked = _load_stream(ChunkReader(body.encode('utf-8'), size))
+            self.assertEqual(chunked['items'], [-9223372036854775808])
+            self.assertTrue(isinstance(chunked['items'][0], int))
+            self.assertEqual(chunked['text'], 'a, -9223372036854775808]')
+            self.assertEqual(chunked['rows']['columns'][5].tolist(),
+                             [5, -9223372036854775808, 10])
+
+        # Checking the type of the body does not consume a chunk
+        class Response(object):
+
+            def iter_content(self, chunk_size=None):
+                return iter([b'{"a": ', b'[1, 2]}'])
+
+        self.assertEqual(_load_stream(_ResponseReader(Response())), dict(a=[1, 2]))
+
+        empty = _load_stream(io.BytesIO(json.dumps(dict(obj, rows=[])).encode('utf-8')))
+        self.assertEqual(REST_CASTable(empty).getNRows(), 0)
+        self.assertEqual(len(ctb2tabular(REST_CASTable(empty))), 0)
+
+    def test_tuples(self):
+        swat.options.cas.dataset.format = 'tuple'
+        out = ctb2tabular(self.get_table())
+        self.assertEqual(len(out), 3)
+        self.assertEqual(out[0][:5], (1.5, 3653, 315662400.5, 43200.0, 'abc'))
+        self.assertTrue(isinstance(out[0][4], text_types))
+
+
+if __name__ == '__main__':
+    tm.runtests()
@@ -22,7 +22,8 @@ import unittest
 from swat.utils.compat import text_types
 from swat.config import (get_option, set_option, reset_option, describe_option, options,
                          get_suboptions, SWATOptionError, get_default,
-                         check_int, check_float, check_string, check_url, check_boolean)
+                         check_int, check_float, check_string, check_url, check_boolean,
+                         option_context)
 from swat.utils.config import subscribe, _subscribers, unsubscribe
 
 
@@ -258,10 +259,10 @@ class TestConfig(tm.TestCase):
                          ['allow_basic_auth', 'authcode', 'client_id', 'client_secret',
                           'connection_retries', 'connection_retry_interval',
                           'dataset', 'debug', 'exception_on_severity',
-                          'hostname', 'missing',
+                          'hostname', 'http', 'missing',
                           'pkce', 'port', 'print_messages', 'protocol',
                           'reflection_levels', 'ssl_ca_list', 'token',
-                          'trace_actions', 'trace_ui_actions', 'username'])
+                          'trace_actions', 'trace_ui_actions', 'upload', 'username'])
 
         with self.assertRaises(SWATOptionError):
             get_suboptions('cas.foo')
@@ -280,6 +281,17 @@ class TestConfig(tm.TestCase):
         with self.assertRaises(SWATOptionError):
             get_default('cas')
 
+    def test_option_context(self):
+        with option_context('cas.print_messages', False):
+            self.assertEqual(get_option('cas.print_messages'), False)
+        self.assertEqual(get_option('cas.print_messages'), True)
+
+        # Options are restored when the block raises an exception
+        with self.assertRaises(ValueError):
+            with option_context('cas.print_messages', False):
+                raise ValueError('error')
+        self.assertEqual(get_option('cas.print_messages'), True)
+
     def test_check_int(self):
         self.assertEqual(check_int(10), 10)
         self.assertEqual(check_int(999999999999), 999999999999)
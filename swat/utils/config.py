@@ -177,11 +177,13 @@ def option_context(*args, **kwargs):
         set_option(key, value)
 
     # Yield control
-    yield
+    try:
+        yield
 
     # Set old state back
-    for key, value in six.iteritems(oldstate):
-        set_option(key, value)
+    finally:
+        for key, value in six.iteritems(oldstate):
+            set_option(key, value)
 
 
 def _get_option_leaf_node(key):